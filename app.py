@@ -1,6 +1,13 @@
+import os
+
 import streamlit as st
 from src.processing.simple_process import simple_process
 from src.processing.complete_process import complete_process
+from src.processing.discovery import discover_simulations, list_subdirectories, resolve_within
+from src.processing.training_logs import (
+    TRAINING_LOGS_DIR, TRAINING_METRICS, load_training_logs, smooth_training_logs, training_directories
+)
+from src.visualization.training.training_curves import plot_training_curves
 
 
 # Constantes e Variaveis Globais
@@ -8,6 +15,12 @@ _VALID_FILES = ['droneCollisionData.csv', 'generalDroneData.csv', 'generalSimula
 _ERROR_INVALID_FILES = "Arquivos invalidos, verifique se os nomes dos arquivos estão corretos"
 _INFO_FILL_SIMULATION = "Preencha todas as informações das Simulaçoes"
 _SUCCESS_MESSAGE = "Graficos gerados com sucesso!"
+# Variavel de ambiente com o diretorio de resultados no servidor. Apenas ele (e seus
+# subdiretorios) pode ser lido pelo dashboard; o caminho nao e editavel na interface
+_RESULTS_ROOT_ENV = "FLUTESIM_RESULTS_ROOT"
+_ROOT_OPTION = "(raiz)"
+# Variavel de ambiente com o diretorio dos logs de treinamento (padrao: dados do repositorio)
+_TRAINING_ROOT_ENV = "FLUTESIM_TRAINING_ROOT"
 
 
 def configure_page():
@@ -27,6 +40,36 @@ def configure_page():
     """)
 
 
+def server_simulations():
+    """
+    Seleciona as simulaçoes do diretorio de resultados configurado no servidor.
+    Os arquivos sao lidos do disco apenas quando uma analise precisa deles.
+    """
+    root = os.environ.get(_RESULTS_ROOT_ENV)
+    if not root:
+        st.info(f"Diretorio de resultados nao configurado no servidor ({_RESULTS_ROOT_ENV}).")
+        return []
+
+    try:
+        subdirectory = st.selectbox(
+            "Diretorio de resultados",
+            [_ROOT_OPTION] + list_subdirectories(root),
+            help="Cada subdiretorio com os arquivos CSV é uma simulação"
+        )
+        directory = resolve_within(root, "." if subdirectory == _ROOT_OPTION else subdirectory)
+        found = discover_simulations(directory, file_names=_VALID_FILES)
+    except (OSError, ValueError) as e:
+        st.error(f"Não foi possivel ler o diretorio: {e}")
+        return []
+
+    if not found:
+        st.warning("Nenhuma simulação com arquivos validos foi encontrada.")
+        return []
+
+    names = st.multiselect("Simulações", list(found), default=list(found))
+    return [{'name': name, 'files': found[name]} for name in names]
+
+
 def sidebar_menu():
     with st.sidebar:
         st.header("Upload dos arquivos CSV 📂")
@@ -38,7 +81,7 @@ def sidebar_menu():
         """)
         option = st.selectbox(
             "Que tipo de analise você deseja?",
-            ("Simples", "Completa"),
+            ("Simples", "Completa", "Treinamento"),
             index=None,
             placeholder="Selecione o método...",
         )
@@ -52,6 +95,16 @@ def sidebar_menu():
 
         elif option == "Completa":
             # Configuraçoes para a analise completa
+            st.number_input(
+                "Processos paralelos", min_value=1, max_value=os.cpu_count() or 1,
+                value=os.cpu_count() or 1, step=1, key="max_workers",
+                help="Numero de processos usados no calculo das metricas"
+            )
+            source = st.radio("Origem dos dados", ("Upload", "Diretorio no servidor"), horizontal=True)
+
+            if source == "Diretorio no servidor":
+                return option, None, server_simulations()
+
             qtd_exec = st.number_input(
                 "Quantidade de Simulações", min_value=2, max_value=50, step=1
             )
@@ -70,6 +123,22 @@ def sidebar_menu():
                 list_simulation.append({'name': name, 'files': files})
             return option, None, list_simulation
 
+        elif option == "Treinamento":
+            # Apenas subdiretorios da raiz configurada; os demais filtros dependem dos
+            # logs encontrados (ver training_page)
+            root = os.environ.get(_TRAINING_ROOT_ENV, TRAINING_LOGS_DIR)
+            try:
+                directories = training_directories(root)
+            except OSError as e:
+                st.error(f"Não foi possivel ler o diretorio de treinamento: {e}")
+                directories = []
+            st.selectbox(
+                "Logs de treinamento", directories, key="training_dir",
+                format_func=lambda directory: _ROOT_OPTION if directory == "." else directory,
+                help="Um subdiretorio por metrica (rewards, entropy, policy_loss, episodes) com um CSV por execução"
+            )
+            return option, None, None
+
     # Retorno padrão caso nada seja selecionado
     return option, None, None
 
@@ -94,15 +163,55 @@ def process_simple_simulation(uploaded_files):
         st.error(f"Ocorreu um erro ao processar os arquivos: {e}")
 
 
-def process_complete_simulation(list_simulation):
+def process_complete_simulation(list_simulation, max_workers=None):
     try:
         with st.spinner('Processando arquivos e gerando graficos...'):
-            complete_process(list_simulation)
+            complete_process(list_simulation, max_workers=max_workers)
         st.success(_SUCCESS_MESSAGE)
     except Exception as e:
         st.error(f"Ocorreu um erro ao processar as simulaçoes: {e}")
 
 
+def training_page(directory):
+    """
+    Exibe as curvas de treinamento (escalares exportados do TensorBoard).
+    Os logs sao lidos uma vez e os filtros so recalculam a suavizaçao e o grafico.
+
+    Args:
+        directory (str): Diretorio escolhido, relativo a raiz dos logs de treinamento.
+    """
+    if directory is None:
+        st.info("Nenhum log de treinamento encontrado no servidor.", icon="ℹ️")
+        return
+
+    try:
+        root = os.environ.get(_TRAINING_ROOT_ENV, TRAINING_LOGS_DIR)
+        df = load_training_logs(resolve_within(root, directory))
+    except (OSError, ValueError) as e:
+        st.error(f"Não foi possivel ler os logs de treinamento: {e}")
+        return
+
+    metrics = [metric for metric in TRAINING_METRICS if (df['metric'] == metric).any()]
+    runs = list(df['run'].cat.categories)
+
+    with st.sidebar:
+        metric = st.selectbox("Metrica", metrics, format_func=TRAINING_METRICS.get)
+        selected_runs = st.multiselect("Execuções", runs, default=runs)
+        smoothing = st.slider("Suavização", min_value=0.0, max_value=0.99, value=0.6, step=0.01)
+        min_step = st.number_input("Passo inicial", min_value=0, value=0, step=100_000)
+        show_band = st.checkbox("Exibir faixa de minimo e maximo", value=True)
+
+    selected = df[(df['metric'] == metric) & df['run'].isin(selected_runs) & (df['step'] >= min_step)]
+    if selected.empty:
+        st.info("Nenhum dado para os filtros selecionados.", icon="ℹ️")
+        return
+
+    fig = plot_training_curves(
+        smooth_training_logs(selected, smoothing), TRAINING_METRICS[metric], show_band=show_band
+    )
+    st.plotly_chart(fig)
+
+
 def main():
     configure_page()
     option, uploaded_files, list_simulation = sidebar_menu()
@@ -121,10 +230,13 @@ def main():
             for sim in list_simulation:
                 validate_uploaded_files(sim['files'])
 
-            process_complete_simulation(list_simulation)
+            process_complete_simulation(list_simulation, st.session_state.get("max_workers"))
         else:
             st.info(_INFO_FILL_SIMULATION, icon="ℹ️")
 
+    elif option == "Treinamento":
+        training_page(st.session_state.get("training_dir"))
+
 
 if __name__ == "__main__":
     main()
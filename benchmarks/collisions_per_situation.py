@@ -0,0 +1,100 @@
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.visualization.simulation.collisions_per_situation import (
+    CATEGORIAS,
+    MAPPING_SITUATIONS,
+    calculate_collisions_per_situation,
+)
+
+
+"""
+    Compara a classificaçao vetorizada de calculate_collisions_per_situation com a
+    implementaçao anterior (df.apply por linha).
+
+    Uso: python -m benchmarks.collisions_per_situation
+"""
+
+
+NUM_ROWS = 10 ** 6
+NUM_EXECUCOES = 30
+
+
+def legacy_collisions_per_situation(df):
+    """
+    Implementaçao anterior, mantida apenas como referencia para o benchmark.
+    """
+    df.columns = df.columns.str.strip()
+
+    df["situacao"] = df.apply(
+        lambda row: MAPPING_SITUATIONS.get(
+            (row["etapa da viagem dos pares que colidiram1"], row["etapa da viagem dos pares que colidiram2"]),
+            np.nan
+        ),
+        axis=1,
+    )
+    df = df.dropna(subset=["situacao"])
+
+    df_grouped = df.groupby(["Numero da execucao", "situacao"]).size().unstack(fill_value=0)
+    df_grouped = df_grouped.reindex(columns=range(21), fill_value=0)
+
+    vetor_medias = df_grouped.mean(axis=0).values
+    vetor_desvio_padrao = df_grouped.std(axis=0).values
+    num_execucoes = df_grouped.shape[0]
+    intervalo_confianca = 1.96 * vetor_desvio_padrao / np.sqrt(num_execucoes)
+
+    media_categorias = []
+    intervalo_confianca_categorias = []
+    for indices in CATEGORIAS.values():
+        media_categorias.append(np.nansum(vetor_medias[indices]))
+        intervalo_confianca_categorias.append(np.nansum(intervalo_confianca[indices]))
+
+    return {
+        "media_categorias": np.array(media_categorias),
+        "intervalo_confianca_categorias": np.array(intervalo_confianca_categorias),
+        "categorias": list(CATEGORIAS),
+    }
+
+
+def generate_collisions(num_rows, num_execucoes, seed=0):
+    rng = np.random.default_rng(seed)
+
+    etapa1 = rng.integers(0, 6, num_rows).astype(float)
+    etapa2 = rng.integers(0, 6, num_rows).astype(float)
+    # Alguns codigos invalidos/ausentes, como nos arquivos reais
+    etapa1[rng.random(num_rows) < 0.01] = np.nan
+    etapa2[rng.random(num_rows) < 0.01] = 7
+
+    return pd.DataFrame({
+        "Numero da execucao": rng.integers(0, num_execucoes, num_rows),
+        " etapa da viagem dos pares que colidiram1": etapa1,
+        " etapa da viagem dos pares que colidiram2": etapa2,
+    })
+
+
+def _timed(func, df):
+    start = time.perf_counter()
+    result = func(df.copy())
+    return result, time.perf_counter() - start
+
+
+def main():
+    df = generate_collisions(NUM_ROWS, NUM_EXECUCOES)
+
+    legacy, legacy_time = _timed(legacy_collisions_per_situation, df)
+    vectorized, vectorized_time = _timed(calculate_collisions_per_situation, df)
+
+    for key in ("media_categorias", "intervalo_confianca_categorias"):
+        np.testing.assert_allclose(vectorized[key], legacy[key], rtol=1e-12)
+    assert vectorized["categorias"] == legacy["categorias"]
+
+    print(f"Linhas: {NUM_ROWS}")
+    print(f"df.apply:   {legacy_time:.3f} s")
+    print(f"vetorizado: {vectorized_time:.3f} s")
+    print(f"speedup:    {legacy_time / vectorized_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import GENERATORS, SyntheticFile, generate, to_uploaded_file
+from src.processing import complete_process, loader, pipeline
+from src.processing.map_functions import MAP_FUNCTIONS
+from src.processing.simple_process import simple_process
+
+
+"""
+    Mede tempo e memoria de cada funçao de calculo e de plot de MAP_FUNCTIONS e dos
+    pipelines simple_process / complete_process com dados sinteticos (benchmarks.synthetic).
+
+    Uso:
+        python -m benchmarks.suite run --sizes 1e3 1e4 1e5 1e6 --output bench.json
+        python -m benchmarks.suite compare base.json bench.json
+
+    O tempo reportado e o menor de `--repeat` execuçoes; a memoria e o pico medido com
+    tracemalloc em uma execuçao separada (memoria alocada pelo pyarrow nao e contabilizada).
+    Os pipelines rodam com o Streamlit em modo "bare" (sem servidor), com os caches
+    limpos antes de cada execuçao.
+"""
+
+
+DEFAULT_SIZES = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]
+DEFAULT_REPEAT = 3
+DEFAULT_EXECUCOES = 30
+DEFAULT_LAUNCH_RATE = 0.5
+DEFAULT_SIMULATIONS = 2
+
+# Razao de tempo a partir da qual `compare` acusa regressao
+REGRESSION_THRESHOLD = 1.2
+
+
+def _clear_caches():
+    # O armazenamento em disco dos resultados e desativado: mede-se o calculo, nao a leitura
+    pipeline._RESULTS_STORE.directory = None
+    loader.clear_cache()
+    pipeline._RESULTS_CACHE.clear()
+    complete_process._FIGURE_CACHE.clear()
+
+
+def _measure(func, repeat, setup=None):
+    """
+    Executa `func(setup())` `repeat` vezes e mede o tempo, depois mede o pico de memoria.
+
+    Returns:
+        dict: 'time_s' (menor tempo), 'mean_s', 'peak_bytes'.
+    """
+    setup = setup or (lambda: None)
+    times = []
+    for _ in range(repeat):
+        arg = setup()
+        start = time.perf_counter()
+        func(arg)
+        times.append(time.perf_counter() - start)
+
+    arg = setup()
+    tracemalloc.start()
+    try:
+        func(arg)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {'time_s': min(times), 'mean_s': float(np.mean(times)), 'peak_bytes': peak}
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def bench_functions(file_key, num_rows, args):
+    """
+    Mede as funçoes de calculo e de plot registradas para um tipo de arquivo.
+    """
+    file = to_uploaded_file(file_key, generate(file_key, num_rows, args.executions, args.launch_rate))
+    df = loader.load_csv(file)
+    labels = [f"Simulacao {i + 1}" for i in range(args.simulations)]
+
+    entries = []
+    for func_dict in MAP_FUNCTIONS[file_key]:
+        calc_func = func_dict['function_name']
+        plot_func = func_dict['plot']
+        if args.filter and args.filter not in calc_func.__name__:
+            continue
+
+        entries.append({
+            'kind': 'calc', 'name': calc_func.__name__, 'file_key': file_key,
+            **_measure(calc_func, args.repeat, setup=lambda: df.copy(deep=False)),
+        })
+
+        data = [calc_func(df.copy(deep=False))] * args.simulations
+        entries.append({
+            'kind': 'plot', 'name': plot_func.__name__, 'file_key': file_key,
+            **_measure(lambda data: plot_func(data, labels=labels), args.repeat, setup=lambda: data),
+        })
+
+    return entries
+
+
+def bench_pipelines(num_rows, args):
+    """
+    Mede simple_process e complete_process com os tres arquivos de cada simulaçao.
+
+    O generalSimulationData tem uma linha por execuçao, como nos arquivos reais.
+    """
+    simulations = []
+    for i in range(args.simulations):
+        frames = {
+            file_key: generate(
+                file_key,
+                args.executions if file_key == 'generalSimulationData' else num_rows,
+                args.executions, args.launch_rate, seed=i,
+            )
+            for file_key in GENERATORS
+        }
+        simulations.append({
+            'name': f"Simulacao {i + 1}",
+            'data': {file_key: to_uploaded_file(file_key, df).getvalue() for file_key, df in frames.items()},
+        })
+
+    def files(simulation):
+        _clear_caches()
+        return [SyntheticFile(f"{file_key}.csv", data) for file_key, data in simulation['data'].items()]
+
+    def list_simulation():
+        return [{'name': simulation['name'], 'files': files(simulation)} for simulation in simulations]
+
+    return [
+        {
+            'kind': 'pipeline', 'name': 'simple_process', 'file_key': None,
+            **_measure(simple_process, args.repeat, setup=lambda: files(simulations[0])),
+        },
+        {
+            'kind': 'pipeline', 'name': 'complete_process', 'file_key': None,
+            **_measure(
+                lambda sims: complete_process.complete_process(sims, max_workers=args.workers),
+                args.repeat, setup=list_simulation,
+            ),
+        },
+    ]
+
+
+def run(args):
+    # O Streamlit em modo "bare" avisa a cada chamada que nao ha sessao ativa
+    logging.disable(logging.WARNING)
+
+    entries = []
+    for num_rows in args.sizes:
+        size_entries = []
+        for file_key in GENERATORS:
+            if args.file_key and file_key != args.file_key:
+                continue
+            size_entries.extend(bench_functions(file_key, num_rows, args))
+        if not args.skip_pipelines:
+            size_entries.extend(bench_pipelines(num_rows, args))
+
+        for entry in size_entries:
+            entry.update({'rows': num_rows, 'execucoes': args.executions, 'launch_rate': args.launch_rate})
+            print(
+                f"{num_rows:>10} {entry['kind']:<9} {entry['name']:<60} "
+                f"{entry['time_s'] * 1000:>10.2f} ms {entry['peak_bytes'] / 1024 ** 2:>9.1f} MB",
+                file=sys.stderr,
+            )
+        entries.extend(size_entries)
+
+    report = {
+        'metadata': {
+            'commit': _git_commit(),
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'cpu_count': os.cpu_count(),
+            'repeat': args.repeat,
+            'simulations': args.simulations,
+            'workers': args.workers,
+        },
+        'results': entries,
+    }
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Resultados gravados em {args.output}", file=sys.stderr)
+    return 0
+
+
+def _entry_key(entry):
+    return (entry['kind'], entry['name'], entry['file_key'], entry['rows'])
+
+
+def compare(args):
+    """
+    Compara dois relatorios e lista as mediçoes cujo tempo aumentou mais que o limite.
+
+    Retorna 1 se houver alguma regressao, para uso em scripts.
+    """
+    with open(args.base) as f:
+        base = {_entry_key(entry): entry for entry in json.load(f)['results']}
+    with open(args.new) as f:
+        new = json.load(f)['results']
+
+    regressions = 0
+    for entry in new:
+        old = base.get(_entry_key(entry))
+        if old is None:
+            continue
+
+        ratio = entry['time_s'] / old['time_s'] if old['time_s'] else float('inf')
+        mem_ratio = entry['peak_bytes'] / old['peak_bytes'] if old['peak_bytes'] else float('inf')
+        flag = ""
+        if ratio > args.threshold:
+            flag = "  <-- regressao"
+            regressions += 1
+
+        print(
+            f"{entry['rows']:>10} {entry['kind']:<9} {entry['name']:<60} "
+            f"tempo x{ratio:>6.2f}  memoria x{mem_ratio:>6.2f}{flag}"
+        )
+
+    return 1 if regressions else 0
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Executa os benchmarks.")
+    run_parser.add_argument(
+        "--sizes", nargs="+", type=lambda text: int(float(text)), default=DEFAULT_SIZES,
+        help="Numeros de linhas dos dados sinteticos (ex: 1e3 1e5 1e7).",
+    )
+    run_parser.add_argument("--executions", type=int, default=DEFAULT_EXECUCOES, help="Execuçoes por simulaçao.")
+    run_parser.add_argument(
+        "--launch-rate", type=float, default=DEFAULT_LAUNCH_RATE, help="Drones lançados por segundo simulado.",
+    )
+    run_parser.add_argument("--simulations", type=int, default=DEFAULT_SIMULATIONS, help="Simulaçoes comparadas.")
+    run_parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Repetiçoes de cada mediçao.")
+    run_parser.add_argument("--workers", type=int, default=1, help="Processos do complete_process.")
+    run_parser.add_argument("--file-key", choices=list(GENERATORS), help="Mede apenas um tipo de arquivo.")
+    run_parser.add_argument("--filter", help="Mede apenas as funçoes cujo nome contem o texto.")
+    run_parser.add_argument("--skip-pipelines", action="store_true", help="Nao mede os pipelines completos.")
+    run_parser.add_argument("--output", default="benchmark_results.json", help="Arquivo JSON de saida.")
+
+    compare_parser = subparsers.add_parser("compare", help="Compara dois relatorios JSON.")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    if args.command == "run":
+        return run(args)
+    return compare(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
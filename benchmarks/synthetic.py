@@ -0,0 +1,147 @@
+import io
+
+import numpy as np
+import pandas as pd
+
+from src.processing.schemas import FILE_SCHEMAS
+
+
+"""
+    Geradores de dados sinteticos no formato dos arquivos do FluteSim.
+
+    As colunas e tipos seguem FILE_SCHEMAS, e os cabeçalhos sao escritos com o
+    espaço inicial dos arquivos originais (ex: " drone ID"), entao os DataFrames
+    passam pelas mesmas etapas de limpeza das funçoes de calculo.
+"""
+
+
+# Duraçao simulada de cada execuçao, em segundos
+SIM_DURATION = 3600
+# Fraçao da simulaçao considerada estavel (apos o aquecimento)
+STABLE_FRACTION = 0.8
+# Probabilidade de um drone lançado colidir
+COLLISION_PROBABILITY = 0.05
+
+MODELOS = ['ppo-swish-clip', 'ppo-tanh', 'baseline']
+
+
+def _header(columns):
+    # Todas as colunas, exceto a primeira, tem um espaço no inicio nos arquivos originais
+    return {name: name if i == 0 else f" {name}" for i, name in enumerate(columns)}
+
+
+def _execucoes(num_rows, num_execucoes, rng):
+    return np.sort(rng.integers(0, num_execucoes, num_rows)).astype(np.int32)
+
+
+def generate_drone_collision_data(num_rows, num_execucoes=30, seed=0):
+    """
+    Gera um droneCollisionData com `num_rows` colisoes distribuidas entre as execuçoes.
+    """
+    rng = np.random.default_rng(seed)
+
+    df = pd.DataFrame({
+        'Numero da execucao': _execucoes(num_rows, num_execucoes, rng),
+        'etapa da viagem dos pares que colidiram1': rng.integers(0, 6, num_rows, dtype=np.int8),
+        'etapa da viagem dos pares que colidiram2': rng.integers(0, 6, num_rows, dtype=np.int8),
+        'numero de drones detectados na colisao': rng.poisson(2, num_rows).astype(np.int32),
+        'posicao da colisao no eixo x': rng.normal(0, 500, num_rows).astype(np.float32),
+        'posicao da colisao no eixo y': rng.gamma(4, 15, num_rows).astype(np.float32),
+        'posicao da colisao no eixo z': rng.normal(0, 500, num_rows).astype(np.float32),
+        'modelo': pd.Categorical(rng.choice(MODELOS, num_rows)),
+    })
+    return df.rename(columns=_header(df.columns))
+
+
+def generate_general_drone_data(num_rows, num_execucoes=30, seed=0):
+    """
+    Gera um generalDroneData com `num_rows` drones distribuidos entre as execuçoes.
+
+    Drones que colidiram nao tem 'drone ID' nem tempo de viagem, como nos arquivos reais.
+    """
+    rng = np.random.default_rng(seed)
+
+    colidiu = rng.random(num_rows) < COLLISION_PROBABILITY
+    drone_id = np.arange(num_rows, dtype=np.float64)
+    drone_id[colidiu] = np.nan
+    tempo = rng.gamma(20, 6, num_rows).astype(np.float32)
+    tempo[colidiu] = np.nan
+
+    df = pd.DataFrame({
+        'Numero da execucao': _execucoes(num_rows, num_execucoes, rng),
+        'drone ID': pd.array(drone_id, dtype="Int32"),
+        'tempo de viagem total dos drones no tempo estavel': tempo,
+        'altitude maxima atingida': rng.normal(80, 10, num_rows).astype(np.float32),
+        'altitude minima atingida': np.abs(rng.normal(2, 0.5, num_rows)).astype(np.float32),
+        'modelo': pd.Categorical(rng.choice(MODELOS, num_rows)),
+    })
+    return df.rename(columns=_header(df.columns))
+
+
+def generate_general_simulation_data(num_rows, num_execucoes=30, launch_rate=0.5, seed=0):
+    """
+    Gera um generalSimulationData com `num_rows` linhas (normalmente uma por execuçao).
+
+    Args:
+        launch_rate (float): Taxa de lançamento de drones por segundo simulado.
+    """
+    rng = np.random.default_rng(seed)
+
+    lancados = rng.poisson(launch_rate * SIM_DURATION, num_rows)
+    estavel = rng.binomial(lancados, STABLE_FRACTION)
+    colidentes = rng.binomial(lancados, COLLISION_PROBABILITY)
+
+    df = pd.DataFrame({
+        'Numero da execucao': (np.arange(num_rows) % num_execucoes).astype(np.int32),
+        'numero total de drones lancados': lancados.astype(np.int32),
+        'numero de drones lancados no tempo estavel': estavel.astype(np.int32),
+        'numero total de drones colidentes': colidentes.astype(np.int32),
+    })
+    return df.rename(columns=_header(df.columns))
+
+
+# Geradores indexados pela chave do arquivo (a mesma de MAP_FUNCTIONS e FILE_SCHEMAS)
+GENERATORS = {
+    'droneCollisionData': generate_drone_collision_data,
+    'generalDroneData': generate_general_drone_data,
+    'generalSimulationData': generate_general_simulation_data,
+}
+
+assert set(GENERATORS) == set(FILE_SCHEMAS)
+
+
+def generate(file_key, num_rows, num_execucoes=30, launch_rate=0.5, seed=0):
+    """
+    Gera o DataFrame sintetico de um tipo de arquivo.
+
+    Args:
+        file_key (str): Chave do arquivo em GENERATORS.
+        num_rows (int): Numero de linhas.
+        num_execucoes (int): Numero de execuçoes da simulaçao.
+        launch_rate (float): Taxa de lançamento (usada no generalSimulationData).
+        seed (int): Semente do gerador aleatorio.
+
+    Returns:
+        DataFrame: Dados com os cabeçalhos no formato original.
+    """
+    if file_key == 'generalSimulationData':
+        return generate_general_simulation_data(num_rows, num_execucoes, launch_rate, seed)
+    return GENERATORS[file_key](num_rows, num_execucoes, seed)
+
+
+class SyntheticFile(io.BytesIO):
+    """
+    CSV em memoria com a interface do UploadedFile do Streamlit (`name`, `size`, `getvalue`).
+    """
+
+    def __init__(self, name, data):
+        super().__init__(data)
+        self.name = name
+        self.size = len(data)
+
+
+def to_uploaded_file(file_key, df):
+    """
+    Serializa o DataFrame como o CSV que seria enviado pelo usuario.
+    """
+    return SyntheticFile(f"{file_key}.csv", df.to_csv(index=False).encode())
@@ -0,0 +1,187 @@
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from src.processing.discovery import list_simulation_files
+from src.processing.instrumentation import StageTimings
+from src.processing.map_functions import PLOT_FUNCTIONS
+from src.processing.pipeline import collect_jobs, run_jobs
+from src.utils.graph_plotly import apply_paper_layout
+
+
+"""
+    Executa a analise completa sem o Streamlit, a partir de diretorios de resultados.
+
+    Uso:
+        python -m src.processing.batch \\
+            --simulation "Simulacao A" resultados/sim_a \\
+            --simulation "Simulacao B" resultados/sim_b \\
+            --output saida/ --workers 8 --png
+
+    Gera em --output:
+        results.csv       tabela no formato longo (uma linha por valor calculado)
+        timings.csv       tempo de cada etapa (leitura, calculo) por arquivo e funçao
+        figures/*.json    figuras plotly de cada analise
+        figures/*.png     (com --png) imagens estaticas, se o kaleido estiver instalado
+"""
+
+
+RESULTS_COLUMNS = ["simulation_name", "file_name", "function_name", "metric", "index", "value"]
+
+
+def _tidy_rows(result):
+    """
+    Converte o dicionario retornado por uma funçao de calculo em linhas do formato longo.
+
+    Valores escalares ficam com index vazio; vetores geram uma linha por posiçao.
+    """
+    base = [result['simulation_name'], result['file_name'], result['function_name']]
+    value = result['value']
+
+    if not isinstance(value, dict):
+        value = {"valor": value}
+
+    rows = []
+    for metric, values in value.items():
+        if isinstance(values, (list, tuple, np.ndarray, pd.Series)):
+            for index, item in enumerate(np.asarray(values, dtype=object).ravel()):
+                rows.append(base + [metric, index, item])
+        else:
+            rows.append(base + [metric, None, values])
+    return rows
+
+
+def results_table(all_results):
+    """
+    Monta a tabela de resultados no formato longo.
+
+    Args:
+        all_results (list): Resultados retornados pelo pipeline.
+
+    Returns:
+        DataFrame: Colunas RESULTS_COLUMNS.
+    """
+    rows = [row for result in all_results for row in _tidy_rows(result)]
+    table = pd.DataFrame(rows, columns=RESULTS_COLUMNS)
+    table["index"] = table["index"].astype("Int64")
+    return table
+
+
+def _safe_name(text):
+    return "".join(c if c.isalnum() or c in "-_." else "_" for c in text)
+
+
+def write_figures(all_results, output_dir, paper=False, png=False):
+    """
+    Gera e salva uma figura por (arquivo, analise), comparando as simulaçoes.
+
+    Returns:
+        list: Mensagens de aviso.
+    """
+    figures_dir = os.path.join(output_dir, "figures")
+    os.makedirs(figures_dir, exist_ok=True)
+    warnings = []
+
+    results_df = pd.DataFrame(all_results)
+    for (file_name, func_name), df_func in results_df.groupby(["file_name", "function_name"], sort=False):
+        plot_func_name = df_func['plot_function'].iloc[0]
+        fig = PLOT_FUNCTIONS[plot_func_name](df_func['value'].tolist(), labels=df_func['simulation_name'].tolist())
+
+        if fig is None:
+            warnings.append(f"A função {func_name} não retornou um grafico.")
+            continue
+        if paper:
+            fig = apply_paper_layout(fig)
+
+        base_name = os.path.join(figures_dir, _safe_name(f"{os.path.splitext(file_name)[0]}__{func_name}"))
+        fig.write_json(base_name + ".json")
+
+        if png:
+            try:
+                fig.write_image(base_name + ".png")
+            except Exception as e:
+                warnings.append(f"Nao foi possivel gerar o PNG de {func_name} (kaleido instalado?): {e}")
+                png = False
+
+    return warnings
+
+
+def run_batch(list_simulation, output_dir, max_workers=None, paper=False, png=False):
+    """
+    Executa o pipeline de MAP_FUNCTIONS e grava a tabela de resultados e as figuras.
+
+    Args:
+        list_simulation (list): Lista de simulaçoes ({'name', 'files'}).
+        output_dir (str): Diretorio de saida.
+        max_workers (int, optional): Numero de processos. Padrao e o numero de CPUs.
+        paper (bool): Se True, salva as figuras no layout de artigo.
+        png (bool): Se True, salva tambem as figuras em PNG.
+
+    Returns:
+        tuple: Tabela de resultados e lista de mensagens (erros e avisos).
+    """
+    jobs, messages = collect_jobs(list_simulation)
+
+    all_results = []
+    timings = StageTimings()
+    # Sem cache de DataFrames: cada arquivo e descartado assim que suas metricas sao calculadas
+    for results, errors, warnings, records in run_jobs(jobs, max_workers=max_workers, cache_frames=False):
+        timings.extend(records)
+        messages.extend(errors)
+        messages.extend(warnings)
+        all_results.extend(results)
+
+    os.makedirs(output_dir, exist_ok=True)
+    table = results_table(all_results)
+    table.to_csv(os.path.join(output_dir, "results.csv"), index=False)
+    timings.to_frame().to_csv(os.path.join(output_dir, "timings.csv"), index=False)
+
+    if all_results:
+        messages.extend(write_figures(all_results, output_dir, paper=paper, png=png))
+    else:
+        messages.append("Nenhum resultado foi gerado.")
+
+    return table, messages
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m src.processing.batch",
+        description="Analise completa das simulaçoes sem o Streamlit.",
+    )
+    parser.add_argument(
+        "--simulation", nargs=2, action="append", required=True, metavar=("TITULO", "DIRETORIO"),
+        help="Titulo e diretorio com os CSVs de uma simulaçao (repita para cada simulaçao).",
+    )
+    parser.add_argument("--output", required=True, help="Diretorio de saida.")
+    parser.add_argument("--workers", type=int, default=None, help="Numero de processos (padrao: numero de CPUs).")
+    parser.add_argument("--paper", action="store_true", help="Salva as figuras no layout de artigo.")
+    parser.add_argument("--png", action="store_true", help="Salva tambem as figuras em PNG (requer kaleido).")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+
+    list_simulation = []
+    for title, directory in args.simulation:
+        if not os.path.isdir(directory):
+            print(f"Diretorio nao encontrado: {directory}", file=sys.stderr)
+            return 1
+        list_simulation.append({'name': title, 'files': list_simulation_files(directory)})
+
+    table, messages = run_batch(
+        list_simulation, args.output, max_workers=args.workers, paper=args.paper, png=args.png,
+    )
+
+    for message in messages:
+        print(message, file=sys.stderr)
+    print(f"{len(table)} valores gravados em {os.path.join(args.output, 'results.csv')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
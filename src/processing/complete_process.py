@@ -1,73 +1,63 @@
 import streamlit as st
 import pandas as pd
 
-# Importando as funçoes de cada grafico
-from src.visualization.execution.collision_rate_per_execution import calculate_collision_rate_per_execution, plot_collision_rate_per_execution
-from src.visualization.execution.drone_density_per_execution import calculate_drone_density_per_execution, plot_drone_density_per_execution
-from src.visualization.execution.duration_successful_trips_per_execution import calculate_duration_successful_trips_per_execution, plot_duration_successful_trips_per_execution
-from src.visualization.execution.time_successful_trips_stable_per_execution import calculate_time_successful_trips_stable_per_execution, plot_time_successful_trips_stable_per_execution
-from src.visualization.simulation.collision_rate_per_simulation import calculate_collision_rate_per_simulation, plot_collision_rate_per_simulation
-from src.visualization.simulation.collisions_per_situation import calculate_collisions_per_situation, plot_collisions_per_situation
-from src.visualization.simulation.drone_density_per_simulation import calculate_drone_density_per_simulation, plot_drone_density_per_simulation
-from src.visualization.simulation.duration_successful_trips_per_simulation import calculate_duration_successful_trips_per_simulation, plot_duration_successful_trips_per_simulation
-from src.visualization.simulation.flight_height_per_simulation import calculate_flight_height, plot_flight_height
-from src.visualization.simulation.plot_number_of_detected_drones_at_collision_poisson_simulation import calculate_detected_drones_simulation, plot_dected_drones_per_simulation
-from src.visualization.simulation.plot_max_height_simulation import calculate_max_height_simulation, plot_max_height_simulation
-
-
-# Mapeamento dos nomes de arquivos com as funçoes correspondentes
-MAP_FUNCTIONS = {
-    'droneCollisionData': [
-        {
-            'function_name': calculate_collisions_per_situation,
-            'plot': plot_collisions_per_situation,
-        },
-        {
-            'function_name': calculate_detected_drones_simulation,
-            'plot': plot_dected_drones_per_simulation,
-        },
-    ],
-    'generalSimulationData': [
-        {
-            'function_name': calculate_collision_rate_per_execution,
-            'plot': plot_collision_rate_per_execution,
-        },
-        {
-            'function_name': calculate_collision_rate_per_simulation,
-            'plot': plot_collision_rate_per_simulation,
-        },
-        {
-            'function_name': calculate_drone_density_per_execution,
-            'plot': plot_drone_density_per_execution,
-        },
-        {
-            'function_name': calculate_drone_density_per_simulation,
-            'plot': plot_drone_density_per_simulation,
-        },
-    ],
-    'generalDroneData': [
-        {
-            'function_name': calculate_duration_successful_trips_per_execution,
-            'plot': plot_duration_successful_trips_per_execution,
-        },
-        {
-            'function_name': calculate_duration_successful_trips_per_simulation,
-            'plot': plot_duration_successful_trips_per_simulation,
-        },
-        {
-            'function_name': calculate_time_successful_trips_stable_per_execution,
-            'plot': plot_time_successful_trips_stable_per_execution,
-        },
-        {
-            'function_name': calculate_flight_height,
-            'plot': plot_flight_height,
-        },
-        {
-            'function_name': calculate_max_height_simulation,
-            'plot': plot_max_height_simulation,
-        },
-    ],
-}
+from src.processing.instrumentation import StageTimings, figure_payload_bytes
+from src.processing.map_functions import PLOT_FUNCTIONS
+from src.processing.pipeline import collect_jobs, run_jobs
+from src.utils.bootstrap import BOOTSTRAP_RESAMPLES, BOOTSTRAP_SEED, apply_bootstrap, supports_bootstrap
+from src.utils.cache import LRUCache
+from src.utils.graph_plotly import apply_paper_layout
+from src.utils.hashing import hash_value, value_nbytes
+
+
+# Orçamento de memoria do cache de figuras (256 MB)
+FIGURE_CACHE_MAX_BYTES = 256 * 1024 ** 2
+
+
+def _figure_size(entry):
+    # Entradas (figura, bytes serializados): o tamanho serializado aproxima a memoria da figura
+    return entry[1]
+
+
+_FIGURE_CACHE = LRUCache(FIGURE_CACHE_MAX_BYTES, sizeof=_figure_size)
+
+# Intervalos por bootstrap ja calculados, para nao refazer as reamostragens a cada rerun
+BOOTSTRAP_CACHE_MAX_BYTES = 64 * 1024 ** 2
+
+_BOOTSTRAP_CACHE = LRUCache(BOOTSTRAP_CACHE_MAX_BYTES, sizeof=value_nbytes)
+
+_CI_NORMAL = "Normal (1,96·σ/√n)"
+_CI_BOOTSTRAP = "Bootstrap por execução"
+
+
+def _run(list_simulation, max_workers=None, timings=None):
+    """
+    Executa o pipeline de calculo e exibe os erros e avisos no Streamlit.
+
+    Args:
+        list_simulation (list): Lista de simulaçoes com seus respectivos arquivos.
+        max_workers (int, optional): Numero de processos usados no calculo.
+        timings (StageTimings, optional): Recebe as mediçoes de tempo de cada etapa.
+
+    Returns:
+        list: Lista de dicionarios com os resultados.
+    """
+    all_results = []
+
+    jobs, warnings = collect_jobs(list_simulation)
+    for warning in warnings:
+        st.warning(warning)
+
+    for results, errors, warnings, records in run_jobs(jobs, max_workers=max_workers):
+        if timings is not None:
+            timings.extend(records)
+        for error in errors:
+            st.error(error)
+        for warning in warnings:
+            st.warning(warning)
+        all_results.extend(results)
+
+    return all_results
 
 
 def process_simulation_files(simulation):
@@ -79,57 +69,111 @@ def process_simulation_files(simulation):
     Returns:
         list: Lista de dicionarios com os resultados.
     """
-    results = []
-    sim_name = simulation['name']
-    list_files = simulation['files']
-
-    for file in list_files:
-        file_processed = False
-        
-        for key, funcs in MAP_FUNCTIONS.items():
-            if key in file.name:
-                
-                df = pd.read_csv(file)
-                df.columns = df.columns.str.strip()
-                df = df.sort_values(by="Numero da execucao")
-
-                for func_dict in funcs:
-                    calc_func = func_dict['function_name']
-                    plot_func = func_dict['plot']
-                    
-                    func_name = calc_func.__name__
-                    plot_func_name = plot_func.__name__
-                    
-                    try:
-                        value = calc_func(df)
-                        result = {
-                            'simulation_name': sim_name,
-                            'file_name': file.name,
-                            'function_name': func_name,
-                            'value': value,
-                            'plot_function': plot_func_name
-                        }
-                        results.append(result)
-                    
-                    except Exception as e:
-                        st.error(f"Erro ao processar {func_name} no arquivo {file.name}: {e}")
-                
-                file_processed = True
-                break  # Sai do loop depois processar o arquivo
-        
-        if not file_processed:
-            st.warning(f"O arquivo {file.name} não tem funçoes associadas.")
-    
-    return results
+    return _run([simulation], max_workers=1)
+
+
+def _build_figure(plot_func_name, data, labels, paper=False):
+    """
+    Gera o grafico de uma analise usando o cache de figuras.
+
+    As figuras sao indexadas pelo hash dos resultados e pela funçao de plot. O layout de
+    artigo e aplicado como uma copia estilizada da figura em cache, entao alternar o
+    layout nao reconstroi o grafico. O tamanho da figura serializada e medido uma unica
+    vez, quando ela e construida, e guardado junto dela.
+
+    Args:
+        plot_func_name (str): Nome da funçao de plot em PLOT_FUNCTIONS.
+        data (list): Valores calculados de cada simulaçao.
+        labels (list): Nomes das simulaçoes.
+        paper (bool): Se True, retorna a figura no layout de artigo.
+
+    Returns:
+        tuple: Figura plotly e tamanho em bytes enviado ao navegador
+        ((None, 0) se a funçao de plot nao retornar um grafico).
+    """
+    base_key = (hash_value([data, labels]), plot_func_name)
+
+    cached = _FIGURE_CACHE.get(base_key + (paper,))
+    if cached is not None:
+        return cached
+
+    cached = _FIGURE_CACHE.get(base_key + (False,))
+    if cached is None:
+        fig = PLOT_FUNCTIONS[plot_func_name](data, labels=labels)
+        if fig is None:
+            return None, 0
+        cached = (fig, figure_payload_bytes(fig))
+        _FIGURE_CACHE.put(base_key + (False,), cached)
+
+    if paper:
+        fig = apply_paper_layout(cached[0])
+        cached = (fig, figure_payload_bytes(fig))
+        _FIGURE_CACHE.put(base_key + (True,), cached)
+
+    return cached
+
+
+def _bootstrap(data, max_workers=None):
+    """
+    Aplica o intervalo de confiança por bootstrap aos resultados de uma analise (com cache).
+    """
+    key = (hash_value(data), BOOTSTRAP_RESAMPLES, BOOTSTRAP_SEED)
+
+    result = _BOOTSTRAP_CACHE.get(key)
+    if result is None:
+        result = apply_bootstrap(data, BOOTSTRAP_RESAMPLES, BOOTSTRAP_SEED, max_workers=max_workers)
+        _BOOTSTRAP_CACHE.put(key, result)
+    return result
 
 
-def aggregate_results(all_results):
+def _display_diagnostics(timings):
+    """
+    Exibe as mediçoes de tempo por etapa e os botoes para baixa-las.
+
+    Args:
+        timings (StageTimings): Mediçoes coletadas durante o processamento.
+    """
+    timings_df = timings.to_frame()
+
+    summary = timings_df.groupby("stage", sort=False).agg(
+        wall_s=("wall_s", "sum"), rows=("rows", "sum"), payload_bytes=("payload_bytes", "sum"),
+    )
+    st.dataframe(summary)
+    st.dataframe(timings_df)
+
+    # Memoria de cada arquivo, com os tipos reduzidos e com os tipos padrao do pandas.
+    # As mediçoes acompanham os resultados em cache, entao aparecem tambem nos reruns
+    measured = timings_df[timings_df["stage"] == "memory"]
+    if not measured.empty:
+        memory = measured[["simulation_name", "file_name", "rows"]].copy()
+        memory["memoria_padrao_mb"] = (measured["baseline_bytes"] / 1024 ** 2).round(2)
+        memory["memoria_mb"] = (measured["payload_bytes"] / 1024 ** 2).round(2)
+        memory["reducao_%"] = (100 * (1 - measured["payload_bytes"] / measured["baseline_bytes"])).round(1)
+        st.caption("Memoria por arquivo")
+        st.dataframe(memory, hide_index=True)
+
+    col_csv, col_json = st.columns(2)
+    col_csv.download_button(
+        "Baixar CSV", timings_df.to_csv(index=False), file_name="diagnostico.csv", mime="text/csv",
+    )
+    col_json.download_button(
+        "Baixar JSON", timings_df.to_json(orient="records"), file_name="diagnostico.json", mime="application/json",
+    )
+
+
+def aggregate_results(all_results, timings=None, max_workers=None):
     """
     Agrega os resultados de todas as simulaçoes e exibe os graficos.
 
     Args:
         all_results (list): Lista de resultados de todas as simulaçoes.
+        timings (StageTimings, optional): Mediçoes do calculo. As etapas de construçao
+            e exibiçao dos graficos sao adicionadas e exibidas no painel de diagnostico.
+        max_workers (int, optional): Processos usados no bootstrap dos intervalos de confiança.
     """
+    if timings is None:
+        timings = StageTimings()
+
     if not all_results:
         st.warning("Nenhum resultado foi gerado.")
         return
@@ -145,6 +189,9 @@ def aggregate_results(all_results):
     # add DF para ser baixado se necesario.
     with st.expander("DataFrame com os valores processados"):
         st.dataframe(results_df)
+
+    # Painel de diagnostico, preenchido depois que os graficos sao exibidos
+    diagnostics = st.expander("Diagnostico de desempenho")
     
     # Cria abas por nome do arquivo
     files_name = results_df['file_name'].unique()
@@ -170,71 +217,51 @@ def aggregate_results(all_results):
                     labels = df_func['simulation_name'].tolist()
                     plot_func_name = df_func['plot_function'].iloc[0]
 
-                    # Gerar e exibir o grafico
-                    plot_func = globals()[plot_func_name]
-                    fig = plot_func(data, labels=labels)
+                    # Metodo do intervalo de confiança, escolhido por analise
+                    if supports_bootstrap(data):
+                        method = st.radio(
+                            "Intervalo de confiança", (_CI_NORMAL, _CI_BOOTSTRAP),
+                            horizontal=True, key=f"ci_{file_name}_{func_name}",
+                        )
+                        if method == _CI_BOOTSTRAP:
+                            with timings.stage('bootstrap', None, file_name, func_name):
+                                data = _bootstrap(data, max_workers=max_workers)
+
+                    # Gerar o grafico (ou reaproveitar do cache) no layout escolhido
+                    with timings.stage('figure', None, file_name, func_name) as record:
+                        fig, payload_bytes = _build_figure(plot_func_name, data, labels, paper=checked_paper)
+                        if fig:
+                            record['payload_bytes'] = payload_bytes
 
                     # Gerar e exibir o grafico
                     if fig:
                         # If alteração do layout
-                        if checked_paper:
-                            # att legenda e tamanho do texto para exportar graficos para o artigo 
-                            fig.update_layout(
-                                plot_bgcolor='white',
-                                legend=dict(
-                                    title="",
-                                    font=dict(
-                                        size=30  # Define o tamanho do texto da legenda
-                                    ),
-                                    x=0.02,  # Posiçao horizontal dentro do gráfico (0 é a esquerda, 1 é a direita)
-                                    y=0.95,  # Posiçao vertical dentro do gráfico (0 é na base, 1 é no topo)
-                                    xanchor='left',  # Alinha a legenda em relaçao ao ponto definido por x
-                                    yanchor='top',   # Alinha a legenda em relaçao ao ponto definido por y
-                                    bgcolor='rgba(255, 255, 255, 0.7)',  # Fundo da legenda com transparência
-                                    bordercolor='black',  # Cor da borda da legenda
-                                    borderwidth=1         # Largura da borda da legenda
-                                ),
-                                yaxis=dict(
-                                    title_font=dict(size=30),
-                                    tickfont=dict(size=30),
-                                    automargin=True
-                                ),
-                                xaxis=dict(
-                                    title_font=dict(size=30),
-                                    tickfont=dict(size=30),
-                                    automargin=True
-                                ),
-                                # Texto Dissertacao
-                                title='', 
-                                # yaxis_title='',
-                                # title=dict(
-                                #     x=0.5,                
-                                #     xanchor='center',     
-                                #     font=dict(size=40)    
-                                # )
-                            )
-                            st.plotly_chart(fig, theme=None)
-                            st.divider()
-                        else: 
-                            st.plotly_chart(fig)
-                            st.divider()
+                        with timings.stage('render', None, file_name, func_name):
+                            if checked_paper:
+                                st.plotly_chart(fig, theme=None)
+                            else:
+                                st.plotly_chart(fig)
+                        st.divider()
                     else:
                         st.warning(f"A função {func_name} não retornou um grafico.")
                 else:
                     st.write(f"Nenhum dado disponivel para a analise {func_name}.")
 
+    with diagnostics:
+        _display_diagnostics(timings)
+
 
-def complete_process(list_simulation):
+def complete_process(list_simulation, max_workers=None):
     """
     Processa todas as simulaçoes para a analise completa.
 
+    Os jobs (simulaçao, arquivo) sao distribuidos em um pool de processos quando
+    a entrada e grande o suficiente; caso contrario sao processados em serie.
+
     Args:
         list_simulation (list): Lista de simulaçoes com seus respectivos arquivos.
+        max_workers (int, optional): Numero de processos usados no calculo. Padrao e o numero de CPUs.
     """
-    all_results = []
-
-    for simulation in list_simulation:
-        results = process_simulation_files(simulation)
-        all_results.extend(results)
-
-    aggregate_results(all_results)
+    timings = StageTimings()
+    all_results = _run(list_simulation, max_workers=max_workers, timings=timings)
+    aggregate_results(all_results, timings=timings, max_workers=max_workers)
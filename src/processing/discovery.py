@@ -0,0 +1,115 @@
+import os
+
+from src.processing.loader import DiskFile
+
+
+"""
+    Descoberta das simulaçoes em um diretorio de resultados no servidor.
+
+    Layout esperado (o mesmo usado pelos scripts de src/visualization/auxiliar):
+
+        <raiz>/
+            12_ppo_swish_clip/
+                droneCollisionData.csv
+                generalDroneData.csv
+                generalSimulationData.csv
+            12_a2c_swish_clip/
+                ...
+
+    Cada subdiretorio com ao menos um CSV valido e uma simulaçao. Os arquivos sao
+    devolvidos como DiskFile, entao o conteudo so e lido quando uma analise precisa dele.
+
+    Os caminhos sao resolvidos (realpath) e tudo que estiver fora do diretorio de
+    resultados, inclusive por links simbolicos, e ignorado ou rejeitado.
+"""
+
+
+def is_within(path, root):
+    """
+    Indica se o caminho real de `path` esta dentro do caminho real de `root`.
+    """
+    root = os.path.realpath(root)
+    return os.path.commonpath([root, os.path.realpath(path)]) == root
+
+
+def resolve_within(root, relative="."):
+    """
+    Resolve um caminho relativo dentro de `root`.
+
+    Args:
+        root (str): Diretorio raiz permitido.
+        relative (str): Caminho relativo a raiz.
+
+    Returns:
+        str: Caminho real resolvido.
+    """
+    path = os.path.realpath(os.path.join(root, relative))
+    if not is_within(path, root):
+        raise ValueError(f"Caminho fora do diretorio permitido: {relative}")
+    return path
+
+
+def list_subdirectories(root):
+    """
+    Lista os subdiretorios (um nivel) de `root` que ficam dentro dele, em ordem alfabetica.
+
+    Returns:
+        list: Nomes dos subdiretorios.
+    """
+    return sorted(
+        name for name in os.listdir(root)
+        if not name.startswith(".")
+        and os.path.isdir(os.path.join(root, name))
+        and is_within(os.path.join(root, name), root)
+    )
+
+
+def list_simulation_files(directory, file_names=None):
+    """
+    Lista os arquivos CSV de um diretorio de resultados como DiskFile, em ordem alfabetica.
+
+    Args:
+        directory (str): Diretorio da simulaçao.
+        file_names (list, optional): Nomes de arquivo aceitos. Padrao: todos os .csv.
+
+    Returns:
+        list: Lista de DiskFile.
+    """
+    names = sorted(
+        name for name in os.listdir(directory)
+        if name.lower().endswith(".csv")
+        and (file_names is None or name in file_names)
+        and os.path.isfile(os.path.join(directory, name))
+        and is_within(os.path.join(directory, name), directory)
+    )
+    return [DiskFile(os.path.join(directory, name)) for name in names]
+
+
+def discover_simulations(root, file_names=None):
+    """
+    Encontra as simulaçoes (subdiretorios com CSVs) de um diretorio de resultados.
+
+    Se a propria raiz tiver CSVs validos, ela tambem e considerada uma simulaçao.
+
+    Args:
+        root (str): Diretorio de resultados.
+        file_names (list, optional): Nomes de arquivo aceitos. Padrao: todos os .csv.
+
+    Returns:
+        dict: {nome da simulaçao: lista de DiskFile}, em ordem alfabetica.
+    """
+    if not os.path.isdir(root):
+        raise FileNotFoundError(f"Diretorio nao encontrado: {root}")
+
+    simulations = {}
+
+    files = list_simulation_files(root, file_names)
+    if files:
+        simulations[os.path.basename(os.path.normpath(root))] = files
+
+    for name in list_subdirectories(root):
+        files = list_simulation_files(os.path.join(root, name), file_names)
+        if files:
+            simulations[name] = files
+
+    return simulations
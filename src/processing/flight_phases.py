@@ -0,0 +1,177 @@
+import numpy as np
+import pandas as pd
+
+
+"""
+    Segmentaçao vetorizada das trajetorias em etapas de voo.
+
+    As etapas usam os mesmos codigos de MAPPING_SITUATIONS (collisions_per_situation):
+        0 decolagem, 1 ida, 2 pouso da entrega, 3 decolagem da entrega, 4 volta, 5 pouso.
+
+    Nao existe coluna marcando a etapa nos logs, entao ela e inferida pela altitude (y).
+    As amostras abaixo de Y_POUSO estao no chao; as demais formam trechos (run-length
+    encoding das amostras no chao e fora dele) e um trecho fora do chao com ao menos uma
+    amostra acima de Y_DECOLAGEM e um voo. Todas as trajetorias sao processadas de uma vez,
+    concatenadas e separadas pelo indice de inicio de cada uma (como no TrajectoryStore).
+"""
+
+
+DECOLAGEM = 0
+IDA = 1
+POUSO_ENTREGA = 2
+DECOLAGEM_ENTREGA = 3
+VOLTA = 4
+POUSO = 5
+
+PHASE_NAMES = {
+    DECOLAGEM: "decolagem",
+    IDA: "ida",
+    POUSO_ENTREGA: "pouso da entrega",
+    DECOLAGEM_ENTREGA: "decolagem da entrega",
+    VOLTA: "volta",
+    POUSO: "pouso",
+}
+
+# Limiares de altitude (m) da histerese de voo
+Y_DECOLAGEM = 5.0
+Y_POUSO = 3.0
+
+
+def _trajectory_ids(n, starts):
+    """
+    Numero da trajetoria de cada amostra e mascara das amostras que iniciam uma trajetoria.
+    """
+    is_start = np.zeros(n, dtype=bool)
+    is_start[starts] = True
+    return np.cumsum(is_start) - 1, is_start
+
+
+def _runs(mask, is_start):
+    """
+    Run-length encoding de uma mascara booleana, reiniciado no inicio de cada trajetoria.
+
+    Returns:
+        tuple: Trecho de cada amostra e indice da primeira amostra de cada trecho.
+    """
+    run_start = is_start.copy()
+    run_start[1:] |= mask[1:] != mask[:-1]
+    return np.cumsum(run_start) - 1, np.flatnonzero(run_start)
+
+
+def segment_phases(y, starts=None, y_decolagem=Y_DECOLAGEM, y_pouso=Y_POUSO):
+    """
+    Classifica cada amostra das trajetorias em uma etapa de voo.
+
+    Cada voo e dividido pelas suas amostras acima de Y_DECOLAGEM: antes da primeira e a
+    subida, da primeira a ultima e o cruzeiro e depois da ultima e a descida. O primeiro
+    voo e a ida (subida 0, cruzeiro 1, descida 2) e os seguintes a volta (subida 3,
+    cruzeiro 4, descida 5). O tempo no chao conta como a etapa do voo vizinho: antes do
+    primeiro voo e decolagem (0), entre o primeiro e o segundo e pouso da entrega (2) e
+    depois do segundo e pouso (5).
+
+    Amostras entre Y_POUSO e Y_DECOLAGEM sao subida ou descida quando fazem parte de um voo
+    e chao quando o trecho fora do chao nunca passa de Y_DECOLAGEM.
+
+    Args:
+        y (array-like): Altitude de todas as amostras, trajetoria apos trajetoria, em ordem de tempo.
+        starts (array-like, optional): Indice da primeira amostra de cada trajetoria. Padrao: uma trajetoria.
+        y_decolagem (float): Altitude acima da qual o drone esta em cruzeiro.
+        y_pouso (float): Altitude abaixo da qual o drone esta no chao.
+
+    Returns:
+        np.ndarray: Codigo da etapa (int8) de cada amostra.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n == 0:
+        return np.empty(0, dtype=np.int8)
+
+    starts = np.array([0] if starts is None else starts, dtype=np.intp)
+    trajectory, is_start = _trajectory_ids(n, starts)
+    index = np.arange(n)
+
+    alto = y > y_decolagem
+    chao = y < y_pouso
+
+    # Trechos no chao e fora dele; voo e o trecho fora do chao que passa de Y_DECOLAGEM
+    run, run_starts = _runs(chao, is_start)
+    primeiro_alto = np.minimum.reduceat(np.where(alto, index, n), run_starts)
+    ultimo_alto = np.maximum.reduceat(np.where(alto, index, -1), run_starts)
+    voo = ~chao[run_starts] & (ultimo_alto >= 0)
+
+    # Voos anteriores a cada trecho na mesma trajetoria
+    voos = np.cumsum(voo) - voo
+    voos -= voos[run[starts]][trajectory[run_starts]]
+
+    em_voo = voo[run]
+    volta = voos[run] >= 1
+    phases = np.select(
+        [
+            em_voo & (index < primeiro_alto[run]),
+            em_voo & (index <= ultimo_alto[run]),
+            em_voo,
+            voos[run] == 0,
+            voos[run] == 1,
+        ],
+        [
+            np.where(volta, DECOLAGEM_ENTREGA, DECOLAGEM),
+            np.where(volta, VOLTA, IDA),
+            np.where(volta, POUSO, POUSO_ENTREGA),
+            DECOLAGEM,
+            POUSO_ENTREGA,
+        ],
+        default=POUSO,
+    )
+    return phases.astype(np.int8)
+
+
+def phase_durations(time, phases, starts=None):
+    """
+    Soma o tempo gasto em cada etapa por trajetoria.
+
+    O intervalo entre duas amostras e atribuido a etapa da primeira.
+
+    Args:
+        time (array-like): Tempo de todas as amostras, na mesma ordem de `phases`.
+        phases (np.ndarray): Etapas retornadas por segment_phases.
+        starts (array-like, optional): Indice da primeira amostra de cada trajetoria.
+
+    Returns:
+        np.ndarray: Matriz (trajetorias x 6) com a duraçao de cada etapa.
+    """
+    time = np.asarray(time, dtype=np.float64)
+    n = len(time)
+    starts = np.array([0] if starts is None else starts, dtype=np.intp)
+    trajectory, is_start = _trajectory_ids(n, starts)
+
+    dt = np.zeros(n)
+    if n > 1:
+        dt[:-1] = np.diff(time)
+        # A ultima amostra de cada trajetoria nao tem intervalo seguinte
+        dt[:-1][is_start[1:]] = 0
+
+    num_phases = len(PHASE_NAMES)
+    durations = np.bincount(
+        trajectory * num_phases + phases, weights=dt, minlength=len(starts) * num_phases,
+    )
+    return durations.reshape(len(starts), num_phases)
+
+
+def store_phase_durations(store, y_decolagem=Y_DECOLAGEM, y_pouso=Y_POUSO):
+    """
+    Calcula a duraçao de cada etapa de todas as trajetorias de um TrajectoryStore.
+
+    Args:
+        store (TrajectoryStore): Armazenamento de trajetorias.
+
+    Returns:
+        DataFrame: Uma linha por (simulation, drone) e uma coluna por etapa (PHASE_NAMES).
+    """
+    starts = store.index['start']
+    phases = segment_phases(store.columns['y'], starts, y_decolagem, y_pouso)
+    durations = phase_durations(store.columns['time'], phases, starts)
+
+    df = pd.DataFrame(durations, columns=list(PHASE_NAMES.values()))
+    df.insert(0, 'simulation', store.index['simulation'])
+    df.insert(1, 'drone', store.index['drone'])
+    return df
@@ -0,0 +1,74 @@
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+import plotly.io as pio
+
+
+"""
+    Mediçao do tempo de cada etapa do processamento (leitura do CSV, calculo,
+    construçao da figura e envio ao navegador).
+
+    As mediçoes sao dicionarios simples para poderem voltar dos processos do pool.
+    O custo e de uma chamada a time.perf_counter por etapa, entao pode ficar sempre ligado.
+"""
+
+
+TIMING_COLUMNS = ["simulation_name", "file_name", "function_name", "stage", "wall_s", "rows", "payload_bytes", "baseline_bytes"]
+
+class StageTimings:
+    """
+    Coleta as mediçoes das etapas do processamento.
+    """
+
+    def __init__(self):
+        self.records = []
+
+    @contextmanager
+    def stage(self, stage, simulation_name=None, file_name=None, function_name=None, rows=None):
+        """
+        Mede o tempo do bloco `with`. O dicionario retornado pode receber 'rows', 'payload_bytes'
+        e 'baseline_bytes' (memoria com os tipos padrao do pandas, na etapa 'memory').
+        """
+        record = {
+            "simulation_name": simulation_name,
+            "file_name": file_name,
+            "function_name": function_name,
+            "stage": stage,
+            "wall_s": None,
+            "rows": rows,
+            "payload_bytes": None,
+            "baseline_bytes": None,
+        }
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["wall_s"] = time.perf_counter() - start
+            self.records.append(record)
+
+    def extend(self, records):
+        self.records.extend(records)
+
+    def to_frame(self):
+        """
+        Retorna as mediçoes como DataFrame (uma linha por etapa).
+        """
+        df = pd.DataFrame(self.records, columns=TIMING_COLUMNS)
+        df["rows"] = df["rows"].astype("Int64")
+        df["payload_bytes"] = df["payload_bytes"].astype("Int64")
+        df["baseline_bytes"] = df["baseline_bytes"].astype("Int64")
+        return df
+
+
+def figure_payload_bytes(fig):
+    """
+    Tamanho da figura serializada como o Streamlit a envia ao navegador (plotly.io.to_json).
+
+    Args:
+        fig (go.Figure): Figura plotly.
+
+    Returns:
+        int: Tamanho em bytes.
+    """
+    return len(pio.to_json(fig, validate=False).encode())
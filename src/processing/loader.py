@@ -0,0 +1,366 @@
+import contextlib
+import csv
+import hashlib
+import io
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+from src.processing.schemas import FILE_SCHEMAS, get_schema_key
+from src.utils.cache import LRUCache
+
+
+# Versao do carregador, incrementar sempre que a normalizaçao dos DataFrames mudar
+LOADER_VERSION = 5
+
+# Tipos Arrow correspondentes aos tipos declarados em FILE_SCHEMAS.
+# Inteiros sao lidos como float64 (o simulador pode grava-los como "3.0" ou vazios)
+# e convertidos depois por _cast_integer_columns.
+_ARROW_TYPES = {
+    'int8': pa.float64(),
+    'int32': pa.float64(),
+    'float32': pa.float32(),
+    'category': pa.dictionary(pa.int32(), pa.string()),
+}
+
+# Colunas de texto nao declaradas com ate esta fraçao de valores distintos viram categoricas
+CATEGORY_MAX_RATIO = 0.5
+
+_INT32_MIN, _INT32_MAX = np.iinfo(np.int32).min, np.iinfo(np.int32).max
+
+# Orçamento de memoria do cache de DataFrames ja processados (1 GB)
+PARSE_CACHE_MAX_BYTES = 1024 ** 3
+
+# Tamanho dos blocos lidos no modo streaming (64 MB)
+STREAMING_BLOCK_SIZE = 64 * 1024 ** 2
+
+
+def _dataframe_size(df):
+    return int(df.memory_usage(deep=True).sum())
+
+
+_PARSE_CACHE = LRUCache(PARSE_CACHE_MAX_BYTES, sizeof=_dataframe_size)
+
+
+def file_digest(data):
+    """
+    Calcula o hash do conteudo de um arquivo.
+
+    Args:
+        data (bytes): Conteudo do arquivo.
+
+    Returns:
+        str: Hash hexadecimal do conteudo.
+    """
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class DiskFile:
+    """
+    Arquivo CSV em disco com a mesma interface usada do UploadedFile do Streamlit
+    (`name`, `size` e `getvalue`). O conteudo so e lido quando uma analise precisa dele.
+
+    Args:
+        path (str): Caminho do arquivo.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.name = os.path.basename(path)
+        self.size = os.path.getsize(path)
+
+    def getvalue(self):
+        with open(self.path, 'rb') as f:
+            return f.read()
+
+    def open(self):
+        return open(self.path, 'rb')
+
+
+def content_digest(file):
+    """
+    Identifica o conteudo de um arquivo para os caches.
+
+    Arquivos enviados usam o hash do conteudo. Arquivos em disco usam o caminho,
+    o tamanho e a data de modificaçao, evitando ler arquivos grandes apenas para o hash.
+
+    Args:
+        file (UploadedFile or DiskFile): Arquivo CSV.
+
+    Returns:
+        str: Identificador do conteudo.
+    """
+    if isinstance(file, DiskFile):
+        stat = os.stat(file.path)
+        return file_digest(f"{os.path.abspath(file.path)}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return file_digest(file.getvalue())
+
+
+def _read_header(data):
+    """
+    Le o cabeçalho original do CSV (com os espaços).
+    """
+    first_line = data.split(b"\n", 1)[0].decode("utf-8-sig").rstrip("\r")
+    return next(csv.reader([first_line]))
+
+
+def _convert_options(header, schema, columns):
+    """
+    Monta as opçoes de conversao do pyarrow: tipos do esquema e colunas a serem lidas.
+    """
+    column_types = {
+        name: _ARROW_TYPES[schema[name.strip()]]
+        for name in header
+        if name.strip() in schema
+    }
+    include_columns = [name for name in header if columns is None or name.strip() in columns]
+
+    return pa_csv.ConvertOptions(
+        column_types=column_types,
+        include_columns=include_columns,
+    )
+
+
+def _cast_integer_columns(df, schema):
+    """
+    Converte as colunas declaradas como inteiras, quando todos os valores sao inteiros.
+    Colunas com valores nulos usam o inteiro com suporte a nulos (ex: Int32).
+    """
+    for column, dtype in schema.items():
+        if not dtype.startswith('int') or column not in df.columns or df[column].dtype.kind != 'f':
+            continue
+
+        values = df[column].to_numpy()
+        missing = np.isnan(values)
+        if not np.array_equal(values[~missing], np.trunc(values[~missing])):
+            continue  # valores fracionarios: mantem float
+
+        df[column] = df[column].astype(dtype.capitalize() if missing.any() else dtype)
+
+    return df
+
+
+def _compact_undeclared_columns(df, schema):
+    """
+    Reduz os tipos das colunas que nao estao no esquema, sem perder informaçao.
+
+    - Texto com poucos valores distintos (CATEGORY_MAX_RATIO) vira categorico.
+    - Inteiros (ou floats com valores inteiros e sem nulos) cabendo em int32 viram int32.
+      Nao se usa um inteiro menor para que operaçoes entre colunas nao estourem.
+    - float64 vira float32 quando todos os valores sao representados exatamente.
+    """
+    for column in df.columns:
+        if column in schema:
+            continue
+
+        series = df[column]
+        dtype = series.dtype
+
+        if isinstance(dtype, pd.CategoricalDtype):
+            continue
+
+        if pd.api.types.is_string_dtype(dtype) or dtype == object:
+            if series.nunique(dropna=True) <= CATEGORY_MAX_RATIO * len(series):
+                df[column] = series.astype('category')
+            continue
+
+        if dtype.kind not in 'iuf' or dtype.itemsize <= 4:
+            continue
+
+        values = series.to_numpy()
+        if dtype.kind == 'f' and np.isnan(values).any():
+            is_integer = False
+        else:
+            is_integer = dtype.kind in 'iu' or np.array_equal(values, np.trunc(values))
+
+        if is_integer and (len(values) == 0 or (values.min() >= _INT32_MIN and values.max() <= _INT32_MAX)):
+            df[column] = series.astype(np.int32)
+        elif dtype.kind == 'f':
+            compact = values.astype(np.float32)
+            if np.array_equal(compact.astype(np.float64), values, equal_nan=True):
+                df[column] = compact
+
+    return df
+
+
+def default_dtypes_nbytes(df):
+    """
+    Estima a memoria que o DataFrame ocuparia com os tipos padrao do pandas
+    (int64/float64 e texto), para comparar com os tipos reduzidos pelo carregador.
+
+    Args:
+        df (DataFrame): DataFrame carregado por load_csv.
+
+    Returns:
+        int: Tamanho estimado em bytes.
+    """
+    total = 0
+    for column in df.columns:
+        series = df[column]
+        dtype = series.dtype
+
+        if isinstance(dtype, pd.CategoricalDtype) and pd.api.types.is_string_dtype(dtype.categories.dtype):
+            # Texto: bytes de cada valor mais o offset (8 bytes) por linha
+            lengths = np.append(dtype.categories.str.len().to_numpy(dtype=np.int64), 0)
+            total += int(lengths[series.cat.codes.to_numpy()].sum()) + 8 * len(series)
+        elif pd.api.types.is_bool_dtype(dtype):
+            total += len(series)
+        elif dtype.kind in 'iuf' or pd.api.types.is_numeric_dtype(dtype):
+            total += 8 * len(series)
+        else:
+            total += int(series.memory_usage(index=False, deep=True))
+
+    return total
+
+
+def memory_report(df):
+    """
+    Memoria de um DataFrame carregado, com os tipos reduzidos e com os tipos padrao do pandas.
+
+    Args:
+        df (DataFrame): DataFrame carregado por load_csv.
+
+    Returns:
+        dict: 'rows', 'payload_bytes' (memoria atual) e 'baseline_bytes' (tipos padrao, estimada).
+    """
+    return {
+        'rows': len(df),
+        'payload_bytes': int(df.memory_usage(index=False, deep=True).sum()),
+        'baseline_bytes': default_dtypes_nbytes(df),
+    }
+
+
+def _arrow_to_pandas(table, schema):
+    """
+    Converte uma tabela (ou lote) Arrow para DataFrame com os nomes de colunas normalizados.
+    """
+    df = table.to_pandas()
+    df.columns = df.columns.str.strip()
+    return _cast_integer_columns(df, schema)
+
+
+def _read_arrow(data, schema, columns):
+    """
+    Le o CSV com o parser multi-thread do pyarrow, aplicando os tipos do esquema.
+    """
+    table = pa_csv.read_csv(
+        io.BytesIO(data),
+        read_options=pa_csv.ReadOptions(use_threads=True),
+        convert_options=_convert_options(_read_header(data), schema, columns),
+    )
+    return _arrow_to_pandas(table, schema)
+
+
+def _read_pandas(data, schema, columns):
+    """
+    Leitura com o parser do pandas, usada quando o pyarrow nao consegue ler o arquivo.
+    """
+    usecols = None if columns is None else (lambda name: name.strip() in columns)
+    df = pd.read_csv(io.BytesIO(data), usecols=usecols)
+    df.columns = df.columns.str.strip()
+
+    for column, dtype in schema.items():
+        if column in df.columns and not dtype.startswith('int'):
+            df[column] = df[column].astype(dtype)
+
+    return _cast_integer_columns(df, schema)
+
+
+def _parse_csv(data, schema_key, columns=None):
+    """
+    Le e normaliza o CSV: aplica o esquema, reduz os tipos das demais colunas, remove
+    espaços dos cabeçalhos e ordena pelas execuçoes.
+    Se `columns` for informado, apenas essas colunas sao lidas do arquivo.
+    """
+    schema = FILE_SCHEMAS.get(schema_key, {})
+
+    try:
+        df = _read_arrow(data, schema, columns)
+    except (pa.ArrowInvalid, UnicodeDecodeError):
+        df = _read_pandas(data, schema, columns)
+
+    df = _compact_undeclared_columns(df, schema)
+
+    if "Numero da execucao" in df.columns:
+        df = df.sort_values(by="Numero da execucao")
+
+    return df
+
+
+def load_csv(file, columns=None, cache=True):
+    """
+    Carrega um arquivo CSV da simulaçao usando o cache de DataFrames.
+
+    O cache e indexado pelo conteudo do arquivo (ver content_digest), pelo esquema e pela versao
+    do carregador, entao o mesmo arquivo enviado em simulaçoes diferentes (ou em um
+    novo rerun do Streamlit) nao e lido novamente. As colunas seguem os tipos
+    declarados em FILE_SCHEMAS; as demais tem o tipo reduzido sem perda (inteiros e
+    float32 quando possivel, texto repetido como categorico).
+
+    Args:
+        file (UploadedFile or DiskFile): O arquivo CSV.
+        columns (list, optional): Colunas a serem lidas (sem os espaços do cabeçalho).
+            Por padrao todas as colunas sao lidas.
+        cache (bool): Se False, o DataFrame nao e lido nem guardado no cache.
+
+    Returns:
+        DataFrame: DataFrame normalizado.
+    """
+    schema_key = get_schema_key(file.name)
+    columns = None if columns is None else frozenset(columns)
+
+    if not cache:
+        return _parse_csv(file.getvalue(), schema_key, columns)
+
+    key = (LOADER_VERSION, schema_key, columns, content_digest(file))
+
+    # Arquivos em disco so sao lidos quando nao estao no cache
+    df = _PARSE_CACHE.get(key)
+    if df is None:
+        df = _parse_csv(file.getvalue(), schema_key, columns)
+        _PARSE_CACHE.put(key, df)
+
+    # Copia rasa: as funçoes de calculo alteram colunas do DataFrame recebido
+    return df.copy(deep=False)
+
+
+def iter_csv_chunks(file, columns=None, block_size=STREAMING_BLOCK_SIZE):
+    """
+    Le o CSV em blocos, sem carregar o arquivo inteiro em um DataFrame.
+
+    Os blocos passam pelo mesmo esquema e normalizaçao de load_csv, mas nao sao
+    ordenados nem armazenados no cache.
+
+    Args:
+        file (UploadedFile or DiskFile): O arquivo CSV.
+        columns (list, optional): Colunas a serem lidas (sem os espaços do cabeçalho).
+        block_size (int): Tamanho aproximado de cada bloco em bytes.
+
+    Yields:
+        DataFrame: Bloco do arquivo.
+    """
+    schema = FILE_SCHEMAS.get(get_schema_key(file.name), {})
+    columns = None if columns is None else frozenset(columns)
+
+    with (file.open() if isinstance(file, DiskFile) else contextlib.nullcontext(file)) as stream:
+        stream.seek(0)
+        header = _read_header(stream.readline())
+        stream.seek(0)
+
+        reader = pa_csv.open_csv(
+            stream,
+            read_options=pa_csv.ReadOptions(use_threads=True, block_size=block_size),
+            convert_options=_convert_options(header, schema, columns),
+        )
+        for batch in reader:
+            yield _arrow_to_pandas(batch, schema)
+
+
+def clear_cache():
+    """
+    Limpa o cache de DataFrames.
+    """
+    _PARSE_CACHE.clear()
@@ -0,0 +1,118 @@
+# Importando as funçoes de cada grafico
+from src.visualization.execution.collision_rate_per_execution import calculate_collision_rate_per_execution, plot_collision_rate_per_execution
+from src.visualization.execution.drone_density_per_execution import calculate_drone_density_per_execution, plot_drone_density_per_execution
+from src.visualization.execution.duration_successful_trips_per_execution import DURATION_PER_EXECUTION_SPEC, calculate_duration_successful_trips_per_execution, plot_duration_successful_trips_per_execution
+from src.visualization.execution.time_successful_trips_stable_per_execution import calculate_time_successful_trips_stable_per_execution, plot_time_successful_trips_stable_per_execution
+from src.visualization.simulation.collision_position_simulation import calculate_collision_position, plot_collision_position
+from src.visualization.simulation.collision_rate_per_simulation import calculate_collision_rate_per_simulation, plot_collision_rate_per_simulation
+from src.visualization.simulation.collisions_per_situation import calculate_collisions_per_situation, plot_collisions_per_situation
+from src.visualization.simulation.drone_density_per_simulation import calculate_drone_density_per_simulation, plot_drone_density_per_simulation
+from src.visualization.simulation.duration_successful_trips_per_simulation import DURATION_PER_SIMULATION_SPEC, calculate_duration_successful_trips_per_simulation, plot_duration_successful_trips_per_simulation
+from src.visualization.simulation.flight_height_per_simulation import calculate_flight_height, plot_flight_height
+from src.visualization.simulation.plot_number_of_detected_drones_at_collision_poisson_simulation import DETECTED_DRONES_SPEC, calculate_detected_drones_simulation, plot_dected_drones_per_simulation
+from src.visualization.simulation.plot_max_height_simulation import MAX_HEIGHT_SPEC, calculate_max_height_simulation, plot_max_height_simulation
+
+
+# Mapeamento dos nomes de arquivos com as funçoes correspondentes.
+# 'columns' lista as colunas que a funçao de calculo le do arquivo.
+# 'streaming' (opcional) habilita a versao em blocos (src.processing.streaming). E um dicionario
+# *_SPEC declarado no modulo da funçao de calculo, que o usa no proprio calculo:
+#   'column': coluna resumida por execuçao;
+#   'dropna': colunas cujas linhas com NaN sao descartadas (NaN em 'column' sempre e ignorado);
+#   'ddof': graus de liberdade do desvio padrao;
+#   'finalize': formato do resultado ('per_execution', 'total' ou 'mean_of_executions').
+MAP_FUNCTIONS = {
+    'droneCollisionData': [
+        {
+            'function_name': calculate_collisions_per_situation,
+            'plot': plot_collisions_per_situation,
+            'columns': ['Numero da execucao', 'etapa da viagem dos pares que colidiram1', 'etapa da viagem dos pares que colidiram2'],
+        },
+        {
+            'function_name': calculate_detected_drones_simulation,
+            'plot': plot_dected_drones_per_simulation,
+            'columns': ['Numero da execucao', 'numero de drones detectados na colisao'],
+            'streaming': DETECTED_DRONES_SPEC,
+        },
+        {
+            'function_name': calculate_collision_position,
+            'plot': plot_collision_position,
+            'columns': ['posicao da colisao no eixo x', 'posicao da colisao no eixo z'],
+        },
+    ],
+    'generalSimulationData': [
+        {
+            'function_name': calculate_collision_rate_per_execution,
+            'plot': plot_collision_rate_per_execution,
+            'columns': ['Numero da execucao', 'numero total de drones colidentes', 'numero de drones lancados no tempo estavel'],
+        },
+        {
+            'function_name': calculate_collision_rate_per_simulation,
+            'plot': plot_collision_rate_per_simulation,
+            'columns': ['numero total de drones colidentes', 'numero total de drones lancados'],
+        },
+        {
+            'function_name': calculate_drone_density_per_execution,
+            'plot': plot_drone_density_per_execution,
+            'columns': ['Numero da execucao', 'numero total de drones lancados'],
+        },
+        {
+            'function_name': calculate_drone_density_per_simulation,
+            'plot': plot_drone_density_per_simulation,
+            'columns': ['numero total de drones lancados'],
+        },
+    ],
+    'generalDroneData': [
+        {
+            'function_name': calculate_duration_successful_trips_per_execution,
+            'plot': plot_duration_successful_trips_per_execution,
+            'columns': ['Numero da execucao', 'drone ID', 'tempo de viagem total dos drones no tempo estavel'],
+            'streaming': DURATION_PER_EXECUTION_SPEC,
+        },
+        {
+            'function_name': calculate_duration_successful_trips_per_simulation,
+            'plot': plot_duration_successful_trips_per_simulation,
+            'columns': ['drone ID', 'tempo de viagem total dos drones no tempo estavel'],
+            'streaming': DURATION_PER_SIMULATION_SPEC,
+        },
+        {
+            'function_name': calculate_time_successful_trips_stable_per_execution,
+            'plot': plot_time_successful_trips_stable_per_execution,
+            'columns': ['tempo de viagem total dos drones no tempo estavel'],
+        },
+        {
+            'function_name': calculate_flight_height,
+            'plot': plot_flight_height,
+            'columns': ['altitude maxima atingida', 'altitude minima atingida'],
+        },
+        {
+            'function_name': calculate_max_height_simulation,
+            'plot': plot_max_height_simulation,
+            'columns': ['altitude maxima atingida'],
+            'streaming': MAX_HEIGHT_SPEC,
+        },
+    ],
+}
+
+# Funçoes de plot indexadas pelo nome, usado para reconstruir os graficos a partir dos resultados
+PLOT_FUNCTIONS = {
+    func_dict['plot'].__name__: func_dict['plot']
+    for funcs in MAP_FUNCTIONS.values()
+    for func_dict in funcs
+}
+
+
+def required_columns(functions):
+    """
+    Retorna a uniao das colunas usadas pelas funçoes de um arquivo.
+
+    Args:
+        functions (list): Lista de funçoes de MAP_FUNCTIONS para o arquivo.
+
+    Returns:
+        list: Colunas necessarias, sempre incluindo "Numero da execucao" para a ordenaçao.
+    """
+    columns = {"Numero da execucao"}
+    for func_dict in functions:
+        columns.update(func_dict['columns'])
+    return sorted(columns)
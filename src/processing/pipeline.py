@@ -0,0 +1,435 @@
+import inspect
+import os
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from src.processing.instrumentation import StageTimings
+from src.processing.loader import LOADER_VERSION, content_digest, load_csv, memory_report
+from src.processing.map_functions import MAP_FUNCTIONS, required_columns
+from src.processing.streaming import stream_functions, supports_streaming, use_streaming
+from src.utils.cache import DiskCache, LRUCache
+from src.utils.hashing import hash_value, value_nbytes
+
+
+"""
+    Pipeline de calculo das metricas, sem dependencia do Streamlit.
+    Usado pela analise completa do dashboard e pela CLI (src.processing.batch).
+    As mensagens de erro e aviso sao devolvidas para quem chama exibi-las.
+"""
+
+
+# Parametros da execuçao paralela: entradas pequenas sao processadas em serie,
+# pois o custo de enviar os arquivos aos processos supera o ganho.
+PARALLEL_MIN_JOBS = 4
+PARALLEL_MIN_BYTES = 16 * 1024 ** 2
+# Jobs enviados ao pool por processo ainda sem resultado: limita a memoria ocupada
+# pelos jobs (e pelos CSVs enviados) em varreduras com centenas de arquivos
+PARALLEL_PENDING_PER_WORKER = 2
+
+# Orçamento de memoria do cache de resultados (256 MB)
+RESULTS_CACHE_MAX_BYTES = 256 * 1024 ** 2
+
+# Resultados por arquivo, indexados pelo hash do conteudo: evitam recalcular as
+# metricas nos reruns do Streamlit (ex: ao alternar o layout de artigo)
+_RESULTS_CACHE = LRUCache(RESULTS_CACHE_MAX_BYTES, sizeof=value_nbytes)
+
+# Armazenamento em disco dos resultados, que sobrevive ao reinicio do dashboard.
+# O diretorio pode ser trocado pela variavel de ambiente (vazia desativa o armazenamento)
+# Os valores sao gravados com pickle: o diretorio deve ser privado do usuario do dashboard
+# (ver DiskCache), caso contrario o armazenamento fica desativado
+_RESULTS_STORE_ENV = "FLUTESIM_RESULTS_STORE"
+RESULTS_STORE_DIR = os.environ.get(
+    _RESULTS_STORE_ENV, os.path.join(os.path.expanduser("~"), ".cache", "flutesim", "results")
+)
+RESULTS_STORE_MAX_BYTES = 2 * 1024 ** 3
+
+# Versao dos resultados gravados. A versao de cada funçao e o hash do codigo do seu
+# modulo, entao alteraçoes nas funçoes invalidam seus resultados automaticamente;
+# alterar este valor invalida todos (ex: mudanças em src/utils/stats.py)
+RESULTS_STORE_VERSION = 1
+
+_RESULTS_STORE = DiskCache(RESULTS_STORE_DIR or None, RESULTS_STORE_MAX_BYTES)
+
+_FUNCTION_VERSIONS = {}
+
+
+def find_file_key(file_name):
+    """
+    Retorna a chave de MAP_FUNCTIONS correspondente ao arquivo, ou None.
+    """
+    for key in MAP_FUNCTIONS:
+        if key in file_name:
+            return key
+    return None
+
+
+def function_version(func):
+    """
+    Versao de uma funçao de calculo: hash do codigo-fonte do modulo onde ela esta definida.
+    """
+    if func not in _FUNCTION_VERSIONS:
+        try:
+            source = inspect.getsource(inspect.getmodule(func))
+        except (OSError, TypeError):
+            source = func.__qualname__
+        _FUNCTION_VERSIONS[func] = hash_value(source)
+    return _FUNCTION_VERSIONS[func]
+
+
+def _store_key(digest, func, streaming):
+    version = function_version(func)
+    if streaming:
+        # No modo streaming o valor tambem depende do codigo de src.processing.streaming
+        version = (version, function_version(stream_functions))
+    return (RESULTS_STORE_VERSION, LOADER_VERSION, digest, func.__name__, version)
+
+
+def _stored_functions(key, streaming):
+    if streaming:
+        return [f for f in MAP_FUNCTIONS[key] if supports_streaming(f)]
+    return MAP_FUNCTIONS[key]
+
+
+def _skipped_warnings(file, functions):
+    return [
+        f"A analise {func_dict['function_name'].__name__} não suporta o modo streaming "
+        f"e foi ignorada para o arquivo {file.name}."
+        for func_dict in functions
+        if not supports_streaming(func_dict)
+    ]
+
+
+def _memory_records(records, sim_name, file_name):
+    """
+    Copia as mediçoes de memoria de um arquivo (etapa 'memory') para reexibi-las quando
+    os resultados vem do cache ou do armazenamento em disco.
+    """
+    return [
+        {**record, 'simulation_name': sim_name, 'file_name': file_name, 'wall_s': 0.0}
+        for record in records
+        if record['stage'] == 'memory'
+    ]
+
+
+def _load_stored(sim_name, file, key, digest, streaming):
+    """
+    Le do armazenamento em disco os resultados de todas as funçoes de um arquivo.
+
+    Returns:
+        tuple: (resultados, erros, avisos, mediçoes de memoria), ou None se algum
+        resultado nao estiver gravado.
+    """
+    results = []
+    for func_dict in _stored_functions(key, streaming):
+        calc_func = func_dict['function_name']
+        stored = _RESULTS_STORE.get(_store_key(digest, calc_func, streaming))
+        if stored is None:
+            return None
+
+        results.append({
+            'simulation_name': sim_name,
+            'file_name': file.name,
+            'function_name': calc_func.__name__,
+            'value': stored['value'],
+            'plot_function': func_dict['plot'].__name__
+        })
+
+    warnings = _skipped_warnings(file, MAP_FUNCTIONS[key]) if streaming else []
+    memory = _RESULTS_STORE.get(_memory_key(digest, key), [])
+    return results, [], warnings, _memory_records(memory, sim_name, file.name)
+
+
+def _memory_key(digest, key):
+    return (RESULTS_STORE_VERSION, LOADER_VERSION, digest, key, 'memory')
+
+
+def _save_stored(key, digest, streaming, results, records):
+    """
+    Grava no armazenamento em disco os resultados calculados de um arquivo e suas
+    mediçoes de memoria.
+    """
+    functions = {f['function_name'].__name__: f['function_name'] for f in MAP_FUNCTIONS[key]}
+    for result in results:
+        calc_func = functions[result['function_name']]
+        _RESULTS_STORE.put(_store_key(digest, calc_func, streaming), {'value': result['value']})
+
+    memory = [record for record in records if record['stage'] == 'memory']
+    if memory:
+        _RESULTS_STORE.put(_memory_key(digest, key), memory)
+
+
+def _run_file_functions(sim_name, file_name, key, df):
+    """
+    Executa as funçoes de calculo associadas a um arquivo.
+
+    Pode rodar em outro processo. Os erros de cada funçao sao devolvidos como
+    mensagens para serem exibidos pelo processo principal.
+
+    Args:
+        sim_name (str): Nome da simulaçao.
+        file_name (str): Nome do arquivo.
+        key (str): Chave do arquivo em MAP_FUNCTIONS.
+        df (DataFrame): DataFrame carregado do arquivo.
+
+    Returns:
+        tuple: Listas de resultados, mensagens de erro, mensagens de aviso e mediçoes de tempo.
+    """
+    results = []
+    errors = []
+    timings = StageTimings()
+
+    for func_dict in MAP_FUNCTIONS[key]:
+        calc_func = func_dict['function_name']
+        plot_func = func_dict['plot']
+
+        func_name = calc_func.__name__
+        plot_func_name = plot_func.__name__
+
+        try:
+            with timings.stage('calculate', sim_name, file_name, func_name, rows=len(df)) as record:
+                value = calc_func(df)
+                record['payload_bytes'] = value_nbytes(value)
+            result = {
+                'simulation_name': sim_name,
+                'file_name': file_name,
+                'function_name': func_name,
+                'value': value,
+                'plot_function': plot_func_name
+            }
+            results.append(result)
+
+        except Exception as e:
+            errors.append(f"Erro ao processar {func_name} no arquivo {file_name}: {e}")
+
+    return results, errors, [], timings.records
+
+
+def _run_job(job, cache_frames=True):
+    """
+    Le o CSV de um job e executa suas funçoes de calculo. Roda no pool de processos,
+    entao a leitura do arquivo tambem e paralela.
+
+    Args:
+        job (tuple): (simulaçao, arquivo, chave) montado por collect_jobs.
+        cache_frames (bool): Se True, usa o cache de DataFrames do carregador. Nos processos
+            do pool o cache fica desligado, pois os DataFrames ficariam presos nos processos.
+
+    Returns:
+        tuple: Listas de resultados, mensagens de erro, mensagens de aviso e mediçoes de tempo.
+    """
+    sim_name, file, key = job
+    timings = StageTimings()
+
+    try:
+        with timings.stage('parse', sim_name, file.name) as record:
+            df = load_csv(file, columns=required_columns(MAP_FUNCTIONS[key]), cache=cache_frames)
+            record['rows'] = len(df)
+    except Exception as e:
+        return [], [f"Erro ao processar o arquivo {file.name}: {e}"], [], timings.records
+
+    # Memoria com os tipos reduzidos e com os tipos padrao, medida fora da etapa de leitura
+    with timings.stage('memory', sim_name, file.name) as record:
+        record.update(memory_report(df))
+
+    results, errors, warnings, records = _run_file_functions(sim_name, file.name, key, df)
+    return results, errors, warnings, timings.records + records
+
+
+def _run_pool_job(job):
+    return _run_job(job, cache_frames=False)
+
+
+# Pool de processos reaproveitado entre as chamadas (e os reruns do Streamlit)
+_POOL = None
+_POOL_WORKERS = None
+_POOL_LOCK = threading.Lock()
+
+
+def _get_pool(max_workers):
+    """
+    Retorna o pool de processos compartilhado, recriando-o se o numero de processos mudar.
+    """
+    global _POOL, _POOL_WORKERS
+
+    with _POOL_LOCK:
+        if _POOL is None or _POOL_WORKERS != max_workers:
+            if _POOL is not None:
+                _POOL.shutdown(wait=False)
+            _POOL = ProcessPoolExecutor(max_workers=max_workers)
+            _POOL_WORKERS = max_workers
+        return _POOL
+
+
+def _map_bounded(pool, func, items, max_pending):
+    """
+    Como pool.map (resultados na ordem de `items`), mas com no maximo `max_pending`
+    tarefas enviadas e ainda nao consumidas.
+    """
+    futures = deque()
+    for item in items:
+        if len(futures) >= max_pending:
+            yield futures.popleft().result()
+        futures.append(pool.submit(func, item))
+
+    while futures:
+        yield futures.popleft().result()
+
+
+def _reset_pool():
+    """
+    Descarta o pool (ex: apos um processo morrer), para que a proxima chamada crie outro.
+    """
+    global _POOL
+
+    with _POOL_LOCK:
+        if _POOL is not None:
+            _POOL.shutdown(wait=False)
+        _POOL = None
+
+
+def _run_streaming_job(sim_name, file, key):
+    """
+    Calcula as metricas de um arquivo grande lendo-o em blocos (ver src.processing.streaming).
+    """
+    results = []
+    warnings = []
+    timings = StageTimings()
+
+    try:
+        with timings.stage('streaming', sim_name, file.name) as record:
+            values, skipped = stream_functions(file, MAP_FUNCTIONS[key])
+            record['payload_bytes'] = value_nbytes(values)
+    except Exception as e:
+        return results, [f"Erro ao processar o arquivo {file.name}: {e}"], warnings, timings.records
+
+    warnings.extend(_skipped_warnings(file, skipped))
+
+    for func_dict in MAP_FUNCTIONS[key]:
+        func_name = func_dict['function_name'].__name__
+        if func_name in values:
+            results.append({
+                'simulation_name': sim_name,
+                'file_name': file.name,
+                'function_name': func_name,
+                'value': values[func_name],
+                'plot_function': func_dict['plot'].__name__
+            })
+
+    return results, [], warnings, timings.records
+
+
+def collect_jobs(list_simulation):
+    """
+    Monta a lista de jobs (simulaçao, arquivo, chave) na ordem das simulaçoes e arquivos.
+
+    Args:
+        list_simulation (list): Lista de simulaçoes ({'name', 'files'}).
+
+    Returns:
+        tuple: Lista de jobs e lista de avisos dos arquivos sem funçoes associadas.
+    """
+    jobs = []
+    warnings = []
+
+    for simulation in list_simulation:
+        for file in simulation['files']:
+            key = find_file_key(file.name)
+
+            if key is None:
+                warnings.append(f"O arquivo {file.name} não tem funçoes associadas.")
+                continue
+
+            jobs.append((simulation['name'], file, key))
+
+    return jobs, warnings
+
+
+def run_jobs(jobs, max_workers=None, cache_frames=True):
+    """
+    Executa os jobs em serie ou em um pool de processos.
+
+    Arquivos ja processados sao lidos do cache de resultados ou, apos um reinicio, do
+    armazenamento em disco; os novos resultados sao gravados nele. Arquivos grandes sao
+    processados em blocos no processo principal; os demais sao enviados ao pool, que
+    le o CSV e calcula as metricas.
+
+    Args:
+        jobs (list): Lista de jobs montada por collect_jobs.
+        max_workers (int, optional): Numero de processos. Padrao e o numero de CPUs.
+        cache_frames (bool): Se False, os DataFrames lidos em serie nao ficam no cache do
+            carregador e sao descartados apos o calculo (ex: varreduras da CLI).
+
+    Returns:
+        list: Tuplas (resultados, erros, avisos, mediçoes de tempo) na mesma ordem dos jobs.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    outputs = [None] * len(jobs)
+    cache_keys = [None] * len(jobs)
+    digests = [None] * len(jobs)
+    pending = []
+
+    for i, (sim_name, file, key) in enumerate(jobs):
+        timings = StageTimings()
+
+        with timings.stage('cache', sim_name, file.name):
+            digests[i] = content_digest(file)
+            cache_keys[i] = (LOADER_VERSION, key, digests[i])
+            cached = _RESULTS_CACHE.get(cache_keys[i])
+
+        if cached is not None:
+            results, errors, warnings, cached_records = cached
+            outputs[i] = (
+                [{**result, 'simulation_name': sim_name, 'file_name': file.name} for result in results],
+                errors,
+                warnings,
+                timings.records + _memory_records(cached_records, sim_name, file.name),
+            )
+            continue
+
+        streaming = use_streaming(file)
+        with timings.stage('store', sim_name, file.name):
+            stored = _load_stored(sim_name, file, key, digests[i], streaming)
+
+        if stored is not None:
+            results, errors, warnings, memory = stored
+            outputs[i] = (results, errors, warnings, timings.records + memory)
+            _RESULTS_CACHE.put(cache_keys[i], outputs[i])
+        elif streaming:
+            results, errors, warnings, job_records = _run_streaming_job(sim_name, file, key)
+            outputs[i] = (results, errors, warnings, timings.records + job_records)
+            _RESULTS_CACHE.put(cache_keys[i], outputs[i])
+            _save_stored(key, digests[i], True, results, [])
+        else:
+            pending.append((i, jobs[i], timings.records))
+
+    payloads = [payload for _, payload, _ in pending]
+    total_bytes = sum(file.size for _, file, _ in payloads)
+    parallel = (
+        max_workers > 1
+        and len(payloads) >= PARALLEL_MIN_JOBS
+        and total_bytes >= PARALLEL_MIN_BYTES
+    )
+
+    # Os jobs sao executados sob demanda: cada DataFrame so existe durante o seu calculo
+    if parallel:
+        # A ordem dos resultados e a dos jobs, mantendo os resultados deterministicos
+        payload_outputs = _map_bounded(
+            _get_pool(max_workers), _run_pool_job, payloads, max_workers * PARALLEL_PENDING_PER_WORKER
+        )
+    else:
+        payload_outputs = (_run_job(payload, cache_frames=cache_frames) for payload in payloads)
+
+    try:
+        for (i, _, records), (results, errors, warnings, job_records) in zip(pending, payload_outputs):
+            outputs[i] = (results, errors, warnings, records + job_records)
+            _RESULTS_CACHE.put(cache_keys[i], outputs[i])
+            _save_stored(jobs[i][2], digests[i], False, results, job_records)
+    except BrokenProcessPool:
+        _reset_pool()
+        raise
+
+    return outputs
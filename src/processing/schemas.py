@@ -0,0 +1,60 @@
+# Registro dos esquemas dos arquivos do FluteSim.
+# As chaves sao as mesmas usadas em MAP_FUNCTIONS e as colunas usam os nomes
+# ja sem os espaços do cabeçalho original. Colunas nao declaradas tem o tipo inferido.
+
+FILE_SCHEMAS = {
+    'droneCollisionData': {
+        'Numero da execucao': 'int32',
+        'etapa da viagem dos pares que colidiram1': 'int8',
+        'etapa da viagem dos pares que colidiram2': 'int8',
+        'numero de drones detectados na colisao': 'int32',
+        'posicao da colisao no eixo x': 'float32',
+        'posicao da colisao no eixo y': 'float32',
+        'posicao da colisao no eixo z': 'float32',
+        'modelo': 'category',
+    },
+    'generalSimulationData': {
+        'Numero da execucao': 'int32',
+        'numero total de drones lancados': 'int32',
+        'numero de drones lancados no tempo estavel': 'int32',
+        'numero total de drones colidentes': 'int32',
+    },
+    'generalDroneData': {
+        'Numero da execucao': 'int32',
+        'drone ID': 'int32',
+        'tempo de viagem total dos drones no tempo estavel': 'float32',
+        'altitude maxima atingida': 'float32',
+        'altitude minima atingida': 'float32',
+        'modelo': 'category',
+    },
+}
+
+
+# Esquema dos logs de trajetoria (Log_Path_drone <drone>_<simulacao>.csv), usado pelo
+# armazenamento colunar de trajetorias (src.processing.trajectory_store).
+TRAJECTORY_SCHEMA = {
+    'simulation': 'int32',
+    'time': 'float32',
+    'x': 'float32',
+    'y': 'float32',
+    'z': 'float32',
+    'collisionApproach': 'int16',
+    'modelName': 'category',
+    'droneName': 'category',
+}
+
+
+def get_schema_key(file_name):
+    """
+    Retorna a chave do esquema correspondente ao nome do arquivo.
+
+    Args:
+        file_name (str): Nome do arquivo enviado.
+
+    Returns:
+        str or None: Chave de FILE_SCHEMAS ou None se o arquivo nao for reconhecido.
+    """
+    for key in FILE_SCHEMAS:
+        if key in file_name:
+            return key
+    return None
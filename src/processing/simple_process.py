@@ -1,87 +1,34 @@
 import streamlit as st
-import pandas as pd
-
-# Importando as funçoes de cada grafico
-from src.visualization.execution.collision_rate_per_execution import calculate_collision_rate_per_execution, plot_collision_rate_per_execution
-from src.visualization.execution.drone_density_per_execution import calculate_drone_density_per_execution, plot_drone_density_per_execution
-from src.visualization.execution.duration_successful_trips_per_execution import calculate_duration_successful_trips_per_execution, plot_duration_successful_trips_per_execution
-from src.visualization.execution.time_successful_trips_stable_per_execution import calculate_time_successful_trips_stable_per_execution, plot_time_successful_trips_stable_per_execution
-from src.visualization.simulation.collision_rate_per_simulation import calculate_collision_rate_per_simulation, plot_collision_rate_per_simulation
-from src.visualization.simulation.collisions_per_situation import calculate_collisions_per_situation, plot_collisions_per_situation
-from src.visualization.simulation.drone_density_per_simulation import calculate_drone_density_per_simulation, plot_drone_density_per_simulation
-from src.visualization.simulation.duration_successful_trips_per_simulation import calculate_duration_successful_trips_per_simulation, plot_duration_successful_trips_per_simulation
-from src.visualization.simulation.flight_height_per_simulation import calculate_flight_height, plot_flight_height
-from src.visualization.simulation.plot_number_of_detected_drones_at_collision_poisson_simulation import calculate_detected_drones_simulation, plot_dected_drones_per_simulation
-from src.visualization.simulation.plot_max_height_simulation import calculate_max_height_simulation, plot_max_height_simulation
-
-
-# Mapeamento dos nomes de arquivos com as funçoes correspondentes
-MAP_FUNCTIONS = {
-    'droneCollisionData': [
-        {
-            'function_name': calculate_collisions_per_situation,
-            'plot': plot_collisions_per_situation,
-        },
-        {
-            'function_name': calculate_detected_drones_simulation,
-            'plot': plot_dected_drones_per_simulation,
-        },
-    ],
-    'generalSimulationData': [
-        {
-            'function_name': calculate_collision_rate_per_execution,
-            'plot': plot_collision_rate_per_execution,
-        },
-        {
-            'function_name': calculate_collision_rate_per_simulation,
-            'plot': plot_collision_rate_per_simulation,
-        },
-        {
-            'function_name': calculate_drone_density_per_execution,
-            'plot': plot_drone_density_per_execution,
-        },
-        {
-            'function_name': calculate_drone_density_per_simulation,
-            'plot': plot_drone_density_per_simulation,
-        },
-    ],
-    'generalDroneData': [
-        {
-            'function_name': calculate_duration_successful_trips_per_execution,
-            'plot': plot_duration_successful_trips_per_execution,
-        },
-        {
-            'function_name': calculate_duration_successful_trips_per_simulation,
-            'plot': plot_duration_successful_trips_per_simulation,
-        },
-        {
-            'function_name': calculate_time_successful_trips_stable_per_execution,
-            'plot': plot_time_successful_trips_stable_per_execution,
-        },
-        {
-            'function_name': calculate_flight_height,
-            'plot': plot_flight_height,
-        },
-        {
-            'function_name': calculate_max_height_simulation,
-            'plot': plot_max_height_simulation,
-        },
-    ],
-}
+
+from src.processing.loader import load_csv, memory_report
+from src.processing.map_functions import MAP_FUNCTIONS, required_columns
+from src.processing.streaming import stream_functions, use_streaming
 
 
 def _display_plots(file, functions):
     """
     Carrega o arquivo CSV e exibe os graficos correspondentes.
+    Arquivos grandes sao lidos em blocos e apenas as metricas escalares sao exibidas.
 
     Args:
         file (UploadedFile): O arquivo CSV enviado pelo usuario.
         functions (list): Lista de funçoes para gerar os graficos.
     """
     try:
-        df = pd.read_csv(file)
-        df.columns = df.columns.str.strip()
-        df = df.sort_values(by="Numero da execucao")
+        if use_streaming(file):
+            df = None
+            streamed_values, skipped = stream_functions(file, functions)
+        else:
+            df = load_csv(file, columns=required_columns(functions))
+            skipped = []
+
+            # Memoria do arquivo com os tipos reduzidos e com os tipos padrao do pandas
+            report = memory_report(df)
+            st.caption(
+                f"Memoria: {report['payload_bytes'] / 1024 ** 2:.2f} MB "
+                f"(tipos padrao: {report['baseline_bytes'] / 1024 ** 2:.2f} MB, "
+                f"{report['rows']} linhas)"
+            )
 
         for func_dict in functions:
             calc_func = func_dict['function_name']
@@ -89,8 +36,12 @@ def _display_plots(file, functions):
             func_name = calc_func.__name__
             
             st.subheader(f"Analise: {func_name.replace('_', ' ').capitalize()}")
-            
-            value = calc_func(df)
+
+            if func_dict in skipped:
+                st.warning(f"A analise {func_name} não suporta o modo streaming e foi ignorada.")
+                continue
+
+            value = calc_func(df) if df is not None else streamed_values[func_name]
             fig = plot_func(value)
 
             # Gerar e exibir o grafico
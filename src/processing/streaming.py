@@ -0,0 +1,245 @@
+import numpy as np
+import pandas as pd
+
+from src.processing.loader import STREAMING_BLOCK_SIZE, iter_csv_chunks
+from src.utils.stats import Z_95, group_stats
+
+
+# Arquivos a partir deste tamanho sao processados em blocos (512 MB)
+STREAMING_THRESHOLD_BYTES = 512 * 1024 ** 2
+
+
+class RunningStats:
+    """
+    Acumulador de estatisticas por grupo que pode ser atualizado bloco a bloco e combinado com outros.
+
+    Guarda, para cada grupo, a contagem, a media, a soma dos quadrados dos desvios (M2),
+    o minimo e o maximo. Os blocos sao resumidos de forma vetorizada e combinados com a
+    formula de Chan (versao paralela do algoritmo de Welford), entao a memoria usada
+    depende apenas do numero de grupos.
+    """
+
+    _COLUMNS = ["n", "media", "m2", "minimo", "maximo"]
+
+    def __init__(self):
+        self.table = pd.DataFrame(columns=self._COLUMNS, dtype=np.float64)
+
+    def update(self, values, groups=None):
+        """
+        Adiciona um bloco de valores ao acumulador. Valores NaN sao ignorados.
+
+        Args:
+            values (array-like): Valores do bloco.
+            groups (array-like, optional): Grupo de cada valor. Se None, todos pertencem ao grupo 0.
+        """
+        values = pd.Series(np.asarray(values, dtype=np.float64))
+        groups = np.zeros(len(values), dtype=np.int64) if groups is None else np.asarray(groups)
+
+        grouped = values.groupby(groups)
+        chunk = pd.DataFrame({
+            "n": grouped.count().astype(np.float64),
+            "media": grouped.mean(),
+            "m2": grouped.var(ddof=0) * grouped.count(),
+            "minimo": grouped.min(),
+            "maximo": grouped.max(),
+        })
+        chunk = chunk[chunk["n"] > 0]
+
+        other = RunningStats()
+        other.table = chunk
+        self.merge(other)
+
+    def merge(self, other):
+        """
+        Combina outro acumulador com este.
+
+        Args:
+            other (RunningStats): Acumulador a ser combinado.
+        """
+        if other.table.empty:
+            return
+        if self.table.empty:
+            self.table = other.table.copy()
+            return
+
+        index = self.table.index.union(other.table.index)
+        a = self.table.reindex(index)
+        b = other.table.reindex(index)
+        na = a["n"].fillna(0)
+        nb = b["n"].fillna(0)
+
+        n = na + nb
+        delta = b["media"].fillna(0) - a["media"].fillna(0)
+        media = a["media"].fillna(0) + delta * nb / n
+        m2 = a["m2"].fillna(0) + b["m2"].fillna(0) + delta * delta * na * nb / n
+
+        self.table = pd.DataFrame({
+            "n": n,
+            "media": media,
+            "m2": m2,
+            "minimo": np.fmin(a["minimo"], b["minimo"]),
+            "maximo": np.fmax(a["maximo"], b["maximo"]),
+        })
+
+    def total(self):
+        """
+        Retorna um acumulador com todos os grupos combinados em um so.
+        """
+        total = RunningStats()
+        if self.table.empty:
+            return total
+
+        n = self.table["n"].sum()
+        media = (self.table["n"] * self.table["media"]).sum() / n
+        delta = self.table["media"] - media
+        m2 = self.table["m2"].sum() + (self.table["n"] * delta * delta).sum()
+
+        total.table = pd.DataFrame({
+            "n": [n],
+            "media": [media],
+            "m2": [m2],
+            "minimo": [self.table["minimo"].min()],
+            "maximo": [self.table["maximo"].max()],
+        })
+        return total
+
+    def to_stats(self, ddof=1, z=Z_95):
+        """
+        Converte o acumulador no mesmo formato de group_stats.
+
+        Returns:
+            dict: Dicionario com 'grupos', 'n', 'media', 'desvio_padrao', 'intervalo', 'minimo' e 'maximo'.
+        """
+        table = self.table.sort_index()
+        n = table["n"].to_numpy()
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            desvio_padrao = np.where(n > ddof, np.sqrt(table["m2"].to_numpy() / (n - ddof)), np.nan)
+            intervalo = np.where(n > 0, z * desvio_padrao / np.sqrt(n), 0)
+
+        return {
+            "grupos": table.index.to_numpy(),
+            "n": n.astype(np.int64),
+            "media": table["media"].to_numpy(),
+            "desvio_padrao": desvio_padrao,
+            "intervalo": intervalo,
+            "minimo": table["minimo"].to_numpy(),
+            "maximo": table["maximo"].to_numpy(),
+        }
+
+
+def _finalize_per_execution(acc, ddof):
+    stats = acc.to_stats(ddof=ddof)
+
+    # Descarta execuçoes sem desvio padrao, como em calculate_duration_successful_trips_per_execution
+    valid = ~np.isnan(stats["desvio_padrao"])
+
+    return {
+        "execucoes": stats["grupos"][valid].astype(int),
+        "media": stats["media"][valid],
+        "desvio_padrao": stats["desvio_padrao"][valid],
+        "intervalo": stats["intervalo"][valid]
+    }
+
+
+def _finalize_total(acc, ddof):
+    total = acc.total().to_stats(ddof=ddof)
+    per_execution = acc.to_stats(ddof=ddof)
+
+    # Somas por execuçao usadas pelo bootstrap (ver stats.execution_totals)
+    totals = {
+        "soma_execucoes": per_execution["media"] * per_execution["n"],
+        "n_execucoes": per_execution["n"],
+    }
+
+    if len(total["n"]) == 0:
+        return {"media": np.nan, "desvio_padrao": np.nan, "intervalo": 0, **totals}
+
+    return {
+        "media": total["media"][0],
+        "desvio_padrao": total["desvio_padrao"][0],
+        "intervalo": total["intervalo"][0],
+        **totals
+    }
+
+
+def _finalize_mean_of_executions(acc, ddof):
+    medias = acc.to_stats()["media"]
+    stats = group_stats(medias, ddof=ddof)
+
+    return {
+        "media": stats["media"],
+        "desvio_padrao": stats["desvio_padrao"],
+        "intervalo": stats["intervalo"],
+        "soma_execucoes": medias,
+        "n_execucoes": np.ones(len(medias), dtype=np.int64)
+    }
+
+
+# Conversao do acumulador no mesmo dicionario retornado pela funçao de calculo, indexada
+# pelo 'finalize' da especificaçao 'streaming' (ver MAP_FUNCTIONS)
+_FINALIZE = {
+    'per_execution': _finalize_per_execution,
+    'total': _finalize_total,
+    'mean_of_executions': _finalize_mean_of_executions,
+}
+
+
+def supports_streaming(func_dict):
+    """
+    Indica se a funçao de MAP_FUNCTIONS tem versao em blocos.
+    """
+    return 'streaming' in func_dict
+
+
+def use_streaming(file):
+    """
+    Indica se o arquivo deve ser processado em blocos.
+    """
+    return file.size >= STREAMING_THRESHOLD_BYTES
+
+
+def stream_functions(file, functions, block_size=STREAMING_BLOCK_SIZE):
+    """
+    Calcula as metricas escalares de um arquivo lendo-o em blocos, com memoria constante.
+
+    Todas as metricas sao atualizadas na mesma leitura do arquivo. As funçoes sem
+    especificaçao 'streaming' nao sao calculadas.
+
+    Args:
+        file (UploadedFile): O arquivo CSV.
+        functions (list): Lista de funçoes de MAP_FUNCTIONS para o arquivo.
+        block_size (int): Tamanho aproximado de cada bloco em bytes.
+
+    Returns:
+        tuple: Dicionario {nome da funçao: valor} e lista das funçoes nao suportadas.
+    """
+    specs = {}
+    skipped = []
+    for func_dict in functions:
+        if supports_streaming(func_dict):
+            specs[func_dict['function_name'].__name__] = func_dict['streaming']
+        else:
+            skipped.append(func_dict)
+
+    columns = {"Numero da execucao"}
+    for spec in specs.values():
+        columns.add(spec['column'])
+        columns.update(spec['dropna'])
+
+    accumulators = {func_name: RunningStats() for func_name in specs}
+
+    for chunk in iter_csv_chunks(file, columns=columns, block_size=block_size):
+        execucoes = chunk["Numero da execucao"].to_numpy()
+
+        for func_name, spec in specs.items():
+            values = chunk[spec['column']].to_numpy(dtype=np.float64, na_value=np.nan)
+            if spec['dropna']:
+                values = np.where(chunk[spec['dropna']].notna().all(axis=1).to_numpy(), values, np.nan)
+            accumulators[func_name].update(values, execucoes)
+
+    values = {
+        func_name: _FINALIZE[spec['finalize']](accumulators[func_name], spec['ddof'])
+        for func_name, spec in specs.items()
+    }
+    return values, skipped
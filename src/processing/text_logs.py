@@ -0,0 +1,108 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+
+"""
+    Leitura dos logs em texto das execuçoes (Summary-{i}.txt, numberOfCollisionsPerInterval-{i}.txt,
+    numberOfSuccessfulTripsPerInterval-{i}.txt).
+
+    Cada log e convertido uma unica vez em um array float32 gravado ao lado do arquivo
+    original (`<arquivo>.npy`). Nas leituras seguintes o .npy e aberto com memory map,
+    sem refazer o parse do texto. Os logs ainda sem cache sao lidos em paralelo.
+"""
+
+
+# Versao do formato do cache; alterar invalida os .npy gravados
+TEXT_LOG_CACHE_VERSION = 1
+
+
+def cache_path(path):
+    """
+    Caminho do cache binario de um log.
+    """
+    return f"{path}.v{TEXT_LOG_CACHE_VERSION}.npy"
+
+
+def _cache_is_valid(path, cached):
+    return os.path.exists(cached) and os.path.getmtime(cached) >= os.path.getmtime(path)
+
+
+def parse_text_log(path):
+    """
+    Le um log em texto separado por virgulas como uma matriz float32.
+
+    Valores nao numericos viram NaN.
+
+    Args:
+        path (str): Caminho do log.
+
+    Returns:
+        np.ndarray: Matriz (linhas x colunas) float32.
+    """
+    df = pd.read_csv(path, delimiter=',', header=None)
+    df = df.apply(pd.to_numeric, errors='coerce')
+    return df.to_numpy(dtype=np.float32)
+
+
+def _parse_and_cache(path):
+    data = parse_text_log(path)
+
+    # Grava em um arquivo temporario para que uma leitura interrompida nao deixe cache corrompido
+    cached = cache_path(path)
+    tmp = f"{cached}.{os.getpid()}.tmp.npy"
+    np.save(tmp, data)
+    os.replace(tmp, cached)
+    return data
+
+
+def read_text_logs(paths, max_workers=None):
+    """
+    Le varios logs, usando o cache binario quando ele existe e esta atualizado.
+
+    Args:
+        paths (list): Caminhos dos logs.
+        max_workers (int, optional): Processos usados no parse dos logs sem cache. Padrao e o numero de CPUs.
+
+    Returns:
+        list: Matriz float32 de cada log, na ordem de `paths` (None se o arquivo nao existir).
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    arrays = [None] * len(paths)
+    pending = []
+
+    for i, path in enumerate(paths):
+        if not os.path.exists(path):
+            continue
+        cached = cache_path(path)
+        if _cache_is_valid(path, cached):
+            arrays[i] = np.load(cached, mmap_mode='r')
+        else:
+            pending.append(i)
+
+    pending_paths = [paths[i] for i in pending]
+    if max_workers > 1 and len(pending_paths) > 1:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(pending_paths))) as executor:
+            parsed = list(executor.map(_parse_and_cache, pending_paths))
+    else:
+        parsed = [_parse_and_cache(path) for path in pending_paths]
+
+    for i, data in zip(pending, parsed):
+        arrays[i] = data
+
+    return arrays
+
+
+def read_execution_logs(directory, prefix, num_exec, max_workers=None):
+    """
+    Le os logs `{prefix}-{i}.txt` das execuçoes 0 a num_exec - 1 de um diretorio.
+
+    Returns:
+        list: Matriz float32 de cada execuçao (None se o arquivo nao existir).
+    """
+    paths = [os.path.join(directory, f"{prefix}-{i}.txt") for i in range(num_exec)]
+    return read_text_logs(paths, max_workers=max_workers)
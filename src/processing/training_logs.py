@@ -0,0 +1,141 @@
+import glob
+import os
+
+import numpy as np
+import pandas as pd
+
+from src.processing.discovery import list_subdirectories
+from src.utils.cache import LRUCache
+from src.utils.hashing import value_nbytes
+
+
+"""
+    Leitura dos escalares de treinamento exportados do TensorBoard (Wall time, Step, Value).
+
+    Layout esperado (o mesmo de src/visualization/auxiliar/data):
+
+        <raiz>/
+            rewards/
+                A2C (ReLU, Clip).csv
+                ...
+            entropy/
+            policy_loss/
+            episodes/
+
+    Cada subdiretorio e uma metrica e cada CSV uma execuçao do treinamento. Todos os
+    arquivos sao lidos uma unica vez para uma tabela longa (metrica, execuçao, passo,
+    valor), mantida em cache ate algum arquivo mudar.
+"""
+
+
+TRAINING_LOGS_DIR = os.path.join("src", "visualization", "auxiliar", "data")
+
+# Metricas reconhecidas (subdiretorio -> titulo do eixo)
+TRAINING_METRICS = {
+    "rewards": "Recompensa",
+    "entropy": "Entropia",
+    "policy_loss": "Perda da Política",
+    "episodes": "Duração do Episódio",
+}
+
+TRAINING_COLUMNS = ["metric", "run", "step", "wall_time", "value"]
+
+# Orçamento de memoria do cache das tabelas de treinamento (64 MB)
+TRAINING_CACHE_MAX_BYTES = 64 * 1024 ** 2
+
+_TRAINING_CACHE = LRUCache(TRAINING_CACHE_MAX_BYTES, sizeof=value_nbytes)
+
+
+def training_directories(root=TRAINING_LOGS_DIR):
+    """
+    Diretorios de logs de treinamento dentro de `root`: a propria raiz e os subdiretorios
+    (um nivel) que tem ao menos uma pasta de metrica.
+
+    Returns:
+        list: Caminhos relativos a `root` ("." para a raiz).
+    """
+    candidates = ["."] + list_subdirectories(root)
+    return [
+        directory for directory in candidates
+        if any(os.path.isdir(os.path.join(root, directory, metric)) for metric in TRAINING_METRICS)
+    ]
+
+
+def _log_paths(directory):
+    paths = []
+    for metric in TRAINING_METRICS:
+        paths.extend(sorted(glob.glob(os.path.join(directory, metric, "*.csv"))))
+    return paths
+
+
+def _read_log(path):
+    df = pd.read_csv(path, dtype={"Wall time": np.float64, "Step": np.int64, "Value": np.float32})
+    df.columns = df.columns.str.strip()
+    return pd.DataFrame({
+        "metric": os.path.basename(os.path.dirname(path)),
+        "run": os.path.splitext(os.path.basename(path))[0],
+        "step": df["Step"].to_numpy(),
+        "wall_time": df["Wall time"].to_numpy(),
+        "value": df["Value"].to_numpy(),
+    })
+
+
+def load_training_logs(directory=TRAINING_LOGS_DIR):
+    """
+    Le todos os escalares de treinamento de um diretorio em uma tabela longa.
+
+    O resultado fica em cache, indexado pelo tamanho e data de modificaçao dos arquivos.
+
+    Args:
+        directory (str): Diretorio com um subdiretorio por metrica (TRAINING_METRICS).
+
+    Returns:
+        DataFrame: Colunas TRAINING_COLUMNS, com 'metric' e 'run' categoricas,
+        ordenada por (metric, run, step).
+    """
+    paths = _log_paths(directory)
+    if not paths:
+        raise FileNotFoundError(f"Nenhum log de treinamento encontrado em: {directory}")
+
+    key = tuple((path, os.stat(path).st_size, os.stat(path).st_mtime_ns) for path in paths)
+    df = _TRAINING_CACHE.get(key)
+    if df is not None:
+        return df
+
+    df = pd.concat([_read_log(path) for path in paths], ignore_index=True)
+    df["metric"] = pd.Categorical(df["metric"], categories=list(TRAINING_METRICS))
+    df["run"] = pd.Categorical(df["run"], categories=sorted(df["run"].unique()))
+    df = df.sort_values(["metric", "run", "step"], ignore_index=True)[TRAINING_COLUMNS]
+
+    _TRAINING_CACHE.put(key, df)
+    return df
+
+
+def smooth_training_logs(df, smoothing=0.6, window=None):
+    """
+    Suaviza as curvas de cada (metrica, execuçao) com media movel exponencial.
+
+    A media exponencial e a mesma do TensorBoard (com correçao do viés inicial). As
+    faixas sao o minimo e o maximo dos valores originais em uma janela centrada.
+
+    Args:
+        df (DataFrame): Tabela retornada por load_training_logs (ou um filtro dela).
+        smoothing (float): Peso da suavizaçao, de 0 (sem suavizaçao) a 0.99.
+        window (int, optional): Pontos da janela das faixas. Padrao: 1 / (1 - smoothing).
+
+    Returns:
+        DataFrame: Copia de `df` com as colunas 'ema', 'minimo' e 'maximo'.
+    """
+    if not 0 <= smoothing < 1:
+        raise ValueError("A suavizaçao deve estar entre 0 e 1.")
+
+    if window is None:
+        window = max(int(round(1 / (1 - smoothing))), 1)
+
+    df = df.reset_index(drop=True)
+    groups = df.groupby(["metric", "run"], observed=True, sort=False)["value"]
+
+    df["ema"] = groups.ewm(alpha=1 - smoothing).mean().reset_index(level=[0, 1], drop=True)
+    df["minimo"] = groups.rolling(window, center=True, min_periods=1).min().reset_index(level=[0, 1], drop=True)
+    df["maximo"] = groups.rolling(window, center=True, min_periods=1).max().reset_index(level=[0, 1], drop=True)
+    return df
@@ -0,0 +1,290 @@
+import argparse
+import glob
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from src.processing.schemas import TRAJECTORY_SCHEMA
+
+
+"""
+    Armazenamento colunar dos logs de trajetoria (Log_Path_drone *.csv).
+
+    Todos os logs sao lidos uma unica vez e gravados em um diretorio com um arquivo .npy
+    por coluna (float32 para time/x/y/z, codigos inteiros para as colunas categoricas),
+    ordenados por (simulaçao, drone, tempo), e um indice com o intervalo de linhas de
+    cada (simulaçao, drone). As colunas sao abertas com memory map, entao ler a trajetoria
+    de um drone e uma fatia sem copia e varrer todos os drones le os arquivos em sequencia.
+
+    O meta.json guarda o caminho, tamanho e data de modificaçao de cada log de origem;
+    open_trajectory_store gera o armazenamento novamente quando algum deles muda.
+
+    Uso:
+        python -m src.processing.trajectory_store "dados/trajectory/*.csv" dados/trajectory_store
+"""
+
+
+TRAJECTORY_STORE_VERSION = 2
+
+_NUMERIC_COLUMNS = [name for name, dtype in TRAJECTORY_SCHEMA.items() if dtype != 'category' and name != 'simulation']
+_CATEGORICAL_COLUMNS = [name for name, dtype in TRAJECTORY_SCHEMA.items() if dtype == 'category']
+
+_INDEX_DTYPE = np.dtype([('simulation', np.int32), ('drone', np.int32), ('start', np.int64), ('stop', np.int64)])
+
+_META_FILE = "meta.json"
+_INDEX_FILE = "index.npy"
+
+
+def _read_log(path):
+    dtypes = {
+        name: str if dtype == 'category' else dtype
+        for name, dtype in TRAJECTORY_SCHEMA.items()
+    }
+    df = pd.read_csv(path, dtype=dtypes)
+    df.columns = df.columns.str.strip()
+    return df
+
+
+def _sources(paths):
+    """
+    Identifica os logs de origem por caminho, tamanho e data de modificaçao.
+    """
+    sources = []
+    for path in paths:
+        stat = os.stat(path)
+        sources.append([os.path.abspath(path), stat.st_size, stat.st_mtime_ns])
+    return sources
+
+
+def _read_meta(directory):
+    with open(os.path.join(directory, _META_FILE)) as f:
+        return json.load(f)
+
+
+def store_is_current(directory, paths):
+    """
+    Verifica se o armazenamento em `directory` foi gerado a partir de `paths` na versao atual.
+
+    Args:
+        directory (str): Diretorio do armazenamento.
+        paths (list): Caminhos dos arquivos Log_Path_drone *.csv.
+
+    Returns:
+        bool: False se o armazenamento nao existir, estiver incompleto, em outra versao
+        ou se algum log tiver sido alterado, incluido ou removido.
+    """
+    try:
+        meta = _read_meta(directory)
+        sources = _sources(paths)
+    except (OSError, ValueError):
+        return False
+    return meta.get('version') == TRAJECTORY_STORE_VERSION and meta.get('sources') == sources
+
+
+def open_trajectory_store(paths, directory):
+    """
+    Abre o armazenamento em `directory`, gerando-o novamente se estiver desatualizado.
+
+    Args:
+        paths (list): Caminhos dos arquivos Log_Path_drone *.csv.
+        directory (str): Diretorio do armazenamento.
+
+    Returns:
+        TrajectoryStore: Armazenamento correspondente aos logs atuais.
+    """
+    if store_is_current(directory, paths):
+        return TrajectoryStore(directory)
+    return build_trajectory_store(paths, directory)
+
+
+def _write_store(temporary, df, order, simulation, index, sources):
+    np.save(os.path.join(temporary, _INDEX_FILE), index)
+    np.save(os.path.join(temporary, "simulation.npy"), simulation)
+
+    for name in _NUMERIC_COLUMNS:
+        np.save(os.path.join(temporary, f"{name}.npy"), df[name].to_numpy(dtype=TRAJECTORY_SCHEMA[name])[order])
+
+    categories = {}
+    for name in _CATEGORICAL_COLUMNS:
+        values = pd.Categorical(df[name])
+        categories[name] = values.categories.tolist()
+        np.save(os.path.join(temporary, f"{name}.npy"), values.codes.astype(np.int32)[order])
+
+    with open(os.path.join(temporary, _META_FILE), "w") as f:
+        json.dump({'version': TRAJECTORY_STORE_VERSION, 'rows': len(df), 'categories': categories, 'sources': sources}, f)
+
+
+def _replace_directory(temporary, directory):
+    """
+    Troca `directory` por `temporary` (mesmo diretorio pai), removendo o conteudo anterior.
+    """
+    if not os.path.exists(directory):
+        os.rename(temporary, directory)
+        return
+
+    previous = f"{temporary}.old"
+    os.rename(directory, previous)
+    try:
+        os.rename(temporary, directory)
+    except OSError:
+        os.rename(previous, directory)
+        raise
+    shutil.rmtree(previous, ignore_errors=True)
+
+
+def build_trajectory_store(paths, directory):
+    """
+    Le os logs de trajetoria e grava o armazenamento colunar em `directory`.
+
+    Os arquivos sao gravados em um diretorio temporario ao lado de `directory` e so
+    entao renomeados, entao uma gravaçao interrompida nunca deixa um armazenamento
+    incompleto no lugar do anterior.
+
+    Args:
+        paths (list): Caminhos dos arquivos Log_Path_drone *.csv.
+        directory (str): Diretorio de saida (criado se nao existir).
+
+    Returns:
+        TrajectoryStore: Armazenamento gravado.
+    """
+    if not paths:
+        raise ValueError("Nenhum log de trajetoria foi informado.")
+
+    sources = _sources(paths)
+    df = pd.concat([_read_log(path) for path in paths], ignore_index=True)
+
+    # O numero do drone vem do nome ("drone 12" -> 12)
+    drone = df['droneName'].str.extract(r'(\d+)\s*$', expand=False).astype(np.int32).to_numpy()
+    simulation = df['simulation'].to_numpy(dtype=np.int32)
+    time = df['time'].to_numpy(dtype=np.float32)
+
+    order = np.lexsort((time, drone, simulation))
+    simulation = simulation[order]
+    drone = drone[order]
+
+    # Inicio de cada (simulaçao, drone) nas linhas ordenadas
+    changes = np.flatnonzero((np.diff(simulation) != 0) | (np.diff(drone) != 0)) + 1
+    starts = np.concatenate(([0], changes))
+    stops = np.concatenate((changes, [len(df)]))
+
+    index = np.empty(len(starts), dtype=_INDEX_DTYPE)
+    index['simulation'] = simulation[starts]
+    index['drone'] = drone[starts]
+    index['start'] = starts
+    index['stop'] = stops
+
+    directory = os.path.normpath(directory)
+    parent = os.path.dirname(directory) or "."
+    os.makedirs(parent, exist_ok=True)
+    temporary = tempfile.mkdtemp(prefix=f".{os.path.basename(directory)}.", dir=parent)
+
+    try:
+        _write_store(temporary, df, order, simulation, index, sources)
+        _replace_directory(temporary, directory)
+    except BaseException:
+        shutil.rmtree(temporary, ignore_errors=True)
+        raise
+
+    return TrajectoryStore(directory)
+
+
+class TrajectoryStore:
+    """
+    Leitura do armazenamento colunar gravado por build_trajectory_store.
+
+    Args:
+        directory (str): Diretorio do armazenamento.
+    """
+
+    def __init__(self, directory):
+        meta = _read_meta(directory)
+
+        if meta['version'] != TRAJECTORY_STORE_VERSION:
+            raise ValueError(
+                f"Armazenamento de trajetorias na versao {meta['version']}, esperado {TRAJECTORY_STORE_VERSION}. "
+                "Gere o armazenamento novamente."
+            )
+
+        self.directory = directory
+        self.categories = meta['categories']
+        self.index = np.load(os.path.join(directory, _INDEX_FILE))
+        self._offsets = {
+            (int(simulation), int(drone)): (int(start), int(stop))
+            for simulation, drone, start, stop in self.index
+        }
+
+        # Colunas completas em memory map (sem leitura ate serem acessadas)
+        self.columns = {
+            name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode='r')
+            for name in ['simulation', *_NUMERIC_COLUMNS, *_CATEGORICAL_COLUMNS]
+        }
+
+    def keys(self):
+        """
+        Retorna os pares (simulaçao, drone) do armazenamento, em ordem.
+        """
+        return list(self._offsets)
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __contains__(self, key):
+        return key in self._offsets
+
+    def path(self, simulation, drone, columns=None):
+        """
+        Retorna a trajetoria de um drone como fatias (sem copia) das colunas.
+
+        Args:
+            simulation (int): Numero da simulaçao.
+            drone (int): Numero do drone.
+            columns (list, optional): Colunas desejadas. Padrao: todas.
+
+        Returns:
+            dict: {coluna: np.ndarray}. As colunas categoricas vem como codigos (ver `categories`).
+        """
+        if (simulation, drone) not in self._offsets:
+            raise KeyError(f"Trajetoria da simulaçao {simulation}, drone {drone} nao encontrada.")
+
+        start, stop = self._offsets[(simulation, drone)]
+        columns = columns or list(self.columns)
+        return {name: self.columns[name][start:stop] for name in columns}
+
+    def frame(self, simulation, drone, columns=None):
+        """
+        Retorna a trajetoria de um drone como DataFrame, com as colunas categoricas decodificadas.
+        """
+        data = self.path(simulation, drone, columns)
+        for name in _CATEGORICAL_COLUMNS:
+            if name in data:
+                data[name] = pd.Categorical.from_codes(data[name], categories=self.categories[name])
+        return pd.DataFrame(data)
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m src.processing.trajectory_store",
+        description="Gera o armazenamento colunar dos logs de trajetoria.",
+    )
+    parser.add_argument("pattern", help="Padrao glob dos logs (ex: \"dados/*.csv\").")
+    parser.add_argument("output", help="Diretorio de saida.")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+
+    paths = sorted(glob.glob(args.pattern))
+    store = build_trajectory_store(paths, args.output)
+
+    print(f"{len(paths)} arquivos, {len(store)} trajetorias gravadas em {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+"""
+    Intervalos de confiança por bootstrap, como alternativa a 1.96 * desvio / sqrt(n).
+
+    O bootstrap e por execuçao (cluster bootstrap): cada reamostragem sorteia, com
+    reposiçao, as execuçoes de cada simulaçao e recalcula a media a partir das somas e
+    contagens por execuçao ('soma_execucoes' e 'n_execucoes', ver stats.execution_totals).
+    Todas as simulaçoes de uma analise sao reamostradas juntas em uma operaçao do NumPy,
+    em blocos de reamostragens para limitar a memoria.
+"""
+
+
+BOOTSTRAP_RESAMPLES = 10_000
+BOOTSTRAP_SEED = 0
+BOOTSTRAP_CONFIDENCE = 0.95
+
+# Reamostragens por bloco; cada bloco tem sua propria semente, entao o resultado
+# nao depende do numero de processos
+BOOTSTRAP_CHUNK = 1_000
+
+# Abaixo deste numero de sorteios (simulaçoes x reamostragens x execuçoes) o pool nao compensa
+BOOTSTRAP_PARALLEL_MIN_DRAWS = 20_000_000
+
+
+def _pad(arrays):
+    """
+    Empilha arrays de tamanhos diferentes em uma matriz completada com zeros.
+    """
+    num_execucoes = np.array([len(a) for a in arrays], dtype=np.intp)
+    matrix = np.zeros((len(arrays), max(num_execucoes.max(), 1)), dtype=np.float64)
+    for i, a in enumerate(arrays):
+        matrix[i, :len(a)] = a
+    return matrix, num_execucoes
+
+
+def _bootstrap_chunk(args):
+    """
+    Calcula as medias de um bloco de reamostragens para todas as simulaçoes.
+
+    Returns:
+        np.ndarray: Matriz (simulaçoes x reamostragens).
+    """
+    sums, counts, num_execucoes, seed, size = args
+    num_sims, max_execucoes = sums.shape
+    rng = np.random.default_rng(seed)
+
+    # Indice sorteado de cada posiçao; posiçoes alem do numero de execuçoes sao ignoradas
+    draws = (rng.random((num_sims, size, max_execucoes)) * num_execucoes[:, None, None]).astype(np.intp)
+    valid = np.arange(max_execucoes) < num_execucoes[:, None, None]
+    flat = draws + (np.arange(num_sims) * max_execucoes)[:, None, None]
+
+    total = np.where(valid, sums.ravel()[flat], 0).sum(axis=2)
+    n = np.where(valid, counts.ravel()[flat], 0).sum(axis=2)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return total / n
+
+
+def bootstrap_means(sums, counts, num_resamples=BOOTSTRAP_RESAMPLES, seed=BOOTSTRAP_SEED,
+                    confidence=BOOTSTRAP_CONFIDENCE, max_workers=1):
+    """
+    Intervalo de confiança por bootstrap das medias de varias simulaçoes.
+
+    Args:
+        sums (list de np.ndarray): Soma dos valores de cada execuçao, por simulaçao.
+        counts (list de np.ndarray): Numero de valores de cada execuçao, por simulaçao.
+        num_resamples (int): Numero de reamostragens.
+        seed (int): Semente do gerador aleatorio.
+        confidence (float): Nivel de confiança do intervalo (percentil).
+        max_workers (int): Processos usados nas reamostragens. None usa o numero de CPUs.
+
+    Returns:
+        dict: Arrays (um valor por simulaçao) 'media', 'inferior' e 'superior'.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    sums, num_execucoes = _pad([np.asarray(s, dtype=np.float64) for s in sums])
+    counts, _ = _pad([np.asarray(c, dtype=np.float64) for c in counts])
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        media = sums.sum(axis=1) / counts.sum(axis=1)
+
+    sizes = [BOOTSTRAP_CHUNK] * (num_resamples // BOOTSTRAP_CHUNK)
+    if num_resamples % BOOTSTRAP_CHUNK:
+        sizes.append(num_resamples % BOOTSTRAP_CHUNK)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    chunks = [(sums, counts, num_execucoes, chunk_seed, size) for chunk_seed, size in zip(seeds, sizes)]
+
+    draws = sums.size * num_resamples
+    if max_workers > 1 and len(chunks) > 1 and draws >= BOOTSTRAP_PARALLEL_MIN_DRAWS:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+            resampled = list(executor.map(_bootstrap_chunk, chunks))
+    else:
+        resampled = [_bootstrap_chunk(chunk) for chunk in chunks]
+
+    alpha = 1 - confidence
+    inferior, superior = np.nanquantile(np.concatenate(resampled, axis=1), [alpha / 2, 1 - alpha / 2], axis=1)
+
+    return {"media": media, "inferior": inferior, "superior": superior}
+
+
+def supports_bootstrap(data_list):
+    """
+    Indica se os resultados de uma analise trazem as somas por execuçao usadas pelo bootstrap.
+    """
+    return all(isinstance(data, dict) and "soma_execucoes" in data for data in data_list)
+
+
+def apply_bootstrap(data_list, num_resamples=BOOTSTRAP_RESAMPLES, seed=BOOTSTRAP_SEED,
+                    confidence=BOOTSTRAP_CONFIDENCE, max_workers=1):
+    """
+    Substitui o intervalo normal dos resultados de uma analise pelo intervalo do bootstrap.
+
+    O intervalo fica assimetrico: 'intervalo' passa a ser a distancia da media ao limite
+    superior e 'intervalo_inferior' a distancia ao limite inferior.
+
+    Args:
+        data_list (list): Resultados das funçoes de calculo, um por simulaçao.
+
+    Returns:
+        list: Copias dos resultados com os novos intervalos.
+    """
+    bounds = bootstrap_means(
+        [data["soma_execucoes"] for data in data_list],
+        [data["n_execucoes"] for data in data_list],
+        num_resamples=num_resamples,
+        seed=seed,
+        confidence=confidence,
+        max_workers=max_workers,
+    )
+
+    return [
+        {
+            **data,
+            "intervalo": bounds["superior"][i] - data["media"],
+            "intervalo_inferior": data["media"] - bounds["inferior"][i],
+        }
+        for i, data in enumerate(data_list)
+    ]
+
+
+def bar_intervals(data_list):
+    """
+    Extrai as medias e os intervalos dos resultados de uma analise para um grafico de barras.
+
+    Resultados com bootstrap (ver apply_bootstrap) tem intervalo assimetrico: 'intervalo'
+    e a distancia ao limite superior e 'intervalo_inferior' ao inferior. Sem bootstrap o
+    intervalo e simetrico e 'intervalo_inferior' nao existe, entao o inferior e 'intervalo'.
+
+    Args:
+        data_list (list): Resultados das funçoes de calculo, um por simulaçao.
+
+    Returns:
+        tuple: Arrays 'media', 'intervalo' (superior) e 'intervalo_inferior'.
+    """
+    media = np.array([data['media'] for data in data_list])
+    intervalo = np.array([data['intervalo'] for data in data_list])
+    intervalo_inferior = np.array([data.get('intervalo_inferior', data['intervalo']) for data in data_list])
+    return media, intervalo, intervalo_inferior
@@ -0,0 +1,213 @@
+import os
+import pickle
+import threading
+from collections import OrderedDict
+
+from src.utils.hashing import hash_value
+
+
+class LRUCache:
+    """
+    Cache LRU limitado pelo tamanho total (em bytes) dos valores armazenados.
+
+    O cache vive no processo do Streamlit, entao sobrevive aos reruns do `app.py`
+    e e compartilhado entre as sessoes.
+
+    Args:
+        max_bytes (int): Orçamento de memoria do cache.
+        sizeof (callable): Funçao que retorna o tamanho em bytes de um valor.
+    """
+
+    def __init__(self, max_bytes, sizeof):
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._data = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key][0]
+
+    def put(self, key, value, size=None):
+        if size is None:
+            size = self._sizeof(value)
+
+        with self._lock:
+            if key in self._data:
+                self._total_bytes -= self._data.pop(key)[1]
+
+            # Valores maiores que o orçamento nao sao armazenados
+            if size > self.max_bytes:
+                return
+
+            self._data[key] = (value, size)
+            self._total_bytes += size
+
+            # Remove os itens menos usados ate caber no orçamento
+            while self._total_bytes > self.max_bytes:
+                _, (_, old_size) = self._data.popitem(last=False)
+                self._total_bytes -= old_size
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._total_bytes = 0
+
+    @property
+    def total_bytes(self):
+        return self._total_bytes
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+
+class DiskCache:
+    """
+    Cache persistente em disco, limitado pelo tamanho total dos arquivos.
+
+    Cada valor e gravado com pickle em um arquivo cujo nome e o hash da chave. Ao passar
+    do orçamento, os arquivos usados ha mais tempo (data de modificaçao, atualizada a
+    cada leitura) sao removidos. Falhas de leitura ou escrita sao tratadas como ausencia
+    do valor, entao o cache nunca interrompe o processamento.
+
+    Ler um pickle pode executar codigo, entao o diretorio deve ser privado: ele e criado
+    com permissao 0700 e, se pertencer a outro usuario ou puder ser alterado por outros,
+    o cache fica desativado.
+
+    O tamanho total e mantido em memoria (lido do diretorio uma unica vez) e o diretorio
+    so e percorrido de novo quando o orçamento e ultrapassado.
+
+    Args:
+        directory (str): Diretorio do cache (criado na primeira escrita). None desativa o cache.
+        max_bytes (int): Orçamento de disco do cache.
+    """
+
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._state_directory = None
+        self._private = False
+        self._total_bytes = 0
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{hash_value(key)}.pkl")
+
+    def _enabled(self):
+        """
+        Verifica (uma vez por diretorio) se o diretorio e privado e le o tamanho atual.
+        """
+        if not self.directory:
+            return False
+
+        with self._lock:
+            if self._state_directory != self.directory:
+                self._state_directory = self.directory
+                self._private = self._check_private()
+                self._total_bytes = sum(size for _, size, _ in self._entries()) if self._private else 0
+            return self._private
+
+    def _check_private(self):
+        try:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            stat = os.stat(self.directory)
+        except OSError:
+            return False
+
+        if hasattr(os, "getuid") and stat.st_uid != os.getuid():
+            return False
+        return not stat.st_mode & 0o022
+
+    def get(self, key, default=None):
+        if not self._enabled():
+            return default
+
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+            os.utime(path)
+        except FileNotFoundError:
+            return default
+        except Exception:
+            # Arquivo corrompido ou de uma versao incompativel das bibliotecas
+            self._remove(path)
+            return default
+
+        return value
+
+    def put(self, key, value):
+        if not self._enabled():
+            return
+
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            size = os.path.getsize(tmp)
+            old_size = os.path.getsize(path) if os.path.exists(path) else 0
+            # Escrita atomica: uma leitura concorrente nunca ve um arquivo pela metade
+            os.replace(tmp, path)
+        except OSError:
+            self._remove(tmp)
+            return
+
+        with self._lock:
+            self._total_bytes += size - old_size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _entries(self):
+        entries = []
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.name.endswith(".pkl"):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        except OSError:
+            pass
+        return entries
+
+    def _evict(self):
+        # Recalcula o total a partir do diretorio (outros processos tambem gravam nele)
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+
+        # Remove os arquivos menos usados ate caber no orçamento
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+        self._total_bytes = total
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def clear(self):
+        if not self._enabled():
+            return
+        with self._lock:
+            for _, _, path in self._entries():
+                self._remove(path)
+            self._total_bytes = 0
+
+    @property
+    def total_bytes(self):
+        if not self._enabled():
+            return 0
+        return self._total_bytes
@@ -0,0 +1,135 @@
+import heapq
+
+import numpy as np
+
+
+"""
+    Reduçao do numero de pontos de linhas antes de montar os graficos, preservando a forma.
+
+    - lttb: Largest-Triangle-Three-Buckets, para series temporais (x crescente).
+    - rdp: Ramer-Douglas-Peucker com orçamento de pontos, para trajetorias 2D/3D.
+
+    As duas funçoes retornam os indices dos pontos mantidos (em ordem), entao podem ser
+    aplicadas a um DataFrame inteiro com df.iloc[indices].
+"""
+
+
+def lttb(x, y, max_points):
+    """
+    Seleciona ate `max_points` pontos de uma serie com o algoritmo Largest-Triangle-Three-Buckets.
+
+    O primeiro e o ultimo ponto sao sempre mantidos. Os demais sao divididos em baldes e,
+    de cada balde, fica o ponto que forma o maior triangulo com o ponto escolhido no balde
+    anterior e a media do balde seguinte, o que preserva picos e vales.
+
+    Args:
+        x (array-like): Valores do eixo X (crescentes).
+        y (array-like): Valores do eixo Y.
+        max_points (int): Numero maximo de pontos mantidos (minimo 3).
+
+    Returns:
+        np.ndarray: Indices dos pontos mantidos.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+
+    if max_points >= n or n <= 2:
+        return np.arange(n)
+    if max_points < 3:
+        raise ValueError("O orçamento de pontos do LTTB deve ser de pelo menos 3.")
+
+    # Limites dos baldes dos pontos internos (o primeiro e o ultimo ficam de fora)
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.intp)
+
+    indices = np.empty(max_points, dtype=np.intp)
+    indices[0] = 0
+    indices[-1] = n - 1
+    selected = 0
+
+    for i in range(max_points - 2):
+        start, end = edges[i], edges[i + 1]
+
+        # Media do proximo balde (ou o ultimo ponto, no ultimo balde)
+        if i + 2 < len(edges):
+            next_start, next_end = edges[i + 1], edges[i + 2]
+            avg_x = x[next_start:next_end].mean()
+            avg_y = y[next_start:next_end].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+
+        # Area (x2) dos triangulos entre o ponto anterior, cada candidato e a media seguinte
+        ax, ay = x[selected], y[selected]
+        area = np.abs((ax - avg_x) * (y[start:end] - ay) - (ax - x[start:end]) * (avg_y - ay))
+
+        selected = start + int(np.nanargmax(area)) if not np.all(np.isnan(area)) else start
+        indices[i + 1] = selected
+
+    return indices
+
+
+def _farthest_point(points, start, end):
+    """
+    Retorna o ponto entre start e end mais distante do segmento que os liga e a distancia.
+    """
+    if end - start < 2:
+        return start, 0.0
+
+    a = points[start]
+    b = points[end]
+    inner = points[start + 1:end]
+
+    ab = b - a
+    length = np.dot(ab, ab)
+    if length == 0:
+        dist = np.linalg.norm(inner - a, axis=1)
+    else:
+        t = np.clip((inner - a) @ ab / length, 0, 1)
+        dist = np.linalg.norm(inner - (a + t[:, None] * ab), axis=1)
+
+    i = int(np.argmax(dist))
+    return start + 1 + i, float(dist[i])
+
+
+def rdp(points, max_points=None, epsilon=0.0):
+    """
+    Simplifica uma linha 2D/3D com o algoritmo Ramer-Douglas-Peucker.
+
+    Em vez de dividir recursivamente todos os segmentos com erro acima de `epsilon`,
+    sempre divide o segmento com o maior erro primeiro, o que permite parar quando o
+    orçamento de pontos e atingido: o resultado e a melhor simplificaçao com `max_points` pontos.
+
+    Args:
+        points (array-like): Matriz (n, d) com as coordenadas, em ordem.
+        max_points (int, optional): Numero maximo de pontos mantidos (minimo 2).
+        epsilon (float): Erro (distancia) abaixo do qual os segmentos nao sao divididos.
+
+    Returns:
+        np.ndarray: Indices dos pontos mantidos.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    n = len(points)
+
+    if max_points is None:
+        max_points = n
+    if n <= 2 or max_points >= n and epsilon <= 0:
+        return np.arange(n)
+    if max_points < 2:
+        raise ValueError("O orçamento de pontos do RDP deve ser de pelo menos 2.")
+
+    keep = [0, n - 1]
+    index, dist = _farthest_point(points, 0, n - 1)
+    heap = [(-dist, 0, n - 1, index)]
+
+    while heap and len(keep) < max_points:
+        neg_dist, start, end, index = heapq.heappop(heap)
+        if -neg_dist <= epsilon:
+            break
+
+        keep.append(index)
+        for segment_start, segment_end in ((start, index), (index, end)):
+            split, dist = _farthest_point(points, segment_start, segment_end)
+            if dist > 0:
+                heapq.heappush(heap, (-dist, segment_start, segment_end, split))
+
+    return np.sort(np.array(keep, dtype=np.intp))
@@ -7,52 +7,197 @@ import plotly.express as px
 pio.templates.default = 'gridon'
 
 
-def plot_boxsplot(df, title, x, y, color, labels):
+def _typed_array(values, dtype=np.float32):
     """
-    Cria um boxplot usando plotly.
+    Converte os valores de um trace em array numpy compacto.
+
+    Arrays numpy sao enviados pelo plotly como typed arrays binarios (base64) em vez de
+    listas JSON; float32 reduz o tamanho pela metade e basta para os graficos.
+    """
+    if values is None:
+        return None
+    return np.asarray(values, dtype=dtype)
+
+
+# Maximo de outliers enviados por caixa do boxplot
+BOX_MAX_OUTLIERS = 500
+
+
+def box_stats(values, max_outliers=BOX_MAX_OUTLIERS):
+    """
+    Calcula as estatisticas de uma caixa do boxplot (mesmas regras do plotly).
+
+    Os bigodes vao ate o valor mais extremo dentro de 1,5 * IQR dos quartis. Se houver mais
+    outliers que `max_outliers`, e enviada uma amostra uniforme deles (incluindo os extremos).
 
     Args:
+        values (array-like): Valores da caixa. Valores NaN sao ignorados.
+        max_outliers (int): Numero maximo de outliers retornados.
+
+    Retorna:
+        dict: 'q1', 'median', 'q3', 'lowerfence', 'upperfence' e 'outliers' (np.ndarray).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    values = np.sort(values[~np.isnan(values)])
+
+    if len(values) == 0:
+        return {
+            "q1": np.nan, "median": np.nan, "q3": np.nan,
+            "lowerfence": np.nan, "upperfence": np.nan,
+            "outliers": np.empty(0)
+        }
+
+    q1, median, q3 = np.quantile(values, [0.25, 0.5, 0.75])
+    iqr = q3 - q1
+
+    inside = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+    outliers = values[(values < inside[0]) | (values > inside[-1])]
+
+    if len(outliers) > max_outliers:
+        outliers = outliers[np.linspace(0, len(outliers) - 1, max_outliers).round().astype(np.intp)]
+
+    return {
+        "q1": q1, "median": median, "q3": q3,
+        "lowerfence": inside[0], "upperfence": inside[-1],
+        "outliers": outliers
+    }
+
+
+def plot_boxsplot(groups, labels, categories, title, x_label, y_label, legend_title=""):
+    """
+    Cria um boxplot com estatisticas calculadas no servidor.
+
+    Cada grupo (ex: uma simulaçao) vira um trace com uma caixa por categoria. Apenas os
+    quartis, os bigodes e uma amostra limitada de outliers vao para o navegador.
+
+    Args:
+        groups (list): Para cada grupo, lista com os valores de cada categoria.
+        labels (list): Nome de cada grupo.
+        categories (list): Nome de cada categoria (eixo X).
         title (str): Titulo do grafico.
-        labels (list): Lista de rótulos para cada conjunto de dados.
-        args: Conjuntos de dados para plotar.
+        x_label (str): Legenda do eixo X.
+        y_label (str): Legenda do eixo Y.
+        legend_title (str): Titulo da legenda.
 
     Retorna:
         fig (go.Figure): Figura plotly com o boxplot.
     """
+    fig = go.Figure()
+
+    for group, label in zip(groups, labels):
+        stats = [box_stats(values) for values in group]
+
+        fig.add_trace(go.Box(
+            x=categories,
+            q1=_typed_array([s["q1"] for s in stats]),
+            median=_typed_array([s["median"] for s in stats]),
+            q3=_typed_array([s["q3"] for s in stats]),
+            lowerfence=_typed_array([s["lowerfence"] for s in stats]),
+            upperfence=_typed_array([s["upperfence"] for s in stats]),
+            # Pontos por caixa (lista de listas): o plotly nao usa typed arrays aninhados
+            y=[s["outliers"].tolist() for s in stats],
+            boxpoints='outliers',
+            name=label
+        ))
 
-    fig = px.box(
-        df,
-        x=x,
-        y=y,
-        color=color,
+    fig.update_layout(
         title=title,
-        labels=labels
+        xaxis_title=x_label,
+        yaxis_title=y_label,
+        legend_title_text=legend_title,
+        boxmode='group'
     )
 
     return fig
 
 
+# Numero de bins dos histogramas
+HISTOGRAM_BINS = 50
+
+
+def histogram_counts(values_list, bins=HISTOGRAM_BINS):
+    """
+    Conta os valores de cada conjunto em bins compartilhados (mesmos limites para todos).
+
+    Args:
+        values_list (list de array-like): Valores de cada conjunto. Valores NaN sao ignorados.
+        bins (int): Numero de bins.
 
-def plot_histogram(df, title, x, color, labels):
+    Retorna:
+        tuple: Limites dos bins (bins + 1) e lista com as contagens de cada conjunto.
     """
-    Cria um histograma com contagens
+    arrays = [np.asarray(values, dtype=np.float64) for values in values_list]
+    arrays = [values[~np.isnan(values)] for values in arrays]
+
+    # Limites comuns a partir do menor e do maior valor de todos os conjuntos
+    non_empty = [values for values in arrays if len(values)]
+    if non_empty:
+        value_range = (min(values.min() for values in non_empty), max(values.max() for values in non_empty))
+    else:
+        value_range = (0.0, 1.0)
+
+    edges = np.histogram_bin_edges([], bins=bins, range=value_range)
+    counts = [np.histogram(values, bins=edges)[0] for values in arrays]
+    return edges, counts
+
+
+def plot_histogram(values_list, labels, title, x_label, y_label="count", legend_title="", bins=HISTOGRAM_BINS):
     """
+    Cria um histograma com contagens calculadas no servidor.
 
-    fig = px.histogram(
-        df,
-        x=x,
-        color=color,
+    Os valores sao agrupados com numpy em bins compartilhados entre os conjuntos e apenas
+    as contagens vao para o navegador, entao o tamanho da figura nao depende do numero de valores.
+
+    Args:
+        values_list (list de array-like): Valores de cada conjunto (ex: uma simulaçao).
+        labels (list): Nome de cada conjunto.
+        title (str): Titulo do grafico.
+        x_label (str): Legenda do eixo X.
+        y_label (str): Legenda do eixo Y.
+        legend_title (str): Titulo da legenda.
+        bins (int): Numero de bins.
+
+    Retorna:
+        fig (go.Figure): Figura plotly com os histogramas sobrepostos.
+    """
+    edges, counts = histogram_counts(values_list, bins=bins)
+    centers = (edges[:-1] + edges[1:]) / 2
+    width = edges[1] - edges[0]
+
+    fig = go.Figure()
+    for count, label in zip(counts, labels):
+        fig.add_trace(go.Bar(
+            x=_typed_array(centers),
+            y=_typed_array(count, dtype=np.int32),
+            width=width,
+            name=label,
+            opacity=0.75
+        ))
+
+    fig.update_layout(
         title=title,
-        labels=labels,
+        xaxis_title=x_label,
+        yaxis_title=y_label,
+        legend_title_text=legend_title,
         barmode='overlay',
-        nbins=50,
-        opacity=0.75
+        bargap=0
     )
 
     return fig
 
 
-def plot_bar(values, intervalos=None, labels=None, x_label="Eixo X", y_label="Eixo Y", title="grafico de Barras", show_num=False, show_interval=True):
+def _finite_max(values):
+    """
+    Maior valor finito de um array ou de uma lista de arrays, ou None se nao houver nenhum.
+    """
+    if isinstance(values, list):
+        values = np.concatenate([np.ravel(np.asarray(v, dtype=np.float64)) for v in values]) if values else np.empty(0)
+    values = np.asarray(values, dtype=np.float64)
+    finite = values[np.isfinite(values)]
+    return finite.max() if len(finite) else None
+
+
+def plot_bar(values, intervalos=None, labels=None, x_label="Eixo X", y_label="Eixo Y", title="grafico de Barras", show_num=False, show_interval=True, intervalos_inferiores=None):
     """
     Cria um grafico de barras (simples ou agrupado) com intervalos de confiança.
 
@@ -64,6 +209,8 @@ def plot_bar(values, intervalos=None, labels=None, x_label="Eixo X", y_label="Ei
         y_label (str): Legenda do eixo Y.
         title (str): Titulo do grafico.
         show_num (bool): Se True, exibe os valores acima das barras.
+        intervalos_inferiores (np.ndarray, optional): Parte inferior dos intervalos, quando assimetricos
+            (ex: bootstrap). Nesse caso `intervalos` e a parte superior. Apenas para barras simples.
 
     Retorna:
         fig (go.Figure): Figura plotly com o grafico de barras.
@@ -80,11 +227,11 @@ def plot_bar(values, intervalos=None, labels=None, x_label="Eixo X", y_label="Ei
             series_intervalos = intervalos[i] if isinstance(intervalos, list) else intervalos
             series_name = f"Serie {i+1}"
 
-            error_y = dict(type='data', array=series_intervalos, visible=True) if show_interval and series_intervalos is not None else None
+            error_y = dict(type='data', array=_typed_array(series_intervalos), visible=True) if show_interval and series_intervalos is not None else None
 
             fig.add_trace(go.Bar(
                 x=labels,
-                y=series_values,
+                y=_typed_array(series_values),
                 name=series_name,
                 error_y=error_y,
                 text=series_values if show_num else None,
@@ -93,15 +240,27 @@ def plot_bar(values, intervalos=None, labels=None, x_label="Eixo X", y_label="Ei
 
     # Caso seja um gráfico de barras simples
     else:
+        if intervalos_inferiores is None:
+            error_y = dict(type='data', array=_typed_array(intervalos), visible=True)
+        else:
+            error_y = dict(
+                type='data', symmetric=False, array=_typed_array(intervalos),
+                arrayminus=_typed_array(intervalos_inferiores), visible=True
+            )
+
         fig = go.Figure(go.Bar(
             x=labels,
-            y=values,
-            error_y=dict(type='data', array=intervalos, visible=True),
+            y=_typed_array(values),
+            error_y=error_y,
             text=values if show_num else None,
             textposition='outside' if show_num else None
         ))
 
-    ymax = (np.array(values).max() + np.array(intervalos).max()) * 1.2
+    # NaN (execuçoes ausentes) nao entram no limite do eixo; sem nenhum valor finito
+    # o Plotly escolhe o intervalo
+    vmax = _finite_max(values)
+    imax = _finite_max(intervalos) if intervalos is not None else None
+    yaxis = dict(range=[0, (vmax + (imax or 0)) * 1.2]) if vmax is not None else dict()
     
     fig.update_xaxes(type="category") # Ajusta os valores do eixo X
     
@@ -109,8 +268,148 @@ def plot_bar(values, intervalos=None, labels=None, x_label="Eixo X", y_label="Ei
         title=title,
         xaxis_title=x_label,
         yaxis_title=y_label,
-        yaxis=dict(range=[0, ymax]),
+        yaxis=yaxis,
         barmode='group'
     )
 
-    return fig
\ No newline at end of file
+    return fig
+
+# Acima deste numero de pontos o grafico de dispersao e substituido por uma densidade 2D
+SCATTER_MAX_POINTS = 100_000
+# Numero de bins de cada eixo da densidade 2D
+DENSITY_BINS = 200
+
+
+def _density_2d(xs, ys, bins):
+    """
+    Calcula as contagens 2D de cada conjunto de pontos com os mesmos limites de bins.
+    """
+    finite = []
+    for x, y in zip(xs, ys):
+        mask = np.isfinite(x) & np.isfinite(y)
+        finite.append((x[mask], y[mask]))
+
+    x_min = min((x.min() for x, _ in finite if len(x)), default=0)
+    x_max = max((x.max() for x, _ in finite if len(x)), default=1)
+    y_min = min((y.min() for _, y in finite if len(y)), default=0)
+    y_max = max((y.max() for _, y in finite if len(y)), default=1)
+
+    x_edges = np.linspace(x_min, x_max, bins + 1)
+    y_edges = np.linspace(y_min, y_max, bins + 1)
+
+    counts = [np.histogram2d(x, y, bins=[x_edges, y_edges])[0] for x, y in finite]
+    x_centers = ((x_edges[:-1] + x_edges[1:]) / 2).astype(np.float32)
+    y_centers = ((y_edges[:-1] + y_edges[1:]) / 2).astype(np.float32)
+    return counts, x_centers, y_centers
+
+
+def plot_scatter_density(xs, ys, labels, x_label="Eixo X", y_label="Eixo Y", title="", max_points=SCATTER_MAX_POINTS, bins=DENSITY_BINS):
+    """
+    Cria um grafico de dispersao (WebGL) ou, com muitos pontos, um mapa de densidade 2D calculado no servidor.
+
+    Ate `max_points` pontos no total, cada conjunto vira um go.Scattergl. Acima disso os pontos
+    sao agrupados com np.histogram2d em bins compartilhados e apenas as contagens vao para o
+    navegador: um conjunto vira um go.Heatmap e varios conjuntos viram contornos sobrepostos.
+
+    Args:
+        xs (list de np.ndarray): Coordenadas X de cada conjunto.
+        ys (list de np.ndarray): Coordenadas Y de cada conjunto.
+        labels (list): Nome de cada conjunto.
+        x_label (str): Legenda do eixo X.
+        y_label (str): Legenda do eixo Y.
+        title (str): Titulo do grafico.
+        max_points (int): Numero maximo de pontos do grafico de dispersao.
+        bins (int): Numero de bins de cada eixo da densidade.
+
+    Retorna:
+        fig (go.Figure): Figura plotly.
+    """
+    xs = [np.asarray(x, dtype=np.float32) for x in xs]
+    ys = [np.asarray(y, dtype=np.float32) for y in ys]
+    fig = go.Figure()
+
+    if sum(len(x) for x in xs) <= max_points:
+        for x, y, label in zip(xs, ys, labels):
+            fig.add_trace(go.Scattergl(x=x, y=y, mode='markers', name=label, marker=dict(size=4, opacity=0.6)))
+
+    else:
+        counts, x_centers, y_centers = _density_2d(xs, ys, bins)
+
+        if len(counts) == 1:
+            # Bins vazios ficam transparentes
+            z = np.where(counts[0] > 0, counts[0], np.nan).T.astype(np.float32)
+            fig.add_trace(go.Heatmap(x=x_centers, y=y_centers, z=z, name=labels[0], colorbar=dict(title="Colisoes")))
+        else:
+            colors = px.colors.qualitative.Plotly
+            for i, (count, label) in enumerate(zip(counts, labels)):
+                color = colors[i % len(colors)]
+                fig.add_trace(go.Contour(
+                    x=x_centers,
+                    y=y_centers,
+                    z=count.T.astype(np.float32),
+                    name=label,
+                    showlegend=True,
+                    showscale=False,
+                    contours=dict(coloring='lines', start=1, end=float(count.max()), size=max(float(count.max()) / 8, 1)),
+                    line=dict(color=color, width=1.5),
+                    colorscale=[[0, color], [1, color]],
+                ))
+
+    fig.update_layout(
+        title=title,
+        xaxis_title=x_label,
+        yaxis_title=y_label,
+    )
+
+    return fig
+
+
+def apply_paper_layout(fig):
+    """
+    Aplica o layout de artigo (fundo branco, legenda e textos maiores) em uma copia da figura.
+
+    Args:
+        fig (go.Figure): Figura plotly original, que nao e alterada.
+
+    Retorna:
+        fig (go.Figure): Copia da figura com o layout de artigo.
+    """
+    fig = go.Figure(fig)
+
+    # att legenda e tamanho do texto para exportar graficos para o artigo 
+    fig.update_layout(
+        plot_bgcolor='white',
+        legend=dict(
+            title="",
+            font=dict(
+                size=30  # Define o tamanho do texto da legenda
+            ),
+            x=0.02,  # Posiçao horizontal dentro do gráfico (0 é a esquerda, 1 é a direita)
+            y=0.95,  # Posiçao vertical dentro do gráfico (0 é na base, 1 é no topo)
+            xanchor='left',  # Alinha a legenda em relaçao ao ponto definido por x
+            yanchor='top',   # Alinha a legenda em relaçao ao ponto definido por y
+            bgcolor='rgba(255, 255, 255, 0.7)',  # Fundo da legenda com transparência
+            bordercolor='black',  # Cor da borda da legenda
+            borderwidth=1         # Largura da borda da legenda
+        ),
+        yaxis=dict(
+            title_font=dict(size=30),
+            tickfont=dict(size=30),
+            automargin=True
+        ),
+        xaxis=dict(
+            title_font=dict(size=30),
+            tickfont=dict(size=30),
+            automargin=True
+        ),
+        # Texto Dissertacao
+        title='', 
+        # yaxis_title='',
+        # title=dict(
+        #     x=0.5,                
+        #     xanchor='center',     
+        #     font=dict(size=40)    
+        # )
+    )
+
+    return fig
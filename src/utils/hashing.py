@@ -0,0 +1,69 @@
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+
+def _update(hasher, obj):
+    if isinstance(obj, dict):
+        hasher.update(b"dict")
+        for key in sorted(obj, key=str):
+            _update(hasher, str(key))
+            _update(hasher, obj[key])
+    elif isinstance(obj, (list, tuple)):
+        hasher.update(f"list{len(obj)}".encode())
+        for item in obj:
+            _update(hasher, item)
+    elif isinstance(obj, (pd.Series, pd.Index)):
+        hasher.update(f"series{obj.dtype}".encode())
+        hasher.update(pd.util.hash_pandas_object(obj, index=False).to_numpy().tobytes())
+    elif isinstance(obj, pd.DataFrame):
+        hasher.update(b"frame")
+        _update(hasher, list(obj.columns))
+        hasher.update(pd.util.hash_pandas_object(obj, index=False).to_numpy().tobytes())
+    elif isinstance(obj, np.ndarray):
+        hasher.update(f"array{obj.dtype}{obj.shape}".encode())
+        if obj.dtype == object:
+            _update(hasher, obj.tolist())
+        else:
+            hasher.update(np.ascontiguousarray(obj).tobytes())
+    else:
+        hasher.update(f"{type(obj).__name__}:{obj!r}".encode())
+
+
+def hash_value(obj):
+    """
+    Calcula um hash estavel do conteudo de um resultado (dicts, listas, arrays, Series e escalares).
+
+    Args:
+        obj: Valor a ser resumido.
+
+    Returns:
+        str: Hash hexadecimal do conteudo.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    _update(hasher, obj)
+    return hasher.hexdigest()
+
+
+def value_nbytes(obj):
+    """
+    Estima a memoria ocupada por um resultado, somando os arrays que ele contem.
+
+    Args:
+        obj: Valor a ser medido.
+
+    Returns:
+        int: Tamanho aproximado em bytes.
+    """
+    if isinstance(obj, dict):
+        return sum(value_nbytes(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return sum(value_nbytes(item) for item in obj)
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(deep=True).sum())
+    if isinstance(obj, (pd.Series, pd.Index)):
+        return int(obj.memory_usage(deep=True))
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    return 64
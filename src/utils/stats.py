@@ -0,0 +1,121 @@
+import numpy as np
+import pandas as pd
+
+
+# Valor z do intervalo de confiança de 95%
+Z_95 = 1.96
+
+
+def group_stats(values, groups=None, num_groups=None, ddof=1, z=Z_95):
+    """
+    Calcula contagem, media, desvio padrao e intervalo de confiança por grupo em uma unica passada vetorizada.
+
+    As estatisticas sao obtidas a partir da soma, da soma dos quadrados e da contagem
+    de cada grupo (np.bincount). Os valores sao deslocados pela media geral antes das
+    somas para evitar perda de precisao no calculo da variancia. Valores NaN sao ignorados.
+
+    Args:
+        values (array-like): Valores a serem resumidos.
+        groups (array-like, optional): Rotulo do grupo de cada valor. Se None, todos os valores formam um unico grupo.
+        num_groups (int, optional): Se informado, `groups` ja sao codigos inteiros de 0 a num_groups - 1
+            e todos os grupos sao retornados, mesmo os vazios.
+        ddof (int): Graus de liberdade do desvio padrao (1 como no pandas, 0 como no numpy).
+        z (float): Valor z do intervalo de confiança.
+
+    Returns:
+        dict: Dicionario com 'grupos', 'n', 'media', 'desvio_padrao' e 'intervalo'.
+            Sem `groups`, os valores sao escalares.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    mask = ~np.isnan(values)
+
+    if groups is None:
+        codes = np.zeros(int(mask.sum()), dtype=np.intp)
+        labels = None
+        size = 1
+    elif num_groups is not None:
+        codes = np.asarray(groups)[mask]
+        labels = np.arange(num_groups)
+        size = num_groups
+    else:
+        # Grupos ausentes (NaN, ou <NA> de colunas inteiras anulaveis) sao descartados, como no groupby
+        groups = np.asarray(groups)
+        mask &= ~pd.isna(groups)
+        groups = groups[mask]
+        if groups.dtype == object:
+            groups = pd.Series(groups).infer_objects().to_numpy()
+        labels, codes = np.unique(groups, return_inverse=True)
+        size = len(labels)
+
+    x = values[mask]
+    shift = x.mean() if len(x) else 0.0
+    centered = x - shift
+
+    n = np.bincount(codes, minlength=size)
+    soma = np.bincount(codes, weights=centered, minlength=size)
+    soma_quadrados = np.bincount(codes, weights=centered * centered, minlength=size)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        media = shift + soma / n
+        variancia = (soma_quadrados - soma * soma / n) / (n - ddof)
+        desvio_padrao = np.where(n > ddof, np.sqrt(np.maximum(variancia, 0)), np.nan)
+        intervalo = np.where(n > 0, z * desvio_padrao / np.sqrt(n), 0)
+
+    if labels is None:
+        return {
+            "grupos": None,
+            "n": n[0],
+            "media": media[0],
+            "desvio_padrao": desvio_padrao[0],
+            "intervalo": intervalo[0],
+        }
+
+    return {
+        "grupos": labels,
+        "n": n,
+        "media": media,
+        "desvio_padrao": desvio_padrao,
+        "intervalo": intervalo,
+    }
+
+
+def execution_totals(values, groups):
+    """
+    Soma e contagem dos valores de cada execuçao, usadas no bootstrap por execuçao (src.utils.bootstrap).
+
+    Args:
+        values (array-like): Valores da metrica. Valores NaN sao ignorados.
+        groups (array-like): Numero da execuçao de cada valor.
+
+    Returns:
+        dict: Dicionario com os arrays 'soma_execucoes' e 'n_execucoes'.
+    """
+    stats = group_stats(values, groups)
+
+    return {
+        "soma_execucoes": stats["media"] * stats["n"],
+        "n_execucoes": stats["n"],
+    }
+
+
+def align_executions(data_list, value_key):
+    """
+    Alinha os valores por execuçao de varias simulaçoes em uma matriz (execuçoes x simulaçoes).
+
+    As execuçoes sao a uniao ordenada das execuçoes de todas as simulaçoes; as que faltam
+    em uma simulaçao ficam como NaN (sem barra no grafico), e nao como 0.
+
+    Args:
+        data_list (list): Resultados por execuçao, cada um com 'execucoes' e `value_key`.
+        value_key (str): Chave dos valores a alinhar (ex: 'media').
+
+    Returns:
+        tuple: Array das execuçoes e matriz float64 (execuçoes x simulaçoes).
+    """
+    series = [
+        pd.Series(np.asarray(data[value_key], dtype=np.float64), index=np.asarray(data['execucoes']))
+        for data in data_list
+    ]
+    aligned = pd.concat(series, axis=1, ignore_index=True).sort_index()
+
+    return aligned.index.to_numpy(), aligned.to_numpy(dtype=np.float64)
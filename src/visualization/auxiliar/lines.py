@@ -1,15 +1,29 @@
+"""
+    Curvas de treinamento de uma metrica (ver tambem a pagina "Treinamento" do dashboard).
+
+    Usa src.processing.training_logs e src.utils.downsampling, entao deve ser executado
+    como modulo a partir da raiz do repositorio:
+
+        python -m src.visualization.auxiliar.lines
+"""
+
 import pandas as pd
 import plotly.express as px
-import glob
-import os
+
+from src.processing.training_logs import TRAINING_METRICS, load_training_logs
+from src.utils.downsampling import lttb
 
 # =========================
-# CAMINHO DOS DADOS
+# METRICA (subdiretorio de src/visualization/auxiliar/data)
 # -------------------------
-path = "src/visualization/auxiliar/data/policy_loss/*.csv"
-title = "Perda da Política"
+metric = "policy_loss"
+title = TRAINING_METRICS[metric]
+
+# Numero maximo de pontos de cada curva no grafico (Largest-Triangle-Three-Buckets)
+MAX_PONTOS_CURVA = 1000
 
-csv_files = glob.glob(path)
+df_metric = load_training_logs()
+df_metric = df_metric[df_metric["metric"] == metric]
 
 dfs = []
 
@@ -41,10 +55,14 @@ colors = [
 ]
 
 
-for file in csv_files:
-    df = pd.read_csv(file)
-    df["source"] = os.path.basename(file).replace(".csv", "")
-    dfs.append(df[200:])
+for source, df in df_metric.groupby("run", observed=True):
+    df = df.rename(columns={"step": "Step", "value": "Value"})
+    df["source"] = source
+    df = df[200:]
+
+    # Reduz os pontos preservando picos e vales da curva
+    df = df.iloc[lttb(df["Step"].values, df["Value"].values, MAX_PONTOS_CURVA)]
+    dfs.append(df)
 
 df_all = pd.concat(dfs, ignore_index=True)
 ordered_sources = sorted(df_all["source"].unique())
@@ -3,10 +3,17 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 
+from src.processing.text_logs import read_execution_logs
+
 
 """
     Arquivo não contemplado no streamlit
     É necessario passar o caminho da pasta para resgatar os arquivos numberOfCollisionsPerInterval, numberOfSuccessfulTripsPerInterval e Summary
+    Os logs sao lidos em paralelo e guardados em cache binario (.npy) ao lado dos originais (ver src.processing.text_logs)
+
+    Por importar src.processing.text_logs, deve ser executado como modulo a partir da raiz do repositorio:
+
+        python -m src.visualization.auxiliar.plot_average_density_successful_trips_collisions
 """
 
 
@@ -15,10 +22,14 @@ def process_summary_file(pasta_simulacoes, num_exec):
     lista_drones = []
     all_indices = set()
 
-    for i in range(0, num_exec):
-        arquivo_summary = os.path.join(pasta_simulacoes, f'Summary-{i}.txt')
+    logs = read_execution_logs(pasta_simulacoes, 'Summary', num_exec)
+
+    for i, log in enumerate(logs):
+        if log is None:
+            print(f"Arquivo não encontrado: {os.path.join(pasta_simulacoes, f'Summary-{i}.txt')}")
+            continue
 
-        summary_df = pd.read_csv(arquivo_summary, header=None, names=['Tempo', 'Drones'])
+        summary_df = pd.DataFrame(log[:, :2], columns=['Tempo', 'Drones'])
 
         summary_df['Tempo'] = summary_df.index * 0.02
 
@@ -40,17 +51,16 @@ def process_summary_file(pasta_simulacoes, num_exec):
 
 def read_and_process_file(pasta_simulacoes, prefixo_arquivo, num_exec):
     lista_colisoes = []
-    
-    for i in range(0, num_exec):
-        arquivo = os.path.join(pasta_simulacoes, f"{prefixo_arquivo}-{i}.txt")
-        
-        if not os.path.exists(arquivo):
-            print(f"Arquivo não encontrado: {arquivo}")
+
+    logs = read_execution_logs(pasta_simulacoes, prefixo_arquivo, num_exec)
+
+    for i, log in enumerate(logs):
+        if log is None:
+            print(f"Arquivo não encontrado: {os.path.join(pasta_simulacoes, f'{prefixo_arquivo}-{i}.txt')}")
             continue
-        
-        df = pd.read_csv(arquivo, delimiter=',', header=None)
-        df = df.dropna()
-        data = df.to_numpy().flatten()
+
+        # Remove as linhas com valores ausentes
+        data = log[~np.isnan(log).any(axis=1)].flatten()
         lista_colisoes.append(data)
     
     max_length = max(len(data) for data in lista_colisoes)
@@ -95,19 +105,21 @@ def plotar_grafico(media_viagens_por_minuto, media_colisoes_por_minuto, media_dr
     plt.show()
 
 
-#FIXME: alterar caminho e qtd de execuções, ***COM A PASTA 8000-0 (ou equivalente)***
-# Definir parametros
-pasta_simulacoes = '/Volumes/SSD/Projects/Mestrado/RESULTS/Artigo Final/12_ppo_swish_clip/10000-0'
-num_exec = 29
+# A leitura usa um pool de processos, entao o script precisa da protecao do __main__
+if __name__ == "__main__":
+    #FIXME: alterar caminho e qtd de execuções, ***COM A PASTA 8000-0 (ou equivalente)***
+    # Definir parametros
+    pasta_simulacoes = '/Volumes/SSD/Projects/Mestrado/RESULTS/Artigo Final/12_ppo_swish_clip/10000-0'
+    num_exec = 29
 
-# Processar dados de viagens com sucesso
-media_viagens_por_minuto = read_and_process_file(pasta_simulacoes, 'numberOfSuccessfulTripsPerInterval', num_exec)
+    # Processar dados de viagens com sucesso
+    media_viagens_por_minuto = read_and_process_file(pasta_simulacoes, 'numberOfSuccessfulTripsPerInterval', num_exec)
 
-# Processar dados de colisões
-media_colisoes_por_minuto = read_and_process_file(pasta_simulacoes, 'numberOfCollisionsPerInterval', num_exec)
+    # Processar dados de colisões
+    media_colisoes_por_minuto = read_and_process_file(pasta_simulacoes, 'numberOfCollisionsPerInterval', num_exec)
 
-# Processar dados do summary
-tempo_drones, media_drones = process_summary_file(pasta_simulacoes, num_exec)
+    # Processar dados do summary
+    tempo_drones, media_drones = process_summary_file(pasta_simulacoes, num_exec)
 
-# Plotar os dados
-plotar_grafico(media_viagens_por_minuto, media_colisoes_por_minuto, media_drones, tempo_drones)
+    # Plotar os dados
+    plotar_grafico(media_viagens_por_minuto, media_colisoes_por_minuto, media_drones, tempo_drones)
@@ -1,10 +1,11 @@
-import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from dataclasses import dataclass
 from typing import Iterable, List
 import plotly.express as px
 
+from src.utils.stats import group_stats
+
 DEFAULT_ROOT = "/Volumes/SSD/Projects/Mestrado/RESULTS/Artigo Final"
 DEFAULT_DRONE_CSV = f"{DEFAULT_ROOT}/12_multi_model_ml/droneCollisionData.csv"
 DEFAULT_SIMULATION_CSV = f"{DEFAULT_ROOT}/12_multi_model_ml/generalSimulationData.csv"
@@ -52,10 +53,9 @@ def load_collision_summary(drone_csv: str, simulation_csv: str):
 
     taxa_colisao = (num_colisoes / num_drones) * 100
 
-    media = np.mean(taxa_colisao)
-    desvio_padrao = np.std(taxa_colisao)
-    n = len(taxa_colisao)
-    intervalo = 1.96 * (desvio_padrao / np.sqrt(n)) if n > 0 else 0
+    stats = group_stats(taxa_colisao, ddof=0)
+    media = stats["media"]
+    intervalo = stats["intervalo"]
 
     print(percent_drone)
     print(media)
@@ -1,12 +1,32 @@
-import pandas as pd
+"""
+    Trajetorias 3D dos drones, do inicio ate o pouso da entrega.
+
+    Usa src.processing.flight_phases, src.processing.trajectory_store e src.utils.downsampling,
+    entao deve ser executado como modulo a partir da raiz do repositorio:
+
+        python -m src.visualization.auxiliar.trajectory_plot
+"""
+
+import glob
+
+import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D  # noqa: F401
 
+from src.processing.flight_phases import POUSO_ENTREGA, Y_DECOLAGEM, Y_POUSO, segment_phases
+from src.processing.trajectory_store import open_trajectory_store
+from src.utils.downsampling import rdp
+
+# Logs Log_Path_drone <drone>_<simulacao>.csv e o armazenamento colunar gerado a partir deles
+LOGS = "src/visualization/auxiliar/data/trajectory/*.csv"
+STORE = "src/visualization/auxiliar/data/trajectory_store"
+
+# Trajetorias identificadas por (simulacao, drone)
 arquivos = {
-    "PPO (Swish, Clip)": "src/visualization/auxiliar/data/trajectory/Log_Path_drone 0_5.csv",
-    "A2C (Swish, Clip)": "src/visualization/auxiliar/data/trajectory/Log_Path_drone 0_7.csv",
-    "SingleDrone": "src/visualization/auxiliar/data/trajectory/Log_Path_drone 1_7.csv",
-    "SpeedDrone": "src/visualization/auxiliar/data/trajectory/Log_Path_drone 0_4.csv",
+    "PPO (Swish, Clip)": (5, 0),
+    "A2C (Swish, Clip)": (7, 0),
+    "SingleDrone": (7, 1),
+    "SpeedDrone": (4, 0),
 
 }
 cores = {
@@ -21,40 +41,44 @@ dados = {}
 # -----------------------
 # DETECÇÃO DA "IDA"
 # -----------------------
-# Não existe coluna explícita marcando ida/volta, então detectamos o pouso:
-# o drone decola (y ultrapassa Y_DECOLAGEM), voa, e ao chegar no destino
-# desce perto do chão (y abaixo de Y_POUSO) pela primeira vez após decolar.
-# Cortamos a trajetória nesse ponto, descartando a volta.
-Y_DECOLAGEM = 5.0
-Y_POUSO = 3.0
+# Não existe coluna explícita marcando ida/volta, então as etapas de voo são
+# inferidas pela altitude (ver src.processing.flight_phases): o drone decola
+# (y ultrapassa Y_DECOLAGEM), voa, e ao chegar no destino desce perto do chão
+# (y abaixo de Y_POUSO). Cortamos a trajetória no pouso da entrega, descartando a volta.
+
+# Numero maximo de pontos de cada trajetoria no grafico (Ramer-Douglas-Peucker)
+MAX_PONTOS_TRAJETORIA = 500
 
 
 def apenas_ida(df, y_decolagem=Y_DECOLAGEM, y_pouso=Y_POUSO):
-    decolou = False
-    for i, y in enumerate(df["y"].values):
-        if not decolou and y > y_decolagem:
-            decolou = True
-        elif decolou and y < y_pouso:
-            return df.iloc[: i + 1].reset_index(drop=True)
-    return df  # não detectou pouso: mantém tudo
+    fases = segment_phases(df["y"].values, y_decolagem=y_decolagem, y_pouso=y_pouso)
+
+    # Primeira amostra no chão após o pouso da entrega
+    pouso = np.flatnonzero((fases == POUSO_ENTREGA) & (df["y"].values < y_pouso))
+    if len(pouso) == 0:
+        return df  # não detectou pouso: mantém tudo
+    return df.iloc[: pouso[0] + 1].reset_index(drop=True)
 
 
 # -----------------------
-# LEITURA COM PANDAS
+# LEITURA DO ARMAZENAMENTO COLUNAR
 # -----------------------
-for nome, caminho in arquivos.items():
-    try:
-        df = pd.read_csv(caminho)
-    except FileNotFoundError:
-        print(f"[aviso] arquivo não encontrado, pulando: {caminho}")
+# Gerado a partir dos CSVs e reaproveitado enquanto eles nao mudarem (ver src.processing.trajectory_store)
+store = open_trajectory_store(sorted(glob.glob(LOGS)), STORE)
+
+for nome, (simulacao, drone) in arquivos.items():
+    if (simulacao, drone) not in store:
+        print(f"[aviso] trajetória não encontrada, pulando: simulação {simulacao}, drone {drone}")
         continue
 
-    # garantir ordenação temporal (essencial para trajetória correta)
-    if "time" in df.columns:
-        df = df.sort_values(by="time")
+    # Ja ordenada pelo tempo (essencial para trajetória correta)
+    df = store.frame(simulacao, drone, columns=["time", "x", "y", "z"])
 
     df = apenas_ida(df)
 
+    # Reduz os pontos mantendo a forma da trajetoria 3D (e o ponto inicial)
+    df = df.iloc[rdp(df[["x", "y", "z"]].values, MAX_PONTOS_TRAJETORIA)]
+
     dados[nome] = df
 
 # -----------------------
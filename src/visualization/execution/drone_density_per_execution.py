@@ -1,5 +1,6 @@
 import numpy as np
 from src.utils.graph_plotly import plot_bar
+from src.utils.stats import align_executions
 
 # ARQUIVO: generalSimulationData
 
@@ -42,30 +43,15 @@ def plot_drone_density_per_execution(data_list, labels=None):
     if labels is None:
         labels = [f"Simulaçao {i+1}" for i in range(len(data_list))]
 
-    # Obter todas as execuçoes unicas
-    all_execucoes = sorted(set(exec_num for data in data_list for exec_num in data['execucoes']))
-    num_exec = [str(exec_num) for exec_num in all_execucoes]
-
-    # Preparar os valores para cada simulaçao
-    values_list = []
-    intervalos_list = []
-    
-    for data in data_list:
-        # Criar um dicionario para mapear execuçoes para numero de drones
-        exec_num_drones_dict = dict(zip(data['execucoes'], data['num_drones']))
-        
-        # Obter os valores na ordem de all_execucoes
-        series_values = [exec_num_drones_dict.get(exec_num, 0) for exec_num in all_execucoes]
-        values_list.append(series_values)
-        
-        # Intervalos sao zeros
-        series_intervalos = [0] * len(all_execucoes)
-        intervalos_list.append(series_intervalos)
+    # Matriz execuçoes x simulaçoes (NaN onde a simulaçao nao tem a execuçao)
+    execucoes, matrix = align_executions(data_list, 'num_drones')
+    num_exec = [str(exec_num) for exec_num in execucoes]
+    values_list = list(matrix.T)
 
     # Chama a funçao plot_bar
     fig = plot_bar(
         values=values_list,
-        intervalos=intervalos_list,
+        intervalos=None,
         labels=num_exec,
         x_label='Execuçao',
         y_label='Quantidade de Drones',
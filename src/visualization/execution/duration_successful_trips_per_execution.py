@@ -1,15 +1,16 @@
 import numpy as np
 from src.utils.graph_plotly import plot_bar
+from src.utils.stats import align_executions, group_stats
 
 
 #ARQUIVO: generalDroneData
 
-def _calculate_interval(series):
-    mean = series.mean()
-    std = series.std()
-    n = series.count()
-    interval = 1.96 * (std / np.sqrt(n))
-    return interval
+DURATION_PER_EXECUTION_SPEC = {
+    'column': "tempo de viagem total dos drones no tempo estavel",
+    'dropna': ["drone ID"],
+    'ddof': 1,
+    'finalize': 'per_execution',
+}
 
 
 def calculate_duration_successful_trips_per_execution(df):
@@ -24,31 +25,23 @@ def calculate_duration_successful_trips_per_execution(df):
     """
     df.columns = df.columns.str.strip()
     # Remove linhas sem "drone ID"
-    df = df.dropna(subset=["drone ID"])
+    df = df.dropna(subset=DURATION_PER_EXECUTION_SPEC['dropna'])
 
     # Agrupa por "Numero da execucao" e calcula as estatisticas
-    df_grouped = (
-        df.groupby("Numero da execucao")
-        .agg(
-            {
-                "tempo de viagem total dos drones no tempo estavel": ["mean", "std", _calculate_interval],
-            }
-        )
-        .dropna()
-        .reset_index()
+    stats = group_stats(
+        df[DURATION_PER_EXECUTION_SPEC['column']].values,
+        groups=df["Numero da execucao"].values,
+        ddof=DURATION_PER_EXECUTION_SPEC['ddof'],
     )
 
-    # Extrai as estatisticas
-    media = df_grouped[("tempo de viagem total dos drones no tempo estavel", "mean")].values
-    desvio_padrao = df_grouped[("tempo de viagem total dos drones no tempo estavel", "std")].values
-    intervalo = df_grouped[("tempo de viagem total dos drones no tempo estavel", "_calculate_interval")].values
-    execucoes = df_grouped["Numero da execucao"].values.astype(int)
+    # Descarta execuçoes sem desvio padrao (menos de duas viagens)
+    valid = ~np.isnan(stats["desvio_padrao"])
 
     return {
-        "execucoes": execucoes,
-        "media": media,
-        "desvio_padrao": desvio_padrao,
-        "intervalo": intervalo
+        "execucoes": stats["grupos"][valid].astype(int),
+        "media": stats["media"][valid],
+        "desvio_padrao": stats["desvio_padrao"][valid],
+        "intervalo": stats["intervalo"][valid]
     }
 
 
@@ -70,30 +63,15 @@ def plot_duration_successful_trips_per_execution(data_list, labels=None):
     if labels is None:
         labels = [f"Simulaçao {i+1}" for i in range(len(data_list))]
 
-    # Obter todas as execuçoes unicas
-    all_execucoes = sorted(set(exec_num for data in data_list for exec_num in data['execucoes']))
-    list_exec = [str(exec_num) for exec_num in all_execucoes]
-
-    # Preparar os valores para cada simulaçao
-    values_list = []
-    intervalos_list = []
-    
-    for data in data_list:
-        
-        # Mapear execuçoes para medias e intervalos
-        exec_media_dict = dict(zip(data['execucoes'], data['media']))
-        # Obter os valores na ordem de all_execucoes
-        series_values = [exec_media_dict.get(exec_num, 0) for exec_num in all_execucoes]
-        values_list.append(series_values)
-        
-        # Intervalos sao zeros
-        series_intervalos = [0] * len(all_execucoes)
-        intervalos_list.append(series_intervalos)
+    # Matriz execuçoes x simulaçoes (NaN onde a simulaçao nao tem a execuçao)
+    execucoes, matrix = align_executions(data_list, 'media')
+    list_exec = [str(exec_num) for exec_num in execucoes]
+    values_list = list(matrix.T)
 
     # Chama a funçao plot_bar
     fig = plot_bar(
         values=values_list,
-        intervalos=intervalos_list,
+        intervalos=None,
         labels=list_exec,
         x_label='Execuçao',
         y_label='Tempo (s)',
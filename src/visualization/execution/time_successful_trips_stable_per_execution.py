@@ -1,6 +1,5 @@
 from src.utils.graph_plotly import plot_histogram
-import pandas as pd
-import plotly.express as px
+import numpy as np
 
 
 #ARQUIVO: generalDroneData
@@ -55,26 +54,13 @@ def plot_time_successful_trips_stable_per_execution(data_list, labels=None):
     if labels is None:
         labels = [f"Simulacao {i+1}" for i in range(len(data_list))]
 
-    # Prepara df para plot
-    data_frames = []
-    for data, sim_name in zip(data_list, labels):
-        df = pd.DataFrame({
-            'time': data,
-            'Simulacao': sim_name
-        })
-        data_frames.append(df)
-
-    df_all = pd.concat(data_frames, ignore_index=True)
-
-    # Criacaçao do grafico
-    labels={'Tempo de Viagem': 'Tempo (s)'}
-
+    # Histograma calculado no servidor, com os mesmos bins para todas as simulaçoes
     fig = plot_histogram(
-        df_all, 
+        [np.asarray(data, dtype=np.float64) for data in data_list],
+        labels=labels,
         title='Histograma do Tempo de Viagem',
-        x='time',
-        color='Simulacao',
-        labels=labels
+        x_label='Tempo (s)',
+        legend_title='Simulacao'
     )
 
-    return fig
\ No newline at end of file
+    return fig
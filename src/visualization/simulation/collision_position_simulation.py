@@ -0,0 +1,56 @@
+import numpy as np
+from src.utils.graph_plotly import plot_scatter_density
+
+# ARQUIVO: droneCollisionData
+
+def calculate_collision_position(df):
+    """
+    Coleta a posiçao (eixos X e Z) de cada colisao.
+
+    Args:
+        df (DataFrame): DataFrame contendo os dados das colisoes.
+
+    Returns:
+        dict: Dicionario com os arrays 'x' e 'z' (float32) das colisoes com posiçao valida.
+    """
+    df.columns = df.columns.str.strip()
+
+    df = df.dropna(subset=["posicao da colisao no eixo x", "posicao da colisao no eixo z"])
+
+    return {
+        "x": df["posicao da colisao no eixo x"].to_numpy(dtype=np.float32),
+        "z": df["posicao da colisao no eixo z"].to_numpy(dtype=np.float32)
+    }
+
+
+def plot_collision_position(data_list, labels=None):
+    """
+    Gera o grafico de posiçao das colisoes.
+
+    Com poucas colisoes cada uma e um ponto (WebGL); com muitas o grafico vira um mapa
+    de densidade calculado no servidor, com as simulaçoes sobrepostas.
+
+    Args:
+        data_list (list or dict): Valores calculados por calculate_collision_position.
+        labels (list, optional): Nomes das simulaçoes.
+
+    Returns:
+        Figure: Objeto de figura Plotly.
+    """
+    if isinstance(data_list, dict):
+        data_list = [data_list]
+        labels = labels or [""]
+
+    elif not isinstance(data_list, list):
+        raise ValueError("O parâmetro 'data' deve ser um dicionrio ou uma lista de dicionrios.")
+
+    labels = labels or [f"Simulaçao {i+1}" for i in range(len(data_list))]
+
+    return plot_scatter_density(
+        xs=[data['x'] for data in data_list],
+        ys=[data['z'] for data in data_list],
+        labels=labels,
+        x_label='Eixo X',
+        y_label='Eixo Z',
+        title='Posição das colisões',
+    )
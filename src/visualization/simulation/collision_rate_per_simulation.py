@@ -1,5 +1,7 @@
 import numpy as np
+from src.utils.bootstrap import bar_intervals
 from src.utils.graph_plotly import plot_bar
+from src.utils.stats import execution_totals, group_stats
 
 # ARQUIVO: generalSimulationData
 
@@ -20,16 +22,13 @@ def calculate_collision_rate_per_simulation(df):
     with np.errstate(divide='ignore', invalid='ignore'):
         taxa_colisoes = np.where(num_drones != 0, (num_colisoes / num_drones) * 100, 0)
 
-    media = np.mean(taxa_colisoes)
-    desvio_padrao = np.std(taxa_colisoes)
-
-    n = len(taxa_colisoes)
-    intervalo = 1.96 * (desvio_padrao / np.sqrt(n)) if n > 0 else 0  # Evitar divisao por zero
+    stats = group_stats(taxa_colisoes, ddof=0)
 
     return {
-        "media": media,
-        "desvio_padrao": desvio_padrao,
-        "intervalo": intervalo
+        "media": stats["media"],
+        "desvio_padrao": stats["desvio_padrao"],
+        "intervalo": stats["intervalo"],
+        **execution_totals(taxa_colisoes, df["Numero da execucao"].values)
     }
 
 
@@ -45,14 +44,12 @@ def plot_collision_rate_per_simulation(data, labels=None):
         Figure: Objeto de figura Plotly.
     """
     if isinstance(data, dict):
-        media = np.array([data['media']])
-        intervalo = np.array([data['intervalo']])
+        media, intervalo, intervalo_inferior = bar_intervals([data])
         labels = labels or [""]
     
     elif isinstance(data, list):
         # Caso de multiplas simulaçoes, agregamos os dados
-        media = np.array([d['media'] for d in data])
-        intervalo = np.array([d['intervalo'] for d in data])
+        media, intervalo, intervalo_inferior = bar_intervals(data)
         labels = labels or [f"Simulaçao {i+1}" for i in range(len(data))]
     
     else:
@@ -61,6 +58,7 @@ def plot_collision_rate_per_simulation(data, labels=None):
     return plot_bar(
         values=media,
         intervalos=intervalo,
+        intervalos_inferiores=intervalo_inferior,
         labels=labels,
         title="Taxa de Colisão (%)",
         x_label="Taxa de Lançamento (drones/min)",
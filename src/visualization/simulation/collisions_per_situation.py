@@ -1,4 +1,5 @@
 from src.utils.graph_plotly import plot_bar
+from src.utils.stats import group_stats
 import numpy as np
 
 
@@ -37,62 +38,106 @@ CATEGORIAS = {
     "Cruising": [20, 1, 2],
 }
 
+NUM_ETAPAS = 6
+NUM_SITUACOES = 21
 
-def calculate_collisions_per_situation(df):
+
+def _build_situation_table():
     """
-    Calcula o numero medio de colisoes por situaçao e por categoria.
+    Compila MAPPING_SITUATIONS em uma tabela densa (etapa1 x etapa2). Pares sem situaçao valem -1.
+    """
+    table = np.full((NUM_ETAPAS, NUM_ETAPAS), -1, dtype=np.int8)
+    for (etapa1, etapa2), situacao in MAPPING_SITUATIONS.items():
+        table[etapa1, etapa2] = situacao
+    return table
+
+
+def _build_category_matrix():
+    """
+    Matriz indicadora (situaçao x categoria) usada para somar as situaçoes de cada categoria.
+    """
+    matrix = np.zeros((NUM_SITUACOES, len(CATEGORIAS)))
+    for j, indices in enumerate(CATEGORIAS.values()):
+        matrix[indices, j] = 1
+    return matrix
+
+
+SITUATION_TABLE = _build_situation_table()
+CATEGORY_MATRIX = _build_category_matrix()
+
+
+def classify_situations(etapa1, etapa2):
+    """
+    Classifica os pares de etapas das colisoes usando a tabela SITUATION_TABLE.
 
     Args:
-        df (DataFrame): DataFrame contendo os dados de colisoes.
+        etapa1 (np.ndarray): Etapa da viagem do primeiro drone.
+        etapa2 (np.ndarray): Etapa da viagem do segundo drone.
 
     Returns:
-        dict: Dicionario contendo medias, intervalos de confiança e labels das categorias.
+        np.ndarray: Indice da situaçao de cada colisao, ou -1 para pares nao mapeados.
     """
-    df.columns = df.columns.str.strip()
+    etapa1 = np.asarray(etapa1, dtype=float)
+    etapa2 = np.asarray(etapa2, dtype=float)
 
-    # Aplicar a funçao de mapeamento para cada linha
-    df["situacao"] = df.apply(
-        lambda row: MAPPING_SITUATIONS.get(
-            (row["etapa da viagem dos pares que colidiram1"], row["etapa da viagem dos pares que colidiram2"]),
-            np.nan
-        ),
-        axis=1,
+    # Apenas codigos inteiros dentro da tabela sao validos (NaN falha nas comparaçoes)
+    valid = (
+        (etapa1 >= 0) & (etapa1 < NUM_ETAPAS) & (etapa1 == np.floor(etapa1))
+        & (etapa2 >= 0) & (etapa2 < NUM_ETAPAS) & (etapa2 == np.floor(etapa2))
     )
 
-    # Remover linhas com situaçao NaN
-    df = df.dropna(subset=["situacao"])
+    situacao = np.full(etapa1.shape, -1, dtype=np.int8)
+    situacao[valid] = SITUATION_TABLE[etapa1[valid].astype(np.intp), etapa2[valid].astype(np.intp)]
+    return situacao
 
-    # Agrupar por execuçao e situaçao, contando ocorrencias
-    df_grouped = df.groupby(["Numero da execucao", "situacao"]).size().unstack(fill_value=0)
 
-    # Preencher colunas ausentes com zero
-    df_grouped = df_grouped.reindex(columns=range(21), fill_value=0)
+def calculate_collisions_per_situation(df):
+    """
+    Calcula o numero medio de colisoes por situaçao e por categoria.
 
-    # Calcular medias e desvios padrao por situaçao
-    vetor_medias = df_grouped.mean(axis=0).values  # Media por situaçao
-    vetor_desvio_padrao = df_grouped.std(axis=0).values  # Desvio padrao por situaçao
-    num_execucoes = df_grouped.shape[0]
+    Args:
+        df (DataFrame): DataFrame contendo os dados de colisoes.
 
-    # Calcular intervalos de confiança (95%)
-    intervalo_confianca = 1.96 * vetor_desvio_padrao / np.sqrt(num_execucoes)
+    Returns:
+        dict: Dicionario contendo medias, intervalos de confiança e labels das categorias.
+    """
+    df.columns = df.columns.str.strip()
 
-    # Agrupar situaçoes em categorias maiores
-    media_categorias = []
-    intervalo_confianca_categorias = []
-    categorias = []
+    situacao = classify_situations(
+        df["etapa da viagem dos pares que colidiram1"].to_numpy(dtype=float, na_value=np.nan),
+        df["etapa da viagem dos pares que colidiram2"].to_numpy(dtype=float, na_value=np.nan),
+    )
 
-    for categoria, indices in CATEGORIAS.items():
-        media = np.nansum(vetor_medias[indices])
-        intervalo = np.nansum(intervalo_confianca[indices])
+    # Remover colisoes sem situaçao
+    valid = situacao >= 0
+    situacao = situacao[valid]
+    execucoes = df["Numero da execucao"].to_numpy()[valid]
+
+    # Contagem de ocorrencias por execuçao (linhas) e situaçao (colunas)
+    _, exec_index = np.unique(execucoes, return_inverse=True)
+    num_execucoes = exec_index.max() + 1 if len(exec_index) else 0
+    contagens = np.bincount(
+        exec_index * NUM_SITUACOES + situacao,
+        minlength=num_execucoes * NUM_SITUACOES,
+    ).reshape(num_execucoes, NUM_SITUACOES)
+
+    # Calcular medias e intervalos de confiança (95%) por situaçao
+    stats = group_stats(
+        contagens.ravel(),
+        groups=np.tile(np.arange(NUM_SITUACOES), num_execucoes),
+        num_groups=NUM_SITUACOES,
+    )
+    vetor_medias = stats["media"]
+    intervalo_confianca = stats["intervalo"]
 
-        media_categorias.append(media)
-        intervalo_confianca_categorias.append(intervalo)
-        categorias.append(categoria)
+    # Agrupar situaçoes em categorias maiores (situaçoes sem valor contam como zero)
+    media_categorias = np.nan_to_num(vetor_medias) @ CATEGORY_MATRIX
+    intervalo_confianca_categorias = np.nan_to_num(intervalo_confianca) @ CATEGORY_MATRIX
 
     return {
-        "media_categorias": np.array(media_categorias),
-        "intervalo_confianca_categorias": np.array(intervalo_confianca_categorias),
-        "categorias": categorias
+        "media_categorias": media_categorias,
+        "intervalo_confianca_categorias": intervalo_confianca_categorias,
+        "categorias": list(CATEGORIAS)
     }
 
 
@@ -1,5 +1,6 @@
-import numpy as np
+from src.utils.bootstrap import bar_intervals
 from src.utils.graph_plotly import plot_bar
+from src.utils.stats import execution_totals, group_stats
 
 # ARQUIVO: generalSimulationData
 
@@ -19,15 +20,13 @@ def calculate_drone_density_per_simulation(df):
     num_drones = df["numero total de drones lancados"].astype(int)
 
     # Calcula a media, desvio padrão e intervalo de confiança
-    media = num_drones.mean()
-    desvio_padrao = num_drones.std()
-    n = num_drones.count()
-    intervalo = 1.96 * (desvio_padrao / np.sqrt(n)) if n > 0 else 0
+    stats = group_stats(num_drones.values)
 
     return {
-        "media": media,
-        "desvio_padrao": desvio_padrao,
-        "intervalo": intervalo
+        "media": stats["media"],
+        "desvio_padrao": stats["desvio_padrao"],
+        "intervalo": stats["intervalo"],
+        **execution_totals(num_drones.values, df["Numero da execucao"].values)
     }
 
 
@@ -43,20 +42,19 @@ def plot_drone_density_per_simulation(data, labels=None):
     """
 
     if isinstance(data, dict):
-        media = np.array([data['media']])
-        intervalo = np.array([data['intervalo']])
+        media, intervalo, intervalo_inferior = bar_intervals([data])
         labels = labels or [""]
     
     elif isinstance(data, list):
         # Caso de multiplas simulaçoes, agregamos os dados
-        media = np.array([d['media'] for d in data])
-        intervalo = np.array([d['intervalo'] for d in data])
+        media, intervalo, intervalo_inferior = bar_intervals(data)
         labels = labels or [f"Simulaçao {i+1}" for i in range(len(data))]
 
     # Chama a função plot_bar
     fig = plot_bar(
         values=media,
         intervalos=intervalo,
+        intervalos_inferiores=intervalo_inferior,
         labels=labels,
         x_label="Taxa de Lançamento (drones/min)",
         y_label='Números de drones',
@@ -1,19 +1,17 @@
-import numpy as np
+from src.utils.bootstrap import bar_intervals
 from src.utils.graph_plotly import plot_bar
+from src.utils.stats import execution_totals, group_stats
 
 #ARQUIVO: generalDroneData
 
-def calculate_confidence_interval(series):
-    mean = series.mean()
-    std = series.std()
-    n = series.count()
-    
-    if n > 0:
-        interval = 1.96 * (std / np.sqrt(n))
-    else:
-        interval = 0
+# Mesma coluna e filtro de calculate_duration_successful_trips_per_execution, agregados na simulaçao
+DURATION_PER_SIMULATION_SPEC = {
+    'column': "tempo de viagem total dos drones no tempo estavel",
+    'dropna': ["drone ID"],
+    'ddof': 1,
+    'finalize': 'total',
+}
 
-    return interval
 
 def calculate_duration_successful_trips_per_simulation(df):
     """
@@ -26,19 +24,18 @@ def calculate_duration_successful_trips_per_simulation(df):
         dict: Dict contendo 'media', 'desvio_padrao', and 'intervalo'.
     """
     df.columns = df.columns.str.strip()
-    df = df.dropna(subset=["drone ID", "tempo de viagem total dos drones no tempo estavel"])
+    column = DURATION_PER_SIMULATION_SPEC['column']
+    df = df.dropna(subset=[*DURATION_PER_SIMULATION_SPEC['dropna'], column])
 
-    travel_times = df["tempo de viagem total dos drones no tempo estavel"]
+    travel_times = df[column]
 
-    mean = travel_times.mean()
-    std = travel_times.std()
-    
-    interval = calculate_confidence_interval(travel_times)
+    stats = group_stats(travel_times.values, ddof=DURATION_PER_SIMULATION_SPEC['ddof'])
 
     return {
-        "media": mean,
-        "desvio_padrao": std,
-        "intervalo": interval
+        "media": stats["media"],
+        "desvio_padrao": stats["desvio_padrao"],
+        "intervalo": stats["intervalo"],
+        **execution_totals(travel_times.values, df["Numero da execucao"].values)
     }
 
 def plot_duration_successful_trips_per_simulation(data, labels=None):
@@ -53,20 +50,19 @@ def plot_duration_successful_trips_per_simulation(data, labels=None):
         Figure: Objeto de figura Plotly
     """
     if isinstance(data, dict):
-        media = np.array([data['media']])
-        intervalo = np.array([data['intervalo']])
+        media, intervalo, intervalo_inferior = bar_intervals([data])
         labels = labels or [""]
     
     elif isinstance(data, list):
         # Caso de multiplas simulaçoes, agregamos os dados
-        media = np.array([d['media'] for d in data])
-        intervalo = np.array([d['intervalo'] for d in data])
+        media, intervalo, intervalo_inferior = bar_intervals(data)
         labels = labels or [f"Simulaçao {i+1}" for i in range(len(data))]
 
     # Chama funcao de plot
     fig = plot_bar(
         values=media,
         intervalos=intervalo,
+        intervalos_inferiores=intervalo_inferior,
         labels=labels,
         x_label='Taxa de Lançamento (drones/min)',
         y_label='Tempo (s)',
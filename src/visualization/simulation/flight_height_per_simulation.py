@@ -1,5 +1,4 @@
 from src.utils.graph_plotly import plot_boxsplot
-import pandas as pd
 
 # ARQUIVO: generalDroneData
 
@@ -46,38 +45,18 @@ def plot_flight_height(data_list, labels=None):
     if labels is None:
         labels = [f"Simulacao {i+1}" for i in range(len(data_list))]
 
-    # Prepara df para plot
-    data_frames = []
-    for data, sim_name in zip(data_list, labels):
-        df_max = data['max_altitude']
-        df_min = data['min_altitude']
-
-        df_max = pd.DataFrame({
-            'Altitude': df_max,
-            'Type': 'Maximum',
-            'Simulacao': sim_name
-        })
-        df_min = pd.DataFrame({
-            'Altitude': df_min,
-            'Type': 'Minimum',
-            'Simulacao': sim_name
-        })
-
-        df_combined = pd.concat([df_max, df_min], ignore_index=True)
-        data_frames.append(df_combined)
-
-    df_all = pd.concat(data_frames, ignore_index=True)
+    # Estatisticas das caixas calculadas no servidor, por simulaçao e tipo
+    groups = [[data['max_altitude'], data['min_altitude']] for data in data_list]
 
     # Criacaçao do grafico
-    labels={'Type': "Arrival rate (drones/min)", 'Altitude': 'Altitude (m)'}
     fig = plot_boxsplot(
-        df_all,
-        x='Type',
-        y='Altitude',
-        color='Simulacao',
+        groups,
+        labels=labels,
+        categories=['Maximum', 'Minimum'],
         title='Maximum and Minimum Flight Height',
-        labels=labels
+        x_label="Arrival rate (drones/min)",
+        y_label='Altitude (m)',
+        legend_title='Simulacao'
     )
 
     return fig
-
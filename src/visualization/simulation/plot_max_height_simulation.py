@@ -1,8 +1,18 @@
-import numpy as np
+from src.utils.bootstrap import bar_intervals
 from src.utils.graph_plotly import plot_bar
+from src.utils.stats import execution_totals, group_stats
 
 # ARQUIVO: generalDroneData
 
+# Desvio padrao populacional (ddof=0), tambem na versao em blocos
+MAX_HEIGHT_SPEC = {
+    'column': "altitude maxima atingida",
+    'dropna': [],
+    'ddof': 0,
+    'finalize': 'total',
+}
+
+
 def calculate_max_height_simulation(df):
     """
     Calcula a taxa de colisao com base no DataFrame fornecido.
@@ -13,20 +23,16 @@ def calculate_max_height_simulation(df):
     Returns:
         dict: Dicionrio com 'media', 'desvio_padrao' e 'intervalo' da taxa de colisao.
     """
-    height = df["altitude maxima atingida"].values
-
-    height = height[~np.isnan(height)]
-
-    media = np.mean(height)
-    desvio_padrao = np.std(height)
+    height = df[MAX_HEIGHT_SPEC['column']].values
 
-    n = len(height)
-    intervalo = 1.96 * (desvio_padrao / np.sqrt(n)) if n > 0 else 0  # Evitar divisao por zero
+    # Valores NaN sao ignorados por group_stats
+    stats = group_stats(height, ddof=MAX_HEIGHT_SPEC['ddof'])
 
     return {
-        "media": media,
-        "desvio_padrao": desvio_padrao,
-        "intervalo": intervalo
+        "media": stats["media"],
+        "desvio_padrao": stats["desvio_padrao"],
+        "intervalo": stats["intervalo"],
+        **execution_totals(height, df["Numero da execucao"].values)
     }
 
 
@@ -42,14 +48,12 @@ def plot_max_height_simulation(data, labels=None):
         Figure: Objeto de figura Plotly.
     """
     if isinstance(data, dict):
-        media = np.array([data['media']])
-        intervalo = np.array([data['intervalo']])
+        media, intervalo, intervalo_inferior = bar_intervals([data])
         labels = labels or [""]
     
     elif isinstance(data, list):
         # Caso de multiplas simulaçoes, agregamos os dados
-        media = np.array([d['media'] for d in data])
-        intervalo = np.array([d['intervalo'] for d in data])
+        media, intervalo, intervalo_inferior = bar_intervals(data)
         labels = labels or [f"Simulaçao {i+1}" for i in range(len(data))]
     
     else:
@@ -58,6 +62,7 @@ def plot_max_height_simulation(data, labels=None):
     return plot_bar(
         values=media,
         intervalos=intervalo,
+        intervalos_inferiores=intervalo_inferior,
         labels=labels,
         x_label="Taxa de Lançamento (drones/min)",
         y_label='Altitude máxima atingida (m)',
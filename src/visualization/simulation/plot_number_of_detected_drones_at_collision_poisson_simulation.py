@@ -1,8 +1,19 @@
 import numpy as np
+from src.utils.bootstrap import bar_intervals
 from src.utils.graph_plotly import plot_bar
+from src.utils.stats import group_stats
 
 # ARQUIVO: droneCollisionData
 
+# O ddof vale para o desvio padrao entre as medias das execuçoes
+DETECTED_DRONES_SPEC = {
+    'column': "numero de drones detectados na colisao",
+    'dropna': [],
+    'ddof': 1,
+    'finalize': 'mean_of_executions',
+}
+
+
 def calculate_detected_drones_simulation(df):
     """
     Calcula a quantidade media de drones detectados no momento de colisão por execução e a media geral da simulação.
@@ -15,19 +26,21 @@ def calculate_detected_drones_simulation(df):
     """
     
     # Agrupa por nnum de execução e calcula a media para cada execução
-    grouped_means = df.groupby('Numero da execucao')['numero de drones detectados na colisao'].mean()
+    grouped_means = group_stats(
+        df[DETECTED_DRONES_SPEC['column']].to_numpy(dtype=float, na_value=np.nan),
+        groups=df['Numero da execucao'].to_numpy(),
+    )["media"]
 
     # Calcula a media geral das medias por execução
-    media = grouped_means.mean()
-    desvio_padrao = grouped_means.std()
-
-    n = len(grouped_means)
-    intervalo = 1.96 * (desvio_padrao / np.sqrt(n)) if n > 0 else 0  # Evitar divisão por zero
+    stats = group_stats(grouped_means, ddof=DETECTED_DRONES_SPEC['ddof'])
 
     return {
-        "media": media,
-        "desvio_padrao": desvio_padrao,
-        "intervalo": intervalo
+        "media": stats["media"],
+        "desvio_padrao": stats["desvio_padrao"],
+        "intervalo": stats["intervalo"],
+        # Cada execuçao entra no bootstrap com a sua media, como no calculo acima
+        "soma_execucoes": grouped_means,
+        "n_execucoes": np.ones(len(grouped_means), dtype=np.int64)
     }
 
 
@@ -43,14 +56,12 @@ def plot_dected_drones_per_simulation(data, labels=None):
         Figure: Objeto de figura Plotly.
     """
     if isinstance(data, dict):
-        media = np.array([data['media']])
-        intervalo = np.array([data['intervalo']])
+        media, intervalo, intervalo_inferior = bar_intervals([data])
         labels = labels or [""]
     
     elif isinstance(data, list):
         # Caso de multiplas simulaçoes, agregamos os dados
-        media = np.array([d['media'] for d in data])
-        intervalo = np.array([d['intervalo'] for d in data])
+        media, intervalo, intervalo_inferior = bar_intervals(data)
         labels = labels or [f"Simulaçao {i+1}" for i in range(len(data))]
     
     else:
@@ -59,6 +70,7 @@ def plot_dected_drones_per_simulation(data, labels=None):
     return plot_bar(
         values=media,
         intervalos=intervalo,
+        intervalos_inferiores=intervalo_inferior,
         labels=labels,
         x_label="Taxa de lançamento (drones/min)",
         y_label='Números de drones',
@@ -0,0 +1,69 @@
+import numpy as np
+import plotly.express as px
+import plotly.graph_objs as go
+
+from src.utils.downsampling import lttb
+
+# ARQUIVO: escalares de treinamento (src.processing.training_logs)
+
+# Numero maximo de pontos de cada curva no grafico (Largest-Triangle-Three-Buckets)
+MAX_PONTOS_CURVA = 1000
+
+
+def _rgba(color, alpha):
+    color = color.lstrip("#")
+    r, g, b = (int(color[i:i + 2], 16) for i in (0, 2, 4))
+    return f"rgba({r}, {g}, {b}, {alpha})"
+
+
+def plot_training_curves(df, title, show_band=True, max_points=MAX_PONTOS_CURVA):
+    """
+    Gera o grafico das curvas de treinamento suavizadas, uma por execuçao.
+
+    Args:
+        df (DataFrame): Tabela retornada por smooth_training_logs, filtrada para uma metrica.
+        title (str): Titulo do eixo Y.
+        show_band (bool): Se True, exibe a faixa de minimo e maximo de cada execuçao.
+        max_points (int): Numero maximo de pontos de cada curva.
+
+    Returns:
+        Figure: Objeto de figura Plotly.
+    """
+    colors = px.colors.qualitative.Plotly
+    fig = go.Figure()
+
+    for i, (run, df_run) in enumerate(df.groupby("run", observed=True, sort=True)):
+        color = colors[i % len(colors)]
+
+        # Reduz os pontos preservando picos e vales da curva suavizada
+        keep = lttb(df_run["step"].to_numpy(), df_run["ema"].to_numpy(), max_points)
+        step = df_run["step"].to_numpy()[keep]
+
+        if show_band:
+            fig.add_trace(go.Scatter(
+                x=np.concatenate([step, step[::-1]]),
+                y=np.concatenate([df_run["maximo"].to_numpy()[keep], df_run["minimo"].to_numpy()[keep][::-1]]).astype(np.float32),
+                fill="toself",
+                fillcolor=_rgba(color, 0.2),
+                line=dict(width=0),
+                hoverinfo="skip",
+                legendgroup=run,
+                showlegend=False
+            ))
+
+        fig.add_trace(go.Scatter(
+            x=step,
+            y=df_run["ema"].to_numpy(dtype=np.float32)[keep],
+            mode="lines",
+            name=run,
+            line=dict(color=color),
+            legendgroup=run
+        ))
+
+    fig.update_layout(
+        xaxis_title="Passos",
+        yaxis_title=title,
+        legend_title_text="Execução"
+    )
+
+    return fig
@@ -0,0 +1,37 @@
+import numpy as np
+
+from src.processing.flight_phases import (
+    DECOLAGEM, DECOLAGEM_ENTREGA, IDA, POUSO, POUSO_ENTREGA, VOLTA, phase_durations, segment_phases,
+)
+
+
+# Trajetoria de duas pernas (ida e volta) com amostras entre Y_POUSO e Y_DECOLAGEM na subida e na descida
+Y = [0, 0, 1, 4, 6, 10, 10, 10, 6, 4, 1, 0, 0, 0, 2, 4, 6, 10, 10, 6, 4, 1, 0]
+FASES = [
+    DECOLAGEM, DECOLAGEM, DECOLAGEM, DECOLAGEM,
+    IDA, IDA, IDA, IDA, IDA,
+    POUSO_ENTREGA, POUSO_ENTREGA, POUSO_ENTREGA, POUSO_ENTREGA, POUSO_ENTREGA, POUSO_ENTREGA,
+    DECOLAGEM_ENTREGA,
+    VOLTA, VOLTA, VOLTA, VOLTA,
+    POUSO, POUSO, POUSO,
+]
+
+
+def test_segment_phases_duas_pernas():
+    np.testing.assert_array_equal(segment_phases(Y), FASES)
+
+
+def test_segment_phases_varias_trajetorias():
+    # A segunda trajetoria sobe ate a faixa entre os limiares antes de decolar: continua no chao
+    y = Y + [0, 4, 0] + Y
+    phases = segment_phases(y, starts=[0, len(Y)])
+
+    np.testing.assert_array_equal(phases, FASES + [DECOLAGEM] * 3 + FASES)
+
+
+def test_phase_durations_duas_pernas():
+    time = np.arange(len(Y), dtype=np.float64)
+    durations = phase_durations(time, segment_phases(Y))
+
+    # Um segundo por amostra, exceto a ultima (sem intervalo seguinte)
+    np.testing.assert_array_equal(durations, [[4, 5, 6, 1, 4, 2]])
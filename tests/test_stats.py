@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+
+from src.utils.stats import group_stats
+
+
+VALUES = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+
+
+def _expected():
+    # Mesmo resultado do groupby, que descarta os grupos ausentes
+    grouped = pd.Series(VALUES).groupby(pd.Series([1, None, 1, 2, 2], dtype="Int32"))
+    return grouped.count(), grouped.mean(), grouped.std()
+
+
+def _assert_stats(stats):
+    n, media, desvio_padrao = _expected()
+    np.testing.assert_array_equal(stats["grupos"], [1, 2])
+    np.testing.assert_array_equal(stats["n"], n.to_numpy())
+    np.testing.assert_allclose(stats["media"], media.to_numpy())
+    np.testing.assert_allclose(stats["desvio_padrao"], desvio_padrao.to_numpy())
+
+
+def test_group_stats_descarta_grupos_na_inteiro_anulavel():
+    groups = pd.array([1, None, 1, 2, 2], dtype="Int32")
+    _assert_stats(group_stats(VALUES, groups=groups))
+
+
+def test_group_stats_descarta_grupos_na_objeto():
+    # Conversao de uma coluna Int32 com <NA> para NumPy em versoes do pandas que usam object
+    groups = np.array([1, pd.NA, 1, 2, 2], dtype=object)
+    stats = group_stats(VALUES, groups=groups)
+
+    _assert_stats(stats)
+    assert stats["grupos"].dtype.kind == 'i'